@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import shapely
+from scipy.spatial import cKDTree
+
+from boundary_store import STORE_DIR, available_tolerances, load_boundaries
+from hospital_cache import load_hospital_snapshot
+
+# 기준 병원정보서비스 스냅샷
+HOSPITAL_YEAR = '2025'
+HOSPITAL_MONTH = '3'
+
+# 종별로 따로 계산할 의료기관 (전체는 항상 포함)
+CATEGORIES = ['상급종합', '종합병원', '병원', '의원']
+ALL_CATEGORY = '전체'
+
+# k개 최근접 의료기관의 평균 거리에 쓸 k
+K_NEAREST = 3
+
+EARTH_RADIUS_KM = 6371.0088
+
+# 결과 파일 (상관분석 스크립트에서 읽음)
+SIGUNGU_FILE = '시군구별_의료기관_접근성.csv'
+SIDO_FILE = '시도별_의료기관_접근성.csv'
+
+
+# 경도·위도를 단위 구 위의 3차원 좌표로 변환 (KD-tree의 직선거리 순서 = 대원거리 순서)
+def _unit_vectors(lon, lat):
+    lon = np.radians(np.asarray(lon, dtype=float))
+    lat = np.radians(np.asarray(lat, dtype=float))
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+# 단위 구 위 직선거리 → 대원거리 (km)
+def _chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+# 의료기관 좌표 읽기 (좌표 없는 기관 제외), 좌표(X)=경도, 좌표(Y)=위도
+def load_hospitals(year=HOSPITAL_YEAR, month=HOSPITAL_MONTH):
+    df = load_hospital_snapshot(year, month, columns=['시도코드명', '시군구코드명', '종별코드명', '좌표(X)', '좌표(Y)'])
+    df = df.rename(columns={'좌표(X)': '경도', '좌표(Y)': '위도'})
+    return df[df['경도'].notna() & df['위도'].notna()].reset_index(drop=True)
+
+
+# 종별 KD-tree (ALL_CATEGORY는 전체 기관), 기관이 없는 종별은 제외
+def build_trees(hospitals, categories=CATEGORIES, category_column='종별코드명'):
+    vectors = _unit_vectors(hospitals['경도'], hospitals['위도'])
+    trees = {ALL_CATEGORY: cKDTree(vectors)}
+    for category in categories:
+        mask = (hospitals[category_column] == category).to_numpy()
+        if mask.any():
+            trees[category] = cKDTree(vectors[mask])
+    return trees
+
+
+# 인구 가중 수요 지점: 읍면동(없으면 시군구) 경계 안의 대표점
+# population: 시도, 시군구, 인구 컬럼 (없으면 모든 지점 가중치 1)
+# 시군구 인구를 그 안의 읍면동 지점에 똑같이 나눠서 가중치로 사용
+def demand_points(population=None, level=None, store_dir=STORE_DIR):
+    if level is None:
+        level = 'emd' if available_tolerances('emd', store_dir) else 'sigungu'
+    boundaries = load_boundaries(level, tolerance=0.0, store_dir=store_dir)
+    points = shapely.point_on_surface(boundaries['geometry'].to_numpy())
+
+    columns = {'sido': '시도', 'sigungu': '시군구', 'name': '읍면동'} if level == 'emd' else {'sido': '시도', 'name': '시군구'}
+    demand = boundaries[[col for col in columns if col in boundaries]].rename(columns=columns)
+    demand['경도'] = shapely.get_x(points)
+    demand['위도'] = shapely.get_y(points)
+    demand['가중치'] = 1.0
+
+    if population is not None:
+        key = ['시도', '시군구']
+        normalized = population.assign(시군구=population['시군구'].astype(str).str.replace(' ', ''))
+        totals = normalized.groupby(key)['인구'].sum()
+        lookup = demand[key].assign(시군구=demand['시군구'].astype(str).str.replace(' ', ''))
+        per_region = lookup.groupby(key, sort=False)['시군구'].transform('size')
+        region_population = lookup.merge(totals.reset_index(), on=key, how='left')['인구']
+        demand['가중치'] = region_population.to_numpy(dtype=float) / per_region.to_numpy()
+        missing = demand['가중치'].isna()
+        if missing.any():
+            print(f"인구가 없는 수요 지점 {missing.sum()}개는 제외합니다.")
+            demand = demand[~missing]
+    return demand.reset_index(drop=True)
+
+
+# 지점마다 종별 최근접 거리와 k개 최근접 평균 거리 (km)
+# 기관 수가 k보다 적은 종별은 있는 기관 전체의 평균이며 컬럼 이름도 실제 개수로 붙임
+def nearest_distances(demand, trees, k=K_NEAREST):
+    vectors = _unit_vectors(demand['경도'], demand['위도'])
+    result = demand.copy()
+    for category, tree in trees.items():
+        kk = min(k, tree.n)
+        chord, _ = tree.query(vectors, k=kk)
+        distances = _chord_to_km(np.asarray(chord).reshape(len(vectors), kk))
+        result[f'최근접거리_{category}'] = distances[:, 0]
+        result[f'{kk}개평균거리_{category}'] = distances.mean(axis=1)
+    return result
+
+
+# 지역별 인구 가중 평균 거리
+def regional_accessibility(distances, by):
+    value_columns = [col for col in distances.columns if '거리_' in col]
+    weights = distances['가중치'].to_numpy()[:, None]
+    weighted = pd.DataFrame(distances[value_columns].to_numpy() * weights, columns=value_columns, index=distances.index)
+    weighted['가중치'] = distances['가중치']
+    grouped = weighted.groupby([distances[col] for col in by], observed=True, sort=True).sum()
+    result = grouped[value_columns].div(grouped['가중치'], axis=0)
+    result['인구'] = grouped['가중치']
+    return result.reset_index()
+
+
+# 전국 시군구·시도별 의료기관 접근성 지표 계산
+def compute(hospitals=None, population=None, categories=CATEGORIES, k=K_NEAREST, store_dir=STORE_DIR):
+    hospitals = load_hospitals() if hospitals is None else hospitals
+    trees = build_trees(hospitals, categories)
+    distances = nearest_distances(demand_points(population, store_dir=store_dir), trees, k)
+    return regional_accessibility(distances, ['시도', '시군구']), regional_accessibility(distances, ['시도'])
+
+
+if __name__ == '__main__':
+    import time
+
+    import warehouse
+
+    started = time.monotonic()
+    # 시군구별 최신 연도 총인구를 가중치로 사용
+    population = warehouse.load_wide(['총인구'], index=('시도', '시군구', '연도'))
+    population = population[population['연도'] == population['연도'].max()]
+    population = population.rename(columns={'총인구': '인구'})[['시도', '시군구', '인구']]
+
+    sigungu, sido = compute(population=population)
+    sigungu.to_csv(SIGUNGU_FILE, index=False, encoding='utf-8-sig')
+    sido.to_csv(SIDO_FILE, index=False, encoding='utf-8-sig')
+    print(f"접근성 지표 저장: {SIGUNGU_FILE}, {SIDO_FILE} ({time.monotonic() - started:.1f}초)")
+    print(sido.round(2).to_string(index=False))
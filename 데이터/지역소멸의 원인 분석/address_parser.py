@@ -0,0 +1,86 @@
+import pandas as pd
+
+from region_names import canonicalize_regions
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# 주소 앞 네 어절을 한 번에 잘라내는 정규식 (없는 어절은 빈 문자열)
+ADDRESS_PATTERN = r'^\s*(?P<t0>\S+)(?:\s+(?P<t1>\S+))?(?:\s+(?P<t2>\S+))?(?:\s+(?P<t3>\S+))?'
+
+# 읍/면/동(및 '종로1가' 같은 가) 단위로 끝나는 어절
+EMD_PATTERN = r'[읍면동가]$'
+
+# 세종특별자치시는 시군구가 없으므로 시군구 자리에 넣을 값
+SEJONG_SIGUNGU = '세종특별자치시'
+
+
+def _parse_arrow(values, sejong_sigungu):
+    try:
+        arr = pa.array(values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        arr = pa.array(values.astype('string'), type=pa.string(), from_pandas=True)
+
+    parts = pc.extract_regex(arr, ADDRESS_PATTERN)
+    null = pa.scalar(None, pa.string())
+
+    def token(i):
+        part = pc.struct_field(parts, [i])
+        return pc.if_else(pc.equal(part, ''), null, part)
+
+    t0, t1, t2, t3 = token(0), token(1), token(2), token(3)
+
+    # '수원시 장안구'처럼 시 + 구 두 어절로 된 시군구
+    two_token = pc.and_kleene(pc.ends_with(t1, '시'), pc.ends_with(t2, '구'))
+    two_token = pc.fill_null(two_token, False)
+    sigungu = pc.if_else(two_token, pc.binary_join_element_wise(t1, t2, ' '), t1)
+    rest = pc.if_else(two_token, t3, t2)
+    emd = pc.if_else(pc.fill_null(pc.match_substring_regex(rest, EMD_PATTERN), False), rest, null)
+
+    # 세종특별자치시: 두 번째 어절이 바로 읍면동
+    sejong = pc.fill_null(pc.starts_with(t0, '세종'), False)
+    sejong_emd = pc.if_else(pc.fill_null(pc.match_substring_regex(t1, EMD_PATTERN), False), t1, null)
+    sigungu = pc.if_else(sejong, pa.scalar(sejong_sigungu, pa.string()), sigungu)
+    emd = pc.if_else(sejong, sejong_emd, emd)
+
+    return pd.DataFrame({
+        '시도': t0.to_pandas(types_mapper=pd.ArrowDtype),
+        '시군구': sigungu.to_pandas(types_mapper=pd.ArrowDtype),
+        '읍면동': emd.to_pandas(types_mapper=pd.ArrowDtype),
+    }).astype('string').set_axis(values.index)
+
+
+# pyarrow가 없을 때의 같은 처리 (pandas 문자열 메서드)
+def _parse_pandas(values, sejong_sigungu):
+    parts = values.astype('string').str.extract(ADDRESS_PATTERN)
+    parts = parts.mask(parts == '')
+    t0, t1, t2, t3 = parts['t0'], parts['t1'], parts['t2'], parts['t3']
+
+    two_token = (t1.str.endswith('시') & t2.str.endswith('구')).fillna(False).astype(bool)
+    sigungu = t1.where(~two_token, t1 + ' ' + t2)
+    rest = t2.where(~two_token, t3)
+    emd = rest.where(rest.str.contains(EMD_PATTERN).fillna(False).astype(bool))
+
+    sejong = t0.str.startswith('세종').fillna(False).astype(bool)
+    sejong_emd = t1.where(t1.str.contains(EMD_PATTERN).fillna(False).astype(bool))
+    sigungu = sigungu.mask(sejong, sejong_sigungu)
+    emd = emd.where(~sejong, sejong_emd)
+
+    return pd.DataFrame({'시도': t0, '시군구': sigungu, '읍면동': emd}, index=values.index).astype('string')
+
+
+# 주소 Series에서 시도, 시군구, 읍면동 컬럼을 한 번에 추출
+# canonical_sido=True이면 시도를 표준 시도명(범주형)으로 변환
+def parse_addresses(addresses, sejong_sigungu=SEJONG_SIGUNGU, canonical_sido=False):
+    addresses = pd.Series(addresses)
+    if pa is not None:
+        result = _parse_arrow(addresses, sejong_sigungu)
+    else:
+        result = _parse_pandas(addresses, sejong_sigungu)
+
+    if canonical_sido:
+        result['시도'] = canonicalize_regions(result['시도'])
+    return result
@@ -0,0 +1,242 @@
+import functools
+import re
+
+import numpy as np
+import pandas as pd
+
+from boundary_store import STORE_DIR, available_tolerances, load_boundaries
+from region_names import ALIAS_TO_REGION, STANDARD_REGIONS, canonicalize_regions
+
+# 행정표준코드 기준 행정구역 차원
+# 시군구는 5자리 코드(시도 2자리 + 시군구 3자리), 시도 단위 값은 시도코드 × 1000 (예: 서울특별시 11000)
+# 원본마다 다른 명칭은 한 번만 현행 코드로 바꾸고, 이후 병합은 정수 코드로 함
+
+# 현행 시군구 행정표준코드 (행정코드, 시도, 시군구 — 일반구는 '수원시 장안구' 형태)
+SIGUNGU_CODE_FILE = '행정표준코드_시군구.csv'
+
+# 시도 코드 이력: (코드, 명칭, 시작일, 종료일) — 종료일이 None이면 현행
+SIDO_HISTORY = [
+    (11, '서울특별시', None, None),
+    (26, '부산광역시', None, None),
+    (27, '대구광역시', None, None),
+    (28, '인천광역시', None, None),
+    (29, '광주광역시', None, None),
+    (30, '대전광역시', None, None),
+    (31, '울산광역시', None, None),
+    (36, '세종특별자치시', '2012-07-01', None),
+    (41, '경기도', None, None),
+    (42, '강원도', None, '2023-06-10'),
+    (51, '강원특별자치도', '2023-06-11', None),
+    (43, '충청북도', None, None),
+    (44, '충청남도', None, None),
+    (45, '전라북도', None, '2024-01-17'),
+    (52, '전북특별자치도', '2024-01-18', None),
+    (46, '전라남도', None, None),
+    (47, '경상북도', None, None),
+    (48, '경상남도', None, None),
+    (50, '제주특별자치도', None, None),
+]
+
+# 시도 코드가 바뀌면 소속 시군구 코드의 앞 두 자리도 같이 바뀜 (뒤 세 자리는 유지)
+SIDO_SUCCESSORS = {42: 51, 45: 52}
+
+# 시군구 명칭·코드·소속 변경 이력: (옛 코드, 옛 시도, 옛 명칭, 이후 코드, 변경일)
+# 통합·폐지된 시군구는 이어받은 시군구 코드로 연결
+SIGUNGU_HISTORY = [
+    (44830, '충청남도', '당진군', 44270, '2012-01-01'),
+    (41730, '경기도', '여주군', 41670, '2013-09-23'),
+    (43710, '충청북도', '청원군', 43110, '2014-07-01'),
+    (41195, '경기도', '부천시 원미구', 41190, '2016-07-04'),
+    (41197, '경기도', '부천시 소사구', 41190, '2016-07-04'),
+    (41199, '경기도', '부천시 오정구', 41190, '2016-07-04'),
+    (28170, '인천광역시', '남구', 28177, '2018-07-01'),
+    (47720, '경상북도', '군위군', 27720, '2023-07-01'),
+]
+
+# 시도 전체를 뜻하는 시군구 값
+TOTAL_NAMES = {'소계', '합계', '계', '전체', '시도계'}
+
+# 원본별 표기 예외: (시도 코드, 공백을 뺀 시군구 값) → 코드
+SIGUNGU_ALIASES = {
+    (36, '세종시'): 36110,
+    (36, '세종특별자치시'): 36110,
+    # 5대 범죄 통계는 제주특별자치도 제주시를 '시'로 표기
+    (50, '시'): 50110,
+}
+
+# 연도를 모를 때 쓰는 기간
+MIN_YEAR, MAX_YEAR = 0, 9999
+
+CURRENT_SIDO_CODES = {name: code for code, name, _, end in SIDO_HISTORY if end is None}
+_STANDARD_CODES = np.array([CURRENT_SIDO_CODES[name] for name in STANDARD_REGIONS] + [-1], dtype=np.int32)
+# 시도 별칭(공백 제거) → 현행 시도 코드
+_ALIAS_CODES = {alias: CURRENT_SIDO_CODES[region] for alias, region in ALIAS_TO_REGION.items()}
+
+# '수원시장안구' → ('수원시', '장안구')
+_DISTRICT_PATTERN = re.compile(r'^(\S+?시)(\S+구)$')
+
+
+def _year(date, default):
+    return int(date[:4]) if date else default
+
+
+def _compact(values):
+    return pd.Series(values, dtype='string').str.replace(r'\s+', '', regex=True)
+
+
+# 스칼라 또는 Series 연도를 길이 n의 정수 배열로 (모르면 -1)
+def _years(year, n):
+    if year is None or np.ndim(year) == 0:
+        return np.full(n, -1 if year is None else int(year), dtype=np.int64)
+    return pd.to_numeric(pd.Series(year), errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+
+
+# 시도 명칭(옛 명칭·약칭 포함)을 현행 시도 코드로 변환 (매칭 실패는 -1)
+def sido_codes(values):
+    regions = canonicalize_regions(pd.Series(values).reset_index(drop=True))
+    return _STANDARD_CODES[regions.cat.codes.to_numpy()]
+
+
+# 이름 조회표: (시도 코드, 공백을 뺀 명칭) → (현행 코드, 유효 시작 연도, 유효 종료 연도)
+# 현행 시군구는 행정표준코드 표(SIGUNGU_CODE_FILE), 옛 명칭은 SIGUNGU_HISTORY로 만듦
+# 시군구 경계(boundary_store)가 있으면 표에 없는 경계 명칭도 추가 (행정표준코드 경계일 때만)
+# 일반구('수원시장안구')는 상위 시('수원시')와 시도 안에서 겹치지 않는 구 이름('장안구')으로도 찾음
+@functools.lru_cache(maxsize=None)
+def dimension(store_dir=STORE_DIR):
+    table = pd.read_csv(SIGUNGU_CODE_FILE, encoding='utf-8-sig', dtype={'행정코드': 'int64'})
+    rows = [
+        (int(code) // 1000, name, int(code), MIN_YEAR, MAX_YEAR)
+        for code, name in zip(table['행정코드'], _compact(table['시군구']))
+    ]
+    if available_tolerances('sigungu', store_dir):
+        boundaries = load_boundaries('sigungu', tolerance=0.0, store_dir=store_dir)
+        codes = pd.to_numeric(boundaries['code'].astype('string'), errors='coerce').to_numpy(dtype=float)
+        # 경계 원본이 변경 이전 기준이어도 현행 시도 코드로 맞춤
+        prefix = pd.Series(codes // 1000).replace(SIDO_SUCCESSORS).to_numpy()
+        if 'sido' in boundaries:
+            named = sido_codes(boundaries['sido'])
+            prefix = np.where(named > 0, named, prefix)
+        current = prefix * 1000 + codes % 1000
+        # 통계청 경계 코드(경기도 31xxx 등)처럼 시도 코드와 앞자리가 다른 코드는 행정표준코드가 아니므로 제외
+        standard = pd.Series(codes // 1000).replace(SIDO_SUCCESSORS).to_numpy() == prefix
+        known = {(sido, name) for sido, name, _, _, _ in rows}
+        known |= {(_ALIAS_CODES[old_sido], old_name.replace(' ', '')) for _, old_sido, old_name, _, _ in SIGUNGU_HISTORY}
+        for sido, code, name, valid in zip(prefix, current, _compact(boundaries['name']), standard):
+            if valid and pd.notna(code) and pd.notna(name) and (int(sido), name) not in known:
+                rows.append((int(sido), name, int(code), MIN_YEAR, MAX_YEAR))
+
+    successors = {old: new for old, _, _, new, _ in SIGUNGU_HISTORY}
+    for old_code, old_sido, old_name, new_code, date in SIGUNGU_HISTORY:
+        # 여러 번 바뀐 경우 마지막 코드까지 따라감
+        while new_code in successors:
+            new_code = successors[new_code]
+        rows.append((_ALIAS_CODES[old_sido], old_name.replace(' ', ''), new_code, MIN_YEAR, _year(date, MAX_YEAR) - 1))
+
+    names = pd.DataFrame(rows, columns=['시도코드', '명칭', '코드', '시작', '종료'])
+    # 일반구는 상위 시 이름과 구 이름으로도 등록
+    parts = names['명칭'].str.extract(_DISTRICT_PATTERN)
+    districts = parts[0].notna()
+    parents = names[districts].assign(명칭=parts.loc[districts, 0], 코드=names.loc[districts, '코드'] // 10 * 10)
+    bare = names[districts].assign(명칭=parts.loc[districts, 1])
+    # 구 이름만으로는 같은 시도 안에서 하나로 정해지는 경우만 사용
+    bare = bare[bare.groupby(['시도코드', '명칭'])['코드'].transform('nunique') == 1]
+    names = pd.concat([names, parents, bare], ignore_index=True)
+    return names.drop_duplicates(ignore_index=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup(store_dir):
+    names = dimension(store_dir)
+    by_sido = {}
+    for sido, name, code, start, end in names.itertuples(index=False):
+        by_sido.setdefault((sido, name), []).append((start, end, code))
+    # 시도를 모를 때는 전국에서 하나로 정해지는 이름만 사용
+    nationwide = names.groupby('명칭')['코드'].agg(lambda codes: codes.iloc[0] if codes.nunique() == 1 else -1)
+    return by_sido, nationwide[nationwide > 0].to_dict()
+
+
+def _resolve_one(sido, name, year, by_sido, nationwide):
+    if name is None or name in TOTAL_NAMES:
+        return sido * 1000 if sido > 0 else -1
+    if (sido, name) in SIGUNGU_ALIASES:
+        return SIGUNGU_ALIASES[(sido, name)]
+    # 시군구 자리에 시도 이름이 온 합계 행
+    if sido > 0 and _ALIAS_CODES.get(name) == sido:
+        return sido * 1000
+    candidates = by_sido.get((sido, name)) if sido > 0 else None
+    if not candidates:
+        return nationwide.get(name, -1)
+    if year >= 0:
+        for start, end, code in candidates:
+            if start <= year <= end:
+                return code
+    # 연도를 모르거나 해당 연도 명칭이 아니면 가장 최근까지 쓰인 명칭 기준
+    return max(candidates, key=lambda candidate: candidate[1])[2]
+
+
+# (시도, 시군구, 연도)를 현행 행정코드로 변환 (Int32, 찾지 못하면 결측)
+# 연도가 바뀌어도 같은 지역은 같은 코드: 강원도 춘천시(2015)와 강원특별자치도 춘천시(2024)는 모두 51110
+# 시군구가 없거나 '소계' 등이면 시도 단위 코드, 시도가 없으면 전국에서 하나로 정해지는 시군구 이름만 변환
+# 고유한 (시도, 시군구, 연도) 조합마다 한 번만 조회하므로 행 수와 무관하게 빠름
+def resolve(sido, sigungu=None, year=None, store_dir=STORE_DIR):
+    n = len(sido) if sido is not None else len(sigungu)
+    # 열마다 고유값으로 나눈 뒤 세 코드를 정수 하나로 합쳐서 조합을 구함 (문자열 처리는 고유값에만)
+    sido_idx, sido_values = pd.factorize(pd.Series(sido)) if sido is not None else (np.zeros(n, np.intp), [None])
+    name_idx, name_values = pd.factorize(pd.Series(sigungu)) if sigungu is not None else (np.zeros(n, np.intp), [None])
+    year_values, year_idx = np.unique(_years(year, n), return_inverse=True)
+    sido_values = sido_codes(sido_values) if sido is not None else np.full(1, -1)
+    name_values = list(_compact(name_values).fillna('')) if sigungu is not None else ['']
+
+    n_names, n_years = len(name_values) + 1, len(year_values)
+    combined = ((sido_idx.astype(np.int64) + 1) * n_names + name_idx + 1) * n_years + year_idx
+    codes, uniques = pd.factorize(combined)
+    # 시도만 변환할 때는 시군구 조회표가 필요 없음
+    by_sido, nationwide = _lookup(store_dir) if sigungu is not None else ({}, {})
+    resolved = np.empty(len(uniques), dtype=np.int64)
+    for position, key in enumerate(uniques):
+        rest, y = divmod(int(key), n_years)
+        s, g = divmod(rest, n_names)
+        sido_code = int(sido_values[s - 1]) if s > 0 else -1
+        name = name_values[g - 1] if g > 0 else ''
+        resolved[position] = _resolve_one(sido_code, name or None, int(year_values[y]), by_sido, nationwide)
+    result = pd.array(resolved[codes], dtype='Int32')
+    result[result <= 0] = pd.NA
+    return result
+
+
+# 행정코드의 시도 명칭 (year를 주면 그 시점 명칭: 51 → 2020년 '강원도')
+def sido_names(codes, year=None):
+    sido = (pd.Series(codes, dtype='Int32').reset_index(drop=True) // 1000).fillna(-1).to_numpy()
+    history = {code: (name, start) for code, name, start, _ in SIDO_HISTORY}
+    result = pd.Series([history[code][0] if code in history else pd.NA for code in sido], dtype='string')
+    if year is not None:
+        # 변경 연도부터 새 명칭
+        years = _years(year, len(sido))
+        for old, new in SIDO_SUCCESSORS.items():
+            result[(sido == new) & (years >= 0) & (years < _year(history[new][1], MAX_YEAR))] = history[old][0]
+    return result
+
+
+# 행정코드의 현행 시군구 명칭 (시도 단위 코드는 결측)
+def sigungu_names(codes, store_dir=STORE_DIR):
+    names = dimension(store_dir)
+    current = names[names['종료'] == MAX_YEAR].drop_duplicates('코드').set_index('코드')['명칭']
+    return pd.Series(codes, dtype='Int32').reset_index(drop=True).map(current).astype('string')
+
+
+# DataFrame에 행정코드 컬럼 추가 (병합 키로 사용)
+def add_region_code(df, sido='시도', sigungu=None, year=None, column='행정코드', store_dir=STORE_DIR):
+    df = df.copy()
+    df[column] = resolve(
+        df[sido] if sido else None,
+        df[sigungu] if sigungu else None,
+        df[year] if year else None,
+        store_dir,
+    )
+    return df
+
+
+# 행정코드로 바꾸지 못한 (시도, 시군구) 값과 건수
+def unmatched(df, sido='시도', sigungu=None, column='행정코드'):
+    keys = [col for col in [sido, sigungu] if col]
+    return df.loc[df[column].isna(), keys].value_counts(dropna=False)
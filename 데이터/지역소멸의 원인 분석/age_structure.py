@@ -0,0 +1,100 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+# 단일 연령 컬럼('0세' ~ '99세', '100세 이상')을 연령대로 묶는 공통 모듈
+# 연령 → 연령대 소속 희소 행렬을 한 번 만들어 두고, 지역·기간 × 연령 배열에 행렬곱 한 번으로 모든 연령대를 계산
+
+# '37세', '100세 이상', '100세이상' 형태의 컬럼 헤더
+AGE_PATTERN = re.compile(r'^\s*(\d{1,3})\s*세\s*(이상)?\s*$')
+
+# 연령대 구분: (이름, 하한, 상한) — 상한은 포함하지 않으며 None이면 이상 구간
+SCHEMES = {
+    '10세단위': [('유아', 0, 10), ('10대', 10, 20), ('20대', 20, 30), ('30대', 30, 40), ('40대', 40, 50),
+               ('50대', 50, 60), ('60대', 60, 70), ('70대', 70, 80), ('80세 이상', 80, None)],
+    '5세단위': [(f'{low}~{low + 4}세', low, low + 5) for low in range(0, 85, 5)] + [('85세 이상', 85, None)],
+    '생애주기': [('유소년인구', 0, 15), ('생산가능인구', 15, 65), ('65세이상', 65, None)],
+    '청년': [('청년인구', 20, 40)],
+    '전체': [('총인구', 0, None)],
+}
+
+# 인구 구조 지표 계산에 쓰는 연령대 구분
+INDICATOR_SCHEMES = ('전체', '생애주기', '청년')
+
+
+# 컬럼 헤더 중 단일 연령 컬럼과 그 연령 (이상 구간은 하한 연령)
+def age_columns(columns):
+    selected, ages = [], []
+    for col in columns:
+        match = AGE_PATTERN.match(str(col))
+        if match:
+            selected.append(col)
+            ages.append(int(match.group(1)))
+    return selected, tuple(ages)
+
+
+# 연령대 목록 (구분 이름 또는 (이름, 하한, 상한) 목록, 여러 구분은 이어 붙임)
+def resolve_bands(schemes):
+    if isinstance(schemes, str):
+        schemes = [schemes]
+    bands = []
+    for scheme in schemes:
+        bands.extend(SCHEMES[scheme] if isinstance(scheme, str) else [tuple(scheme)])
+    return tuple(bands)
+
+
+# (연령 × 연령대) 소속 희소 행렬 — 같은 연령·연령대 조합이면 캐시된 행렬 재사용
+# 이상 구간 컬럼(100세 이상)은 하한 연령으로 취급
+@lru_cache(maxsize=None)
+def membership(ages, bands):
+    ages = np.asarray(ages)
+    rows, cols = [], []
+    for j, (_, low, high) in enumerate(bands):
+        inside = ages >= low
+        if high is not None:
+            inside &= ages < high
+        index = np.flatnonzero(inside)
+        rows.append(index)
+        cols.append(np.full(len(index), j))
+    rows = np.concatenate(rows) if rows else np.array([], dtype=int)
+    cols = np.concatenate(cols) if cols else np.array([], dtype=int)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(ages), len(bands)))
+
+
+# 지역·기간별 단일 연령 인구 배열
+# by: 묶을 키 컬럼 (같은 키의 행은 합산), 결과: (키 Index, 연령 튜플, (키 × 연령) 배열)
+def age_array(df, by):
+    by = [by] if isinstance(by, str) else list(by)
+    columns, ages = age_columns(df.columns)
+    if not columns:
+        raise ValueError('단일 연령 컬럼(예: 0세, 100세 이상)이 없습니다.')
+    values = df[columns].apply(pd.to_numeric, errors='coerce').fillna(0)
+    totals = values.groupby([df[col] for col in by], sort=True).sum()
+    return totals.index, ages, totals.to_numpy(dtype=float)
+
+
+# 연령대별 인구: (키 × 연령) 배열 @ (연령 × 연령대) 소속 행렬
+def bands(index, ages, values, schemes='10세단위'):
+    band_list = resolve_bands(schemes)
+    result = np.asarray(values @ membership(ages, band_list))
+    return pd.DataFrame(result, index=index, columns=[name for name, _, _ in band_list])
+
+
+# 인구 구조 지표: 연령대 인구와 비율(%)·부양비를 같은 배열의 행렬곱 한 번으로 계산
+def indicators(index, ages, values):
+    counts = bands(index, ages, values, INDICATOR_SCHEMES)
+    total = counts['총인구'].where(counts['총인구'] > 0)
+    working = counts['생산가능인구'].where(counts['생산가능인구'] > 0)
+    result = counts.copy()
+    result['고령화비율'] = counts['65세이상'] / total * 100
+    result['유소년비율'] = counts['유소년인구'] / total * 100
+    result['생산가능인구비율'] = counts['생산가능인구'] / total * 100
+    result['청년비율'] = counts['청년인구'] / total * 100
+    result['노년부양비'] = counts['65세이상'] / working * 100
+    result['유소년부양비'] = counts['유소년인구'] / working * 100
+    result['총부양비'] = result['노년부양비'] + result['유소년부양비']
+    result['노령화지수'] = counts['65세이상'] / counts['유소년인구'].where(counts['유소년인구'] > 0) * 100
+    return result
@@ -1,11 +1,12 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from correlation_engine import correlate, correlation_dict
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
@@ -52,12 +53,12 @@ merged_data = pd.merge(empty_houses, aging_summary, on=['연도', '구분'])
 # 상관관계 분석 그래프
 plt.figure(figsize=(15, 6))
 regions = ['수도권', '비수도권']
-correlations = {}
+results = correlate(merged_data, ['고령화비율', '빈집수(호)'], groupings=['구분'])
+correlations = correlation_dict(results, groups=regions)
 
 for i, region in enumerate(regions):
     region_data = merged_data[merged_data['구분'] == region]
-    correlation = stats.pearsonr(region_data['고령화비율'], region_data['빈집수(호)'])
-    correlations[region] = correlation
+    correlation = correlations[region]
     
     plt.subplot(1, 2, i+1)
     sns.regplot(data=region_data, x='고령화비율', y='빈집수(호)')
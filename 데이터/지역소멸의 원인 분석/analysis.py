@@ -1,14 +1,13 @@
-import pandas as pd
+import csv_loader
 import matplotlib.pyplot as plt
-from matplotlib import font_manager, rc
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
-# 데이터 읽기 (인코딩 옵션 수정)
-empty_houses = pd.read_csv('건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv', encoding='latin1')
-population = pd.read_csv('인구밀도_연령대별_수도권_비수도권_집중도 복사본.csv', encoding='latin1')
+# 데이터 읽기 (인코딩은 자동 판별)
+empty_houses = csv_loader.read_csv('건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv')
+population = csv_loader.read_csv('인구밀도_연령대별_수도권_비수도권_집중도 복사본.csv')
 
 # 수도권/비수도권 구분
 capital_area = ['서울특별시', '인천광역시', '경기도']
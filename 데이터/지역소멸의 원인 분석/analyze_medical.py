@@ -1,38 +1,24 @@
 import pandas as pd
 import warnings
+from hospital_cache import load_hospital_snapshot
+from address_parser import parse_addresses
 warnings.filterwarnings('ignore')
 
-# 시도와 시군구코드 추출 함수
-def extract_sido_sigungu(address):
-    try:
-        parts = str(address).split()
-        if len(parts) >= 2:
-            sido = parts[0]
-            # 세종시인 경우 시군구를 '전체'로 설정
-            if sido == '세종특별자치시':
-                return sido, '전체'
-            sigungu = parts[1]
-            return sido, sigungu
-    except:
-        pass
-    return pd.NA, pd.NA
-
 def analyze_medical_facilities():
-    # 파일 경로
-    file_path = '병원/전국 병의원 및 약국 현황/병원정보서비스 2024.12.xlsx'
-    
     try:
         print(f"\n📊 데이터 분석 시작...")
         
-        # 엑셀 파일 읽기
-        df = pd.read_excel(file_path)
+        # 병원정보서비스 2024.12 스냅샷 읽기 (엑셀은 최초 1회만 파싱)
+        df = load_hospital_snapshot('2024', '12', columns=['종별코드명', '주소'])
         
-        # 주소에서 시도와 시군구코드 추출
-        df[['시도', '시군구코드']] = df['주소'].apply(extract_sido_sigungu).apply(pd.Series)
+        # 주소에서 시도와 시군구코드 추출 (세종시는 시군구를 '전체'로 설정)
+        parsed = parse_addresses(df['주소'], sejong_sigungu='전체')
+        df['시도'] = parsed['시도']
+        df['시군구코드'] = parsed['시군구']
         
         # 수도권과 비수도권 구분
         capital_area = ['서울특별시', '경기도', '인천광역시']
-        df['지역구분'] = df['시도'].apply(lambda x: '수도권' if x in capital_area else '비수도권')
+        df['지역구분'] = df['시도'].isin(capital_area).map({True: '수도권', False: '비수도권'})
         
         # 의료기관 유형별 필터링
         medical_types = {
@@ -60,14 +46,14 @@ def analyze_medical_facilities():
                 type_df = area_df[mask]
                 
                 # 시도별 집계
-                sido_count = type_df.groupby('시도').size().reset_index(name='개수')
+                sido_count = type_df.groupby('시도', observed=True).size().reset_index(name='개수')
                 sido_count['종별코드명'] = type_name
                 sido_count['시군구'] = '전체'  # 시도별 집계는 시군구를 '전체'로 표시
                 sido_count['지역구분'] = area
                 results.append(sido_count)
                 
                 # 시군구코드별 집계 (세종시 제외)
-                sigungu_count = type_df[type_df['시도'] != '세종특별자치시'].groupby(['시도', '시군구코드']).size().reset_index(name='개수')
+                sigungu_count = type_df[type_df['시도'] != '세종특별자치시'].groupby(['시도', '시군구코드'], observed=True).size().reset_index(name='개수')
                 sigungu_count['종별코드명'] = type_name
                 sigungu_count = sigungu_count.rename(columns={'시군구코드': '시군구'})
                 sigungu_count['지역구분'] = area
@@ -1,89 +1,42 @@
-import pandas as pd
+import csv_loader
+import kosis_parser
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 from matplotlib.ticker import ScalarFormatter
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 현재 디렉토리 확인
 current_dir = os.getcwd()
 print(f"현재 디렉토리: {current_dir}")
 
-# 파일 내용 직접 확인
-print("\n=== 빈집 데이터 파일 내용 ===")
+# 파일 인코딩 확인 (앞부분 표본으로 한 번만 판별하고 결과는 캐시에 저장)
 vacancy_file = '건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv'
-
-# 여러 인코딩 시도
-encodings = ['utf-8', 'cp949', 'euc-kr', 'utf-8-sig']
-for encoding in encodings:
-    try:
-        print(f"\n{encoding} 인코딩으로 시도:")
-        with open(vacancy_file, 'r', encoding=encoding) as f:
-            for i, line in enumerate(f):
-                if i < 5:  # 처음 5줄만 출력
-                    print(f"Line {i+1}: {line.strip()}")
-                else:
-                    break
-        print("성공!")
-        break
-    except Exception as e:
-        print(f"실패: {e}")
-
-print("\n=== 고령화 데이터 파일 내용 ===")
-aging_file = '(완료)연도별_권역별_고령화비율_v4_정리본.csv'
-
-# 여러 인코딩 시도
-for encoding in encodings:
-    try:
-        print(f"\n{encoding} 인코딩으로 시도:")
-        with open(aging_file, 'r', encoding=encoding) as f:
-            for i, line in enumerate(f):
-                if i < 5:  # 처음 5줄만 출력
-                    print(f"Line {i+1}: {line.strip()}")
-                else:
-                    break
-        print("성공!")
-        break
-    except Exception as e:
-        print(f"실패: {e}")
+aging_file = '인구밀도/(완료)연도별_권역별_고령화비율_v4_정리본.csv'
+for file_name in [vacancy_file, aging_file]:
+    print(f"{file_name}: {csv_loader.detect_encoding(file_name)} 인코딩")
 
 # 데이터 읽기
-aging_df = pd.read_csv('(완료)연도별_권역별_고령화비율_v4_정리본.csv', encoding='utf-8-sig')
-vacancy_df = pd.read_csv('건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv', 
-                        encoding='cp949', 
-                        engine='python',
-                        header=1)
+aging_df = csv_loader.read_csv(aging_file)
+# 빈집 데이터: KOSIS 넓은 표(1행 시점, 2행 항목명)에서 '주택_계' 컬럼만 긴 형태로 읽기
+vacancy_long = kosis_parser.read_long(vacancy_file, kosis_parser.VACANT_HOUSES_BY_TYPE_SPEC, metrics=['주택_계'])
 
 print("\n빈집 데이터 구조:")
-print(vacancy_df.head())
-print("\n빈집 데이터 컬럼:")
-print(vacancy_df.columns)
+print(vacancy_long.head())
+print("\n빈집 데이터 연도:")
+print(sorted(vacancy_long['연도'].unique()))
 
 # 수도권 지역 리스트
 capital_areas = ['서울특별시', '인천광역시', '경기도']
 
-# 비수도권 데이터만 필터링 (wide format)
-vacancy_df_non_capital = vacancy_df[~vacancy_df['행정구역별(시군구)(1)'].isin(capital_areas)]
-
-# melt로 연도별로 변환 (컬럼명이 '주택_계', '주택_계.1', ... 형태)
-value_vars = ['주택_계', '주택_계.1', '주택_계.2', '주택_계.3', '주택_계.4', '주택_계.5', '주택_계.6', '주택_계.7', '주택_계.8']
-year_labels = [str(y) for y in range(2015, 2024)]
-vacancy_long = vacancy_df_non_capital.melt(
-    id_vars=['행정구역별(시군구)(1)', '주택의 종류별(1)'],
-    value_vars=value_vars,
-    var_name='연도', value_name='빈집수'
-)
-vacancy_long['연도'] = vacancy_long['연도'].map(dict(zip(value_vars, year_labels)))
-# 숫자형 변환
-vacancy_long['빈집수'] = pd.to_numeric(vacancy_long['빈집수'], errors='coerce')
+# 비수도권 데이터만 필터링
+vacancy_long = vacancy_long[~vacancy_long['시도'].isin(capital_areas)]
 
 # 연도별 빈집수 합계
-vacancy_by_year = vacancy_long.groupby('연도')['빈집수'].sum().reset_index()
-# 연도 컬럼을 정수형으로 변환
-vacancy_by_year['연도'] = vacancy_by_year['연도'].astype(int)
+vacancy_by_year = vacancy_long.groupby('연도')['value'].sum().astype('int64').reset_index(name='빈집수')
 
 # 고령화 데이터도 비수도권만 필터
 aging_df_non_capital = aging_df[~aging_df['시도'].isin(capital_areas)]
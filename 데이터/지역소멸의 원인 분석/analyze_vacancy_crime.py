@@ -3,10 +3,11 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import numpy as np
+from plot_style import apply_style
+from label_placement import place_labels
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 읽기
 df = pd.read_csv('★ 빈집과 범죄율 비교_2023.csv')
@@ -46,13 +47,6 @@ sns.regplot(data=df[df['지역구분'] == '농촌'],
             x='빈집비율(%)', y='범죄율(건/천명)', 
             scatter=False, color='red', label='농촌')
 
-# 각 점에 시도와 행정구역 표시
-for idx, row in df.iterrows():
-    plt.annotate(f"{row['시도']} {row['행정구역']}", 
-                (row['빈집비율(%)'], row['범죄율(건/천명)']),
-                xytext=(5, 5), textcoords='offset points',
-                fontsize=8, alpha=0.7)
-
 # 그래프 제목과 레이블 설정
 plt.title('도시/농촌별 빈집률과 범죄율의 상관관계 분석', pad=20, fontsize=14)
 plt.xlabel('빈집률 (%)', fontsize=12)
@@ -64,8 +58,13 @@ plt.text(0.05, 0.95, textstr, transform=plt.gca().transAxes,
          bbox=dict(facecolor='white', alpha=0.8),
          verticalalignment='top', fontsize=12)
 
-# 그래프 저장
 plt.tight_layout()
+
+# 시도와 행정구역 표시: 회귀선에서 멀리 떨어진 지역부터 겹치지 않는 라벨만 표시
+place_labels(plt.gca(), df['빈집비율(%)'], df['범죄율(건/천명)'], df['시도'] + ' ' + df['행정구역'],
+             fontsize=8, alpha=0.7)
+
+# 그래프 저장
 plt.savefig('도시농촌_빈집률_범죄율_상관관계.png', dpi=300, bbox_inches='tight')
 plt.close()
 
@@ -0,0 +1,267 @@
+import functools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+
+from region_names import canonicalize_regions
+
+# 행정경계 저장소: 시도·시군구(·읍면동) 경계를 허용오차별 Parquet 파일로 저장해 두고 오프라인으로 읽음
+# 만드는 방법
+#   python boundary_store.py                      → 저장소가 없으면 SOURCE_URLS 원본을 내려받아 생성 (인터넷 필요, 최초 1회)
+#   python boundary_store.py --sido 시도.json --sigungu 시군구.json [--emd 읍면동.json]
+#                                                 → 가지고 있는 GeoJSON으로 생성 (현행 경계로 바꿀 때)
+# load_boundaries는 저장소가 없으면 처음 한 번 자동으로 내려받아 만듦 (pipeline.py의 boundary_store 단계도 같음)
+
+# 변환된 경계 파일 저장 위치
+STORE_DIR = '행정경계'
+
+# 저장소가 없을 때 내려받을 원본 GeoJSON (통계청 2013년 경계, southkorea-maps)
+SOURCE_URLS = {
+    'sido': 'https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2013/json/skorea-provinces-2013-geo.json',
+    'sigungu': 'https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2013/json/skorea-municipalities-2013-geo.json',
+}
+# 내려받은 원본 보관 위치 (다시 만들 때 재사용)
+SOURCE_DIR = os.path.join('.cache', 'boundary_sources')
+
+# 행정구역 단계
+LEVELS = ('sido', 'sigungu', 'emd')
+
+# 미리 계산해 둘 단순화 허용오차 (도 단위, 0은 원본 해상도)
+# 0.0005도 ≈ 50m, 0.002도 ≈ 200m, 0.01도 ≈ 1km
+TOLERANCES = (0.0, 0.0005, 0.002, 0.01)
+
+# 좌표 격자 (도 단위, 약 1m) — 저장 용량을 줄이기 위해 좌표를 이 단위로 반올림
+GRID_SIZE = 1e-5
+
+# 대한민국 전체 지도의 경도 범위 (해상도 선택 기준)
+KOREA_EXTENT_DEG = 7.5
+
+# 시도 소속이 바뀐 시군구 (원본 경계가 변경 이전 기준인 경우 보정)
+SIGUNGU_SIDO_OVERRIDES = {
+    ('경상북도', '군위군'): '대구광역시',
+}
+
+# GeoJSON 원본에서 이름/코드를 찾을 속성 키 후보
+NAME_KEYS = ('name', 'SIG_KOR_NM', 'CTP_KOR_NM', 'EMD_KOR_NM', 'adm_nm')
+CODE_KEYS = ('code', 'SIG_CD', 'CTPRVN_CD', 'EMD_CD', 'adm_cd')
+
+
+def _store_path(level, tolerance, store_dir=STORE_DIR):
+    return os.path.join(store_dir, f'{level}@{tolerance:g}.parquet')
+
+
+def _first_property(properties, keys):
+    for key in keys:
+        if properties.get(key) not in (None, ''):
+            return str(properties[key])
+    return None
+
+
+def _read_geojson(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        collection = json.load(f)
+    features = collection['features']
+    geometries = shapely.from_geojson([json.dumps(feature['geometry']) for feature in features])
+    return pd.DataFrame({
+        'code': [_first_property(feature['properties'], CODE_KEYS) for feature in features],
+        'name': [_first_property(feature['properties'], NAME_KEYS) for feature in features],
+        'geometry': geometries,
+    })
+
+
+# 하위 단계 경계에 상위 시도/시군구 이름 부여 (대표점이 포함된 상위 경계 기준)
+# 결과: (children, 하위 경계마다 상위 경계 위치 배열 — 포함된 상위 경계가 없으면 -1)
+def _assign_parent(children, parents, column):
+    tree = shapely.STRtree(parents['geometry'].to_numpy())
+    points = shapely.point_on_surface(children['geometry'].to_numpy())
+    child_idx, parent_idx = tree.query(points, predicate='within')
+    positions = np.full(len(children), -1, dtype=np.int64)
+    positions[child_idx] = parent_idx
+    children[column] = _take_parent(parents['name'], positions)
+    return children, positions
+
+
+# 상위 경계 위치 배열로 상위 경계의 속성 값 가져오기 (위치 -1은 None)
+def _take_parent(values, positions):
+    values = np.asarray(values, dtype=object)
+    result = np.full(len(positions), None, dtype=object)
+    found = positions >= 0
+    result[found] = values[positions[found]]
+    return result
+
+
+# 원본 GeoJSON을 단계별·허용오차별 Parquet(WKB) 파일로 변환
+# sources: {'sido': 'skorea-provinces-geo.json', 'sigungu': '...', 'emd': '...'}
+def build_store(sources, store_dir=STORE_DIR, tolerances=TOLERANCES):
+    os.makedirs(store_dir, exist_ok=True)
+    frames = {}
+
+    if 'sido' in sources:
+        sido = _read_geojson(sources['sido'])
+        # 옛 명칭(강원도, 전라북도 등)을 현재 명칭으로 변환
+        canonical = canonicalize_regions(sido['name']).astype(object)
+        sido['name'] = canonical.where(canonical.notna(), sido['name'])
+        frames['sido'] = sido
+
+    if 'sigungu' in sources:
+        sigungu = _read_geojson(sources['sigungu'])
+        if 'sido' in frames:
+            sigungu, _ = _assign_parent(sigungu, frames['sido'], 'sido')
+            for (old_sido, name), new_sido in SIGUNGU_SIDO_OVERRIDES.items():
+                sigungu.loc[(sigungu['sido'] == old_sido) & (sigungu['name'] == name), 'sido'] = new_sido
+        frames['sigungu'] = sigungu
+
+    if 'emd' in sources:
+        emd = _read_geojson(sources['emd'])
+        if 'sigungu' in frames:
+            # 시도·시군구 코드는 이름이 아니라 포함된 시군구 경계 위치로 가져옴 (중구·동구·고성군 등 같은 이름이 여러 시도에 있음)
+            emd, positions = _assign_parent(emd, frames['sigungu'], 'sigungu')
+            emd['sigungu_code'] = _take_parent(frames['sigungu']['code'], positions)
+            if 'sido' in frames['sigungu']:
+                emd['sido'] = _take_parent(frames['sigungu']['sido'], positions)
+        frames['emd'] = emd
+
+    written = []
+    for level, frame in frames.items():
+        geometries = shapely.make_valid(frame['geometry'].to_numpy())
+        for tolerance in tolerances:
+            simplified = geometries
+            if tolerance > 0:
+                simplified = shapely.simplify(geometries, tolerance, preserve_topology=True)
+            simplified = shapely.set_precision(simplified, GRID_SIZE)
+            bounds = shapely.bounds(simplified)
+
+            # 이름/코드는 사전 인코딩해서 저장
+            columns = {
+                name: pa.array(frame[name], pa.string(), from_pandas=True).dictionary_encode()
+                for name in ['code', 'name', 'sido', 'sigungu', 'sigungu_code'] if name in frame
+            }
+            columns.update({
+                'minx': bounds[:, 0], 'miny': bounds[:, 1], 'maxx': bounds[:, 2], 'maxy': bounds[:, 3],
+                'geometry': pa.array(shapely.to_wkb(simplified), pa.binary()),
+            })
+            path = _store_path(level, tolerance, store_dir)
+            pq.write_table(pa.table(columns), path, compression='zstd')
+            written.append(path)
+    return written
+
+
+def available_tolerances(level, store_dir=STORE_DIR):
+    prefix = f'{level}@'
+    if not os.path.isdir(store_dir):
+        return []
+    return sorted(
+        float(name[len(prefix):-len('.parquet')])
+        for name in os.listdir(store_dir)
+        if name.startswith(prefix) and name.endswith('.parquet')
+    )
+
+
+# 원본 GeoJSON 내려받기 (이미 받은 파일은 재사용, 임시 파일에 쓴 뒤 교체)
+def download_sources(urls=SOURCE_URLS, source_dir=SOURCE_DIR):
+    import requests
+
+    os.makedirs(source_dir, exist_ok=True)
+    sources = {}
+    for level, url in urls.items():
+        path = os.path.join(source_dir, os.path.basename(url))
+        if not os.path.exists(path):
+            print(f"경계 원본 내려받는 중: {url}")
+            response = requests.get(url, timeout=60)
+            response.raise_for_status()
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(response.content)
+            os.replace(tmp_path, path)
+        sources[level] = path
+    return sources
+
+
+# 저장소에 없는 단계가 있으면 원본을 내려받아 생성 (SOURCE_URLS에 있는 단계만 가능)
+def ensure_store(levels=('sido', 'sigungu'), store_dir=STORE_DIR):
+    missing = [level for level in levels if level in SOURCE_URLS and not available_tolerances(level, store_dir)]
+    if not missing:
+        return []
+    try:
+        sources = download_sources()
+    except Exception as e:
+        raise FileNotFoundError(
+            f"'{store_dir}'에 {', '.join(missing)} 경계 파일이 없고 원본을 내려받지 못했습니다 ({e}). "
+            f"python boundary_store.py --sido <시도 GeoJSON> --sigungu <시군구 GeoJSON>으로 먼저 생성하세요."
+        ) from e
+    written = build_store(sources, store_dir)
+    _load_table.cache_clear()
+    return written
+
+
+# 출력 해상도에 맞는 허용오차 선택: 한 픽셀보다 작은 오차 중 가장 큰 값
+def pick_tolerance(level, width_px=None, extent_deg=KOREA_EXTENT_DEG, store_dir=STORE_DIR):
+    tolerances = available_tolerances(level, store_dir)
+    if not tolerances:
+        ensure_store([level], store_dir)
+        tolerances = available_tolerances(level, store_dir)
+    if not tolerances:
+        raise FileNotFoundError(
+            f"'{store_dir}'에 {level} 경계 파일이 없습니다. python boundary_store.py --{level} <GeoJSON>으로 먼저 생성하세요."
+        )
+    if width_px is None:
+        return tolerances[0]
+    degrees_per_px = extent_deg / width_px
+    fitting = [tolerance for tolerance in tolerances if tolerance <= degrees_per_px]
+    return fitting[-1] if fitting else tolerances[0]
+
+
+# 경계 파일은 처음 필요할 때 한 번만 읽음
+@functools.lru_cache(maxsize=None)
+def _load_table(level, tolerance, store_dir):
+    return pq.read_table(_store_path(level, tolerance, store_dir))
+
+
+def load_boundaries(level='sido', tolerance=None, width_px=None, store_dir=STORE_DIR):
+    # 저장소가 없으면 처음 한 번 원본을 내려받아 생성
+    if not available_tolerances(level, store_dir):
+        ensure_store([level], store_dir)
+    if tolerance is None:
+        tolerance = pick_tolerance(level, width_px, store_dir=store_dir)
+    table = _load_table(level, tolerance, store_dir)
+    df = table.drop(['geometry']).to_pandas()
+    for col in ['code', 'name', 'sido', 'sigungu', 'sigungu_code']:
+        if col in df:
+            df[col] = df[col].astype(object)
+    df['geometry'] = shapely.from_wkb(table.column('geometry').to_numpy(zero_copy_only=False))
+    return df
+
+
+# folium 등에서 바로 쓸 수 있는 GeoJSON FeatureCollection
+def load_geojson(level='sido', tolerance=None, width_px=None, store_dir=STORE_DIR):
+    df = load_boundaries(level, tolerance, width_px, store_dir)
+    property_columns = [col for col in ['code', 'name', 'sido', 'sigungu', 'sigungu_code'] if col in df]
+    geometries = shapely.to_geojson(df['geometry'].to_numpy())
+    features = []
+    for geometry, properties in zip(geometries, df[property_columns].to_dict('records')):
+        features.append({'type': 'Feature', 'properties': properties, 'geometry': json.loads(geometry)})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='행정경계 GeoJSON을 경계 저장소로 변환 (경로를 주지 않으면 저장소가 없을 때만 원본을 내려받아 생성)'
+    )
+    for level in LEVELS:
+        parser.add_argument(f'--{level}', help=f'{level} 단위 GeoJSON 경로')
+    parser.add_argument('--out', default=STORE_DIR)
+    args = parser.parse_args()
+
+    sources = {level: getattr(args, level) for level in LEVELS if getattr(args, level)}
+    written = build_store(sources, args.out) if sources else ensure_store(store_dir=args.out)
+    if not written:
+        print(f"'{args.out}'에 경계 저장소가 이미 있습니다.")
+    for path in written:
+        print(f'생성: {path}')
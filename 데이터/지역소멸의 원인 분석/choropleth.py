@@ -0,0 +1,148 @@
+import folium
+import pandas as pd
+from branca.colormap import linear
+from branca.element import MacroElement
+from jinja2 import Template
+
+# 데이터가 없는 지역의 색
+MISSING_COLOR = '#cccccc'
+
+# 경계선 등 모든 지역에 공통으로 쓰는 스타일
+BASE_STYLE = {
+    'color': 'black',
+    'weight': 1,
+    'fillOpacity': 0.7,
+}
+
+
+# 기본 색상: 전체 값 범위에 맞춘 연속 색상표
+def default_colors(values):
+    values = pd.Series(values).dropna()
+    if values.empty:
+        return lambda value: MISSING_COLOR
+    return linear.YlOrRd_09.scale(values.min(), values.max())
+
+
+def _to_json_value(value):
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+# 연도 선택 컨트롤: 선택한 연도의 값/색을 각 지역 속성에 복사하고 스타일만 다시 적용
+class YearSwitch(MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function() {
+            var layer = {{ this.layer.get_name() }};
+            var years = {{ this.years|tojson }};
+            var fields = {{ this.fields|tojson }};
+            var baseStyle = layer.options.style;
+            layer.options.style = function(feature) {
+                var style = Object.assign({}, baseStyle(feature));
+                style.fillColor = feature.properties._fill;
+                return style;
+            };
+
+            function show(i) {
+                layer.eachLayer(function(l) {
+                    var p = l.feature.properties;
+                    fields.forEach(function(f) { p[f] = p._series[f][i]; });
+                    p._fill = p._series._fill[i];
+                });
+                layer.setStyle(layer.options.style);
+            }
+
+            var control = L.control({position: 'topright'});
+            control.onAdd = function() {
+                var div = L.DomUtil.create('div', 'leaflet-bar');
+                div.style.background = 'white';
+                div.style.padding = '4px';
+                var select = L.DomUtil.create('select', '', div);
+                years.forEach(function(year, i) {
+                    var option = document.createElement('option');
+                    option.value = i;
+                    option.text = year;
+                    select.appendChild(option);
+                });
+                select.value = {{ this.initial }};
+                select.onchange = function() { show(parseInt(this.value)); };
+                L.DomEvent.disableClickPropagation(div);
+                return div;
+            };
+            control.addTo({{ this.map.get_name() }});
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, m, layer, years, fields, initial):
+        super().__init__()
+        self._name = 'YearSwitch'
+        self.map = m
+        self.layer = layer
+        self.years = [str(year) for year in years]
+        self.fields = fields
+        self.initial = initial
+
+
+# 지역별 값을 경계 데이터에 한 번에 붙여서 단일 GeoJson 레이어로 지도에 추가
+# data: on(지역명) 컬럼과 값 컬럼을 가진 DataFrame, year_column을 주면 연도별로 전환 가능한 지도 생성
+# colors: 값 → 색상 함수 (기본: 전체 값 범위의 YlOrRd 색상표)
+def add_choropleth(m, geojson, data, value_column, on='시도', feature_key='name',
+                   popup_columns=None, popup_aliases=None, year_column=None, initial_year=None,
+                   colors=None, name=None):
+    fields = [value_column] + [col for col in (popup_columns or []) if col != value_column]
+    data = data.set_index([on, year_column] if year_column else on)[fields]
+    if colors is None:
+        colors = default_colors(data[value_column])
+
+    def color_of(value):
+        return MISSING_COLOR if pd.isna(value) else colors(value)
+
+    # 지역명 → 속성 조회표 (지역당 한 번만 계산)
+    lookup = {}
+    years = None
+    if year_column is None:
+        fills = data[value_column].map(color_of)
+        for key, row, fill in zip(data.index, data.itertuples(index=False), fills):
+            properties = {field: _to_json_value(value) for field, value in zip(fields, row)}
+            properties['_fill'] = fill
+            lookup[key] = properties
+    else:
+        years = sorted(data.index.get_level_values(year_column).unique())
+        initial = years.index(initial_year) if initial_year is not None else len(years) - 1
+        wide = data.unstack(year_column).reindex(columns=pd.MultiIndex.from_product([fields, years]))
+        fills = wide[value_column].apply(lambda col: col.map(color_of))
+        for key in wide.index:
+            series = {field: [_to_json_value(value) for value in wide.loc[key, field]] for field in fields}
+            series['_fill'] = list(fills.loc[key])
+            properties = {field: series[field][initial] for field in fields}
+            properties['_fill'] = series['_fill'][initial]
+            properties['_series'] = series
+            lookup[key] = properties
+
+    features = []
+    for feature in geojson['features']:
+        key = feature['properties'].get(feature_key)
+        properties = lookup.get(key)
+        if properties is None:
+            continue
+        features.append({
+            'type': 'Feature',
+            'id': key,
+            'properties': {**feature['properties'], **properties},
+            'geometry': feature['geometry'],
+        })
+
+    aliases = popup_aliases or [feature_key] + fields
+    layer = folium.GeoJson(
+        {'type': 'FeatureCollection', 'features': features},
+        name=name,
+        style_function=lambda feature: {**BASE_STYLE, 'fillColor': feature['properties']['_fill']},
+        popup=folium.GeoJsonPopup(fields=[feature_key] + fields, aliases=aliases, localize=True),
+    )
+    layer.add_to(m)
+
+    if years is not None:
+        m.add_child(YearSwitch(m, layer, years, fields, initial))
+    return layer
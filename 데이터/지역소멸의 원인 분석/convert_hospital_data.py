@@ -1,14 +1,16 @@
 import pandas as pd
 import os
+from hospital_cache import hospital_excel_path, load_hospital_snapshot
 
 def process_hospital_data(year, month):
     # Excel 파일 경로 설정
-    excel_file = os.path.join('병원', '전국 병의원 및 약국 현황', f'병원정보서비스 {year}.{month}.xlsx')
+    excel_file = hospital_excel_path(year, month)
     print(f"\n=== {year}년 {month}월 데이터 처리 ===")
     print(f"파일 경로: {os.path.abspath(excel_file)}")
 
     try:
-        df = pd.read_excel(excel_file)
+        # 엑셀은 최초 1회만 파싱하고 이후에는 Parquet 스냅샷을 사용
+        df = load_hospital_snapshot(year, month)
         print("\n[컬럼명]")
         for col in df.columns:
             print(col)
@@ -16,7 +18,7 @@ def process_hospital_data(year, month):
         print(df.head(5))
 
         # 시도코드명 결측치를 '미상'으로 채우기
-        df['시도코드명'] = df['시도코드명'].fillna('미상')
+        df['시도코드명'] = df['시도코드명'].astype('object').fillna('미상')
 
         # 시도코드명 표기 매핑
         sido_mapping = {
@@ -49,7 +51,7 @@ def process_hospital_data(year, month):
         df_hosp = df[df['종별코드명'].isin(hospital_types)]
 
         # 광역시/도별 집계
-        gwangyeok_summary = df_hosp.groupby(['시도코드명', '종별코드명']).size().unstack(fill_value=0).reset_index()
+        gwangyeok_summary = df_hosp.groupby(['시도코드명', '종별코드명'], observed=True).size().unstack(fill_value=0).reset_index()
 
         # 누락된 병원 종류 컬럼이 있으면 0으로 추가
         for col in ['상급종합', '종합병원', '한의원', '의원']:
@@ -76,7 +78,7 @@ def process_hospital_data(year, month):
         gwangyeok_summary = gwangyeok_summary.sort_values('시도코드명')
 
         # 시군구별 집계
-        sigungu_summary = df_hosp.groupby(['시도코드명', '시군구코드명', '종별코드명']).size().unstack(fill_value=0).reset_index()
+        sigungu_summary = df_hosp.groupby(['시도코드명', '시군구코드명', '종별코드명'], observed=True).size().unstack(fill_value=0).reset_index()
         for col in ['상급종합', '종합병원', '한의원', '의원']:
             if col not in sigungu_summary.columns:
                 sigungu_summary[col] = 0
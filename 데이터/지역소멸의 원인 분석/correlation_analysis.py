@@ -2,7 +2,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
-plt.rcParams['font.family'] = 'AppleGothic'
+from plot_style import apply_style
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
@@ -0,0 +1,194 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+# 상관계수 크기 해석 기준 (|r| 경계값과 구간별 표현)
+STRENGTH_BINS = [0.3, 0.5, 0.7, 0.9]
+STRENGTH_LABELS = ['매우 약한', '약한', '중간 정도의', '강한', '매우 강한']
+
+# 유의수준
+ALPHA = 0.05
+
+# 그룹 기준 없이 전체를 한 그룹으로 볼 때의 이름
+ALL_GROUP = '전체'
+
+RESULT_COLUMNS = [
+    'grouping', 'group', 'start', 'end', 'x', 'y', 'n',
+    'pearson_r', 'pearson_p', 'spearman_r', 'spearman_p', 'slope', 'intercept',
+]
+
+
+# 상관계수 해석 문장 (스칼라면 문자열, 배열이면 문자열 배열)
+def interpret_correlation(r, p, alpha=ALPHA):
+    scalar = np.ndim(r) == 0
+    r = np.atleast_1d(np.asarray(r, dtype=float))
+    p = np.atleast_1d(np.asarray(p, dtype=float))
+    strength = np.array(STRENGTH_LABELS)[np.searchsorted(STRENGTH_BINS, np.abs(np.nan_to_num(r)), side='right')]
+    direction = np.where(r > 0, '양의', '음의')
+    significance = np.where(p < alpha, '통계적으로 유의미한', '통계적으로 유의미하지 않은')
+    sentence = pd.Series(significance) + ' ' + strength + ' ' + direction + ' 상관관계가 있습니다.'
+    sentence = np.where(np.isnan(r), '상관계수를 계산할 수 없습니다.', sentence.to_numpy(dtype=object))
+    return sentence[0] if scalar else sentence
+
+
+# 합계로부터 피어슨 상관계수, p-value, 단순회귀 기울기/절편 계산 (배열 단위)
+# n: 표본 수, sx/sy: 합, sxx/syy: 제곱합, sxy: 곱의 합
+def pearson_from_sums(n, sx, sy, sxx, syy, sxy):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = n * sxy - sx * sy
+        var_x = n * sxx - sx ** 2
+        var_y = n * syy - sy ** 2
+        r = np.clip(cov / np.sqrt(var_x * var_y), -1, 1)
+        r = np.where(n >= 2, r, np.nan)
+        slope = cov / var_x
+        intercept = (sy - slope * sx) / n
+        df = n - 2
+        t = r * np.sqrt(df / (1 - r ** 2))
+        p = np.where(df > 0, 2 * stats.t.sf(np.abs(t), np.maximum(df, 1)), np.nan)
+    return r, p, slope, intercept
+
+
+# 긴 형태(지역, 연도, 지표, 값) 패널을 지표별 컬럼을 가진 넓은 형태로 변환
+def pivot_indicators(long_df, index_columns, indicator_column='indicator', value_column='value'):
+    wide = long_df.pivot_table(index=index_columns, columns=indicator_column, values=value_column, aggfunc='first')
+    wide.columns.name = None
+    return wide.reset_index()
+
+
+# 그룹 기준 × 그룹 × 연도 구간별로 관측치 행 번호를 쌓은 배열 생성
+def _segments(panel, groupings, year_column, windows):
+    years = None
+    if year_column is not None and year_column in panel:
+        years = pd.to_numeric(panel[year_column], errors='coerce').to_numpy()
+
+    labels = []
+    segment_ids = []
+    rows = []
+    for start, end in windows:
+        in_window = np.ones(len(panel), dtype=bool)
+        if years is not None and start is not None:
+            in_window &= years >= start
+        if years is not None and end is not None:
+            in_window &= years <= end
+
+        for grouping, column in groupings.items():
+            if column is None:
+                codes, uniques = np.zeros(len(panel), dtype=np.intp), [ALL_GROUP]
+            else:
+                codes, uniques = pd.factorize(panel[column], sort=True)
+            member = in_window & (codes >= 0)
+            segment_ids.append(len(labels) + codes[member])
+            rows.append(np.flatnonzero(member))
+            labels.extend((grouping, group, start, end) for group in uniques)
+
+    return labels, np.concatenate(segment_ids), np.concatenate(rows)
+
+
+# 구간별 쌍 합계: 두 지표가 모두 있는 관측치만 사용 (결과 shape: 구간 × k × k)
+def _pair_sums(values, segment_ids, n_segments):
+    n_rows, k = values.shape
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    membership = sparse.csr_matrix(
+        (np.ones(n_rows), (segment_ids, np.arange(n_rows))), shape=(n_segments, n_rows)
+    )
+
+    def pair_sum(a, b):
+        return (membership @ (a[:, :, None] * b[:, None, :]).reshape(n_rows, k * k)).reshape(n_segments, k, k)
+
+    n = pair_sum(valid.astype(float), valid.astype(float))
+    sx = pair_sum(x, valid.astype(float))
+    sxx = pair_sum(x ** 2, valid.astype(float))
+    sxy = pair_sum(x, x)
+    sy = sx.transpose(0, 2, 1)
+    syy = sxx.transpose(0, 2, 1)
+    return n, sx, sy, sxx, syy, sxy
+
+
+# 쌍별 스피어만 상관: 두 지표가 모두 있는 관측치만 남긴 뒤 구간 안에서 순위를 매기고 피어슨 합계 계산
+# 모든 쌍의 x·y 순위를 컬럼으로 쌓아 groupby 순위 한 번으로 계산 (결과 shape: 구간 × 쌍)
+def _spearman_pairs(values, segment_ids, n_segments, xi, yi):
+    both = ~np.isnan(values[:, xi]) & ~np.isnan(values[:, yi])
+    masked = np.concatenate([np.where(both, values[:, xi], np.nan), np.where(both, values[:, yi], np.nan)], axis=1)
+    ranks = pd.DataFrame(masked).groupby(segment_ids).rank().to_numpy(dtype=float)
+    rank_x, rank_y = np.nan_to_num(ranks[:, :len(xi)]), np.nan_to_num(ranks[:, len(xi):])
+    membership = sparse.csr_matrix(
+        (np.ones(len(values)), (segment_ids, np.arange(len(values)))), shape=(n_segments, len(values))
+    )
+    sums = [membership @ column for column in (both.astype(float), rank_x, rank_y, rank_x ** 2, rank_y ** 2,
+                                               rank_x * rank_y)]
+    return pearson_from_sums(*(np.asarray(total) for total in sums))[:2]
+
+
+# 지표 쌍 × 그룹 기준 × 그룹 × 연도 구간 전체의 상관분석을 한 번에 계산
+# panel: 관측치(지역·연도)별 한 행, 지표별 한 컬럼인 DataFrame (긴 형태는 pivot_indicators로 변환)
+# groupings: {'구분': '구분', '시도': '시도'} 처럼 그룹 기준 이름 → 컬럼 (None이면 전체)
+# windows: [(2015, 2019), (2020, 2023)] 처럼 연도 구간 (양 끝 포함, None이면 전체 기간)
+# pairs: [(x, y), ...] (None이면 모든 지표 쌍)
+# 스피어만 순위는 구간 안에서 두 지표가 모두 있는 관측치 기준으로 매김 (scipy.stats.spearmanr과 동일)
+def correlate(panel, indicators, groupings=None, year_column='연도', windows=None, pairs=None):
+    indicators = list(indicators)
+    if groupings is None:
+        groupings = {ALL_GROUP: None}
+    elif not isinstance(groupings, dict):
+        groupings = {column: column for column in groupings}
+    windows = windows or [(None, None)]
+    if pairs is None:
+        pairs = list(itertools.combinations(indicators, 2))
+
+    labels, segment_ids, rows = _segments(panel, groupings, year_column, windows)
+    n_segments = len(labels)
+
+    # 전체 평균으로 중심화 (상관계수는 그대로, 큰 값의 제곱합에서 생기는 오차 감소)
+    values = panel[indicators].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    means = np.nanmean(values, axis=0) if len(values) else np.zeros(len(indicators))
+    means = np.nan_to_num(means)
+    stacked = values[rows] - means
+
+    n, sx, sy, sxx, syy, sxy = _pair_sums(stacked, segment_ids, n_segments)
+    pearson_r, pearson_p, slope, intercept = pearson_from_sums(n, sx, sy, sxx, syy, sxy)
+
+    # 중심화 이전 기준 절편으로 환원
+    intercept = intercept + means[None, None, :] - slope * means[None, :, None]
+
+    position = {name: i for i, name in enumerate(indicators)}
+    xi = np.array([position[x] for x, _ in pairs], dtype=np.intp)
+    yi = np.array([position[y] for _, y in pairs], dtype=np.intp)
+
+    # 스피어만: 쌍마다 공통 관측치로 구간별 순위를 매긴 뒤 같은 합계 계산
+    spearman_r, spearman_p = _spearman_pairs(stacked, segment_ids, n_segments, xi, yi)
+    pair_index = np.tile(np.arange(len(pairs)), n_segments)
+
+    segment_index = np.repeat(np.arange(n_segments), len(pairs))
+    xi = np.tile(xi, n_segments)
+    yi = np.tile(yi, n_segments)
+    label_frame = pd.DataFrame(labels, columns=['grouping', 'group', 'start', 'end']).iloc[segment_index]
+    label_frame = label_frame.astype({'start': 'Int64', 'end': 'Int64'})
+
+    result = label_frame.reset_index(drop=True).assign(
+        x=[indicators[i] for i in xi],
+        y=[indicators[i] for i in yi],
+        n=n[segment_index, xi, yi].astype(int),
+        pearson_r=pearson_r[segment_index, xi, yi],
+        pearson_p=pearson_p[segment_index, xi, yi],
+        spearman_r=spearman_r[segment_index, pair_index],
+        spearman_p=spearman_p[segment_index, pair_index],
+        slope=slope[segment_index, xi, yi],
+        intercept=intercept[segment_index, xi, yi],
+    )
+    return result[RESULT_COLUMNS]
+
+
+# 결과 표에서 그룹별 (상관계수, p-value) 조회용 dict (groups를 주면 그 순서대로)
+def correlation_dict(result, x=None, y=None, groups=None, method='pearson'):
+    if x is not None:
+        result = result[(result['x'] == x) & (result['y'] == y)]
+    correlations = {
+        group: (r, p)
+        for group, r, p in zip(result['group'], result[f'{method}_r'], result[f'{method}_p'])
+    }
+    if groups is not None:
+        correlations = {group: correlations[group] for group in groups}
+    return correlations
@@ -1,21 +1,23 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+import warehouse
+from correlation_engine import correlate, correlation_dict, interpret_correlation
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
-population_file = '02_인구 분포 데이터/인구수 데이터/연도별_시군구_총인구_2013_2025.csv'
 
 # 데이터 로드
 empty_df = pd.read_csv(empty_houses_file, encoding='utf-8')
 empty_df.rename(columns={'지역구분': '구분'}, inplace=True)
 
-# 인구 데이터 처리
-df = pd.read_csv(population_file, encoding='utf-8')
+# 인구 데이터 처리 (지표 저장소에서 2015-2023년 시군구별 총인구만 읽음)
+df = warehouse.load_wide(['총인구'], years=range(2015, 2024))
 capital_regions = ['서울특별시', '인천광역시', '경기도']
 
 # 연도별 수도권/비수도권 인구 비율 계산
@@ -55,7 +57,8 @@ merged_df = pd.merge(empty_df, pop_df, on=['연도', '구분'])
 
 # 수도권과 비수도권 각각의 상관관계 분석
 regions = ['수도권', '비수도권']
-correlations = {}
+results = correlate(merged_df, ['빈집비율(%)', '인구비율'], groupings=['구분'])
+correlations = correlation_dict(results, groups=regions)
 
 # 그래프 생성
 fig, axes = plt.subplots(1, 2, figsize=(15, 6))
@@ -64,9 +67,7 @@ fig.suptitle('빈집 비율과 인구 비율의 상관관계 분석 (2015-2023)'
 for i, region in enumerate(regions):
     region_data = merged_df[merged_df['구분'] == region]
     
-    # 상관계수 계산
-    correlation = stats.pearsonr(region_data['빈집비율(%)'], region_data['인구비율'])
-    correlations[region] = correlation
+    correlation = correlations[region]
     
     # 산점도 그리기
     ax = axes[i]
@@ -102,19 +103,4 @@ for region, (corr, p_value) in correlations.items():
     print(f"P-value: {p_value:.3f}")
     
     # 상관관계 해석
-    print("해석:", end=" ")
-    if abs(corr) < 0.3:
-        strength = "매우 약한"
-    elif abs(corr) < 0.5:
-        strength = "약한"
-    elif abs(corr) < 0.7:
-        strength = "중간 정도의"
-    elif abs(corr) < 0.9:
-        strength = "강한"
-    else:
-        strength = "매우 강한"
-        
-    direction = "양의" if corr > 0 else "음의"
-    significance = "통계적으로 유의미한" if p_value < 0.05 else "통계적으로 유의미하지 않은"
-    
-    print(f"{significance} {strength} {direction} 상관관계가 있습니다.") 
\ No newline at end of file
+    print("해석:", interpret_correlation(corr, p_value)) 
\ No newline at end of file
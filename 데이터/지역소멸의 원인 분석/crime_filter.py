@@ -1,21 +1,26 @@
-import pandas as pd
+import csv_loader
+import record_linkage
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
+from plot_style import apply_style
+from label_placement import place_labels
 
-# CSV 파일들 읽기 (인코딩 지정)
-crime_df = pd.read_csv('5대 범죄.csv', encoding='utf-8')
-cctv_df = pd.read_csv('통합_시도별_CCTV_현황 (2024년 기준).csv', encoding='cp949')
+# 한글 폰트 설정
+apply_style()
 
-# '기타' 시도 제외 및 제주특별자치도 이름 수정
+# CSV 파일들 읽기 (인코딩은 자동 판별)
+crime_df = csv_loader.read_csv('5대 범죄.csv')
+cctv_df = csv_loader.read_csv('통합_시도별_CCTV_현황 (2024년 기준).csv')
+
+# '기타' 시도 제외
 crime_df = crime_df[crime_df['시도'] != '기타']
-crime_df.loc[crime_df['시도'] == '제주특별자치도', '시도'] = '제주'
-crime_df.loc[(crime_df['시도'] == '제주') & (crime_df['시군구'] == '시'), '시군구'] = '제주시'
 
-# 두 데이터프레임을 시도와 시군구 기준으로 조인
-merged_df = pd.merge(crime_df, cctv_df, 
-                    on=['시도', '시군구'], 
-                    how='inner')
+# 두 데이터프레임을 시도와 시군구 기준으로 조인 (표기가 달라도 행정코드·유사 이름으로 연결)
+merged_df, link_table, unmatched = record_linkage.merge(crime_df, cctv_df, '시도', '시군구')
+if len(unmatched):
+    print("\n연결되지 않은 시군구 (원본별 행수, 가장 가까운 후보):")
+    print(unmatched.to_string(index=False))
 
 # 상관관계 분석
 correlation = merged_df['발생건수'].corr(merged_df['CCTV 수'])
@@ -33,11 +38,11 @@ plt.xlabel('CCTV 수')
 plt.ylabel('범죄 발생건수')
 plt.title('CCTV 수와 범죄 발생건수의 상관관계')
 
-# 그래프에 도시 이름 표시
-for i, txt in enumerate(merged_df['시군구']):
-    plt.annotate(txt, (merged_df['CCTV 수'].iloc[i], merged_df['발생건수'].iloc[i]))
-
 plt.legend()
+
+# 그래프에 도시 이름 표시: 회귀선에서 멀리 떨어진 시군구부터 겹치지 않는 라벨만 표시
+place_labels(plt.gca(), merged_df['CCTV 수'], merged_df['발생건수'], merged_df['시군구'], fontsize=10)
+
 plt.savefig('상관관계_분석.png')
 plt.close()
 
@@ -3,10 +3,10 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import numpy as np
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 로드
 crime_df = pd.read_csv('06_5대 범죄 데이터/2023년 5대 주요범죄통계.csv')
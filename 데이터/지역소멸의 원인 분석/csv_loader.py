@@ -0,0 +1,210 @@
+import codecs
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 파일 해시별 인코딩 판별 결과를 저장하는 캐시
+CACHE_FILE = os.path.join('.cache', 'encodings.json')
+
+# 인코딩 판별에 사용할 앞부분 바이트 수
+SAMPLE_SIZE = 64 * 1024
+
+# 판별 순서 (cp949는 euc-kr의 상위 집합이므로 euc-kr 파일도 cp949로 읽힘)
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949']
+
+# pandas의 pyarrow 엔진이 지원하지 않는 옵션 (이 옵션이 있으면 기본 엔진 사용)
+PYARROW_UNSUPPORTED = {
+    'chunksize', 'iterator', 'nrows', 'skipfooter', 'thousands', 'comment', 'converters',
+    'low_memory', 'memory_map', 'float_precision', 'dialect', 'quoting', 'lineterminator',
+    'on_bad_lines', 'skip_blank_lines', 'skipinitialspace', 'decimal', 'sep', 'delimiter',
+}
+
+_cache = None
+_dirty = False
+
+
+# 캐시에 저장하는 항목: 파일 해시 → 인코딩, 파일 해시 → 전체 검증 여부, 경로 → (크기, 수정시각, 해시)
+CACHE_SECTIONS = ('hashes', 'verified', 'files')
+
+
+def _read_cache_file():
+    try:
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    for section in CACHE_SECTIONS:
+        cache.setdefault(section, {})
+    return cache
+
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        _cache = _read_cache_file()
+    return _cache
+
+
+# 병렬로 실행되는 다른 프로세스가 그사이 저장한 항목을 잃지 않도록 디스크의 캐시와 합친 뒤 교체
+def _save_cache():
+    global _cache, _dirty
+    _dirty = False
+    merged = _read_cache_file()
+    for section in CACHE_SECTIONS:
+        merged[section].update(_load_cache()[section])
+    _cache = merged
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp_file = f'{CACHE_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(_cache, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, CACHE_FILE)
+
+
+# 파일 내용 해시 (크기, 수정시각이 그대로면 저장된 해시 재사용)
+def file_digest(path):
+    cache = _load_cache()
+    stat = os.stat(path)
+    key = os.path.abspath(path)
+    entry = cache['files'].get(key)
+    if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        return entry[2]
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    digest = digest.hexdigest()
+    cache['files'][key] = [stat.st_size, stat.st_mtime_ns, digest]
+    global _dirty
+    _dirty = True
+    return digest
+
+
+# 앞부분 바이트만 보고 인코딩 판별
+def sniff_encoding(sample):
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in CANDIDATE_ENCODINGS:
+        # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin1'
+
+
+# 판별용 표본 읽기: 앞부분이 모두 ASCII라면 처음 나오는 비ASCII 바이트부터 다시 표본을 잡음
+def _read_sample(path, sample_size):
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+        while sample.isascii() and len(sample) == sample_size:
+            block = f.read(sample_size)
+            if not block:
+                break
+            match = re.search(rb'[\x80-\xff]', block)
+            if match:
+                sample = block[match.start():] + f.read(match.start())
+                break
+    return sample
+
+
+def detect_encoding(path, sample_size=SAMPLE_SIZE):
+    cache = _load_cache()
+    digest = file_digest(path)
+    encoding = cache['hashes'].get(digest)
+    if encoding is None:
+        encoding = sniff_encoding(_read_sample(path, sample_size))
+        cache['hashes'][digest] = encoding
+        _save_cache()
+    elif _dirty:
+        _save_cache()
+    return encoding
+
+
+# 표본 이후에서 판별이 틀린 것으로 드러난 경우 결과 수정
+def _remember_encoding(path, encoding, verified=False):
+    cache = _load_cache()
+    digest = file_digest(path)
+    cache['hashes'][digest] = encoding
+    if verified:
+        cache['verified'][digest] = True
+    _save_cache()
+
+
+# 다른 후보 인코딩 (utf-8 ↔ cp949)
+def _fallback_encoding(encoding):
+    return CANDIDATE_ENCODINGS[(CANDIDATE_ENCODINGS.index(encoding) + 1) % len(CANDIDATE_ENCODINGS)]
+
+
+# 파일 전체가 encoding으로 디코딩되는지 확인 (파싱 없이 디코딩만, 결과는 캐시에 남겨 파일당 한 번)
+# chunksize/iterator로 읽으면 디코딩 오류가 반복 도중에 나서 대체 인코딩으로 다시 읽을 수 없으므로 미리 확인
+def _verified_encoding(path, encoding):
+    if encoding not in CANDIDATE_ENCODINGS or _load_cache()['verified'].get(file_digest(path)):
+        return encoding
+    for candidate in [encoding, _fallback_encoding(encoding)]:
+        decoder = codecs.getincrementaldecoder(candidate)()
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    decoder.decode(block)
+                decoder.decode(b'', final=True)
+        except UnicodeDecodeError:
+            continue
+        _remember_encoding(path, candidate, verified=True)
+        return candidate
+    return encoding
+
+
+def _use_pyarrow(kwargs):
+    if not HAS_PYARROW or 'engine' in kwargs:
+        return False
+    if PYARROW_UNSUPPORTED & kwargs.keys():
+        return False
+    skiprows = kwargs.get('skiprows')
+    return skiprows is None or isinstance(skiprows, int)
+
+
+# 중복 컬럼명을 기본 엔진과 같은 방식으로 구분 ('주택_계', '주택_계.1', ...)
+def _mangle_duplicates(columns):
+    seen = {}
+    result = []
+    for col in columns:
+        count = seen.get(col, 0)
+        seen[col] = count + 1
+        result.append(col if count == 0 else f'{col}.{count}')
+    return result
+
+
+# 인코딩을 자동으로 판별해서 한 번에 읽는 read_csv
+# encoding을 직접 지정하면 판별하지 않음
+def read_csv(path, **kwargs):
+    encoding = kwargs.pop('encoding', None) or detect_encoding(path)
+    if _use_pyarrow(kwargs):
+        df = pd.read_csv(path, encoding=encoding, engine='pyarrow', **kwargs)
+        if df.columns.has_duplicates:
+            df.columns = _mangle_duplicates(df.columns)
+        return df
+    if kwargs.get('chunksize') is not None or kwargs.get('iterator'):
+        # 반복 읽기는 오류가 나중에 나므로 파일 전체로 인코딩을 먼저 확정
+        return pd.read_csv(path, encoding=_verified_encoding(path, encoding), **kwargs)
+    try:
+        return pd.read_csv(path, encoding=encoding, **kwargs)
+    except UnicodeDecodeError:
+        if encoding not in CANDIDATE_ENCODINGS:
+            raise
+        # 표본에 ASCII만 있었던 경우 등: 다음 후보로 한 번 더 시도
+        fallback = _fallback_encoding(encoding)
+        df = pd.read_csv(path, encoding=fallback, **kwargs)
+        _remember_encoding(path, fallback)
+        return df
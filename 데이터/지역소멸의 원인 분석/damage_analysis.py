@@ -1,56 +1,132 @@
+import re
+
 import pandas as pd
-import numpy as np
 
-# 데이터 로드
-file_path = '/Users/sj1007/Downloads/주택종류별_미거주_주택_빈집_사유별_기간별_파손정도별_미거주_주택_빈집_시도_20250603124051.csv'
-df = pd.read_csv(file_path, encoding='euc-kr')
+import csv_loader
+
+# 원본: KOSIS 주택종류별 미거주 주택(빈집) 사유별·기간별·파손정도별 (시도)
+DAMAGE_FILE = '주택종류별_미거주_주택_빈집_사유별_기간별_파손정도별_미거주_주택_빈집_시도_20250603124051.csv'
+
+# 결과: (시도 × 주택의종류 × 빈집사유 × … × 연도) 색인 표 한 장
+DAMAGE_CUBE_FILE = '빈집_파손_현황_전체.csv'
+# 기존 요약표 (2020년 시도별, 주택의종류·사유 등은 계)
+SUMMARY_FILE = '행정구역별_빈집_파손_현황.csv'
+SUMMARY_YEAR = 2020
+
+# 원본 차원 컬럼 → 결과 색인 이름
+DIMENSION_NAMES = {
+    '행정구역별(시도)': '시도',
+    '미거주 주택(빈집)사유': '빈집사유',
+}
+
+# 파손정도 구분 → 결과 컬럼
+DAMAGE_CLASSES = {
+    '파손정도-계': '전체 빈집수',
+    '파손정도-반 이상 파손': '반 이상 파손',
+    '파손정도-일부파손': '일부 파손',
+}
+RATIO_COLUMNS = ['반이상_파손_비율', '일부_파손_비율', '전체_파손_비율']
+VALUE_COLUMNS = list(DAMAGE_CLASSES.values()) + RATIO_COLUMNS
+
+YEAR_PATTERN = re.compile(r'^\s*(\d{4})\s*$')
+
+
+# 원본을 한 번 읽어서 파손정도를 컬럼으로 펼친 큐브 생성
+# 색인: 파손정도를 제외한 모든 차원 + 연도, 컬럼: 파손 건수와 비율(%)
+def build_damage_cube(path=DAMAGE_FILE):
+    df = csv_loader.read_csv(path, dtype=str)
+    df.columns = [str(col).strip() for col in df.columns]
+    year_columns = [col for col in df.columns if YEAR_PATTERN.match(col)]
+    dimensions = [col for col in df.columns if col not in year_columns]
+
+    # 연도 컬럼 전체를 한 번에 숫자로 변환한 뒤 (차원…, 연도) 색인으로 쌓고 파손정도만 컬럼으로 펼침
+    df = df.rename(columns=DIMENSION_NAMES)
+    dimensions = [DIMENSION_NAMES.get(col, col) for col in dimensions]
+    for col in dimensions:
+        df[col] = df[col].str.strip()
+    values = df[year_columns].apply(lambda col: pd.to_numeric(col.str.replace(',', '', regex=False), errors='coerce'))
+    values.index = pd.MultiIndex.from_frame(df[dimensions])
+    values.columns = pd.Index([int(col) for col in year_columns], name='연도')
+    cube = values.stack(future_stack=True).unstack('파손정도')
 
-# 필요한 데이터만 필터링
-df = df[df['주택의종류'] == '계']
-df = df[df['미거주 주택(빈집)사유'] == '미거주 주택(빈집)사유-계']
+    cube = cube.reindex(columns=list(DAMAGE_CLASSES)).rename(columns=DAMAGE_CLASSES)
+    cube.columns.name = None
 
-# 데이터를 숫자형으로 변환
-df['2020'] = pd.to_numeric(df['2020'], errors='coerce')
+    # 모든 조합의 비율을 벡터 연산으로 계산 (전체 빈집이 0이면 결측)
+    total = cube['전체 빈집수'].where(cube['전체 빈집수'] > 0)
+    cube['반이상_파손_비율'] = cube['반 이상 파손'] / total * 100
+    cube['일부_파손_비율'] = cube['일부 파손'] / total * 100
+    cube['전체_파손_비율'] = (cube['반 이상 파손'] + cube['일부 파손']) / total * 100
+    return cube.sort_index()
 
-# 전체 빈집수 데이터
-total_houses = df[df['파손정도'] == '파손정도-계'].set_index('행정구역별(시도)')['2020']
 
-# 반 이상 파손 데이터
-severe_damage = df[df['파손정도'] == '파손정도-반 이상 파손'].set_index('행정구역별(시도)')['2020']
+# 저장된 큐브 읽기 (원본을 다시 파싱하지 않고 연도·주택 종류별 비교에 사용)
+def load_damage_cube(path=DAMAGE_CUBE_FILE):
+    header = pd.read_csv(path, nrows=0, encoding='utf-8-sig').columns
+    index_columns = [col for col in header if col not in VALUE_COLUMNS]
+    return pd.read_csv(path, index_col=index_columns, encoding='utf-8-sig')
 
-# 일부 파손 데이터
-partial_damage = df[df['파손정도'] == '파손정도-일부파손'].set_index('행정구역별(시도)')['2020']
 
-# 결과 데이터프레임 생성
-result = pd.DataFrame({
-    '전체 빈집수': total_houses,
-    '반 이상 파손': severe_damage,
-    '일부 파손': partial_damage
-})
+# 큐브에서 조건에 맞는 단면 선택 (예: select(cube, 연도=2020, 주택의종류='계'))
+def select(cube, **levels):
+    mask = pd.Series(True, index=cube.index)
+    for name, value in levels.items():
+        mask &= cube.index.get_level_values(name) == value
+    result = cube[mask.to_numpy()]
+    return result.droplevel(list(levels)) if levels else result
 
-# 비율 계산 (정수로 반올림)
-result['반이상_파손_비율'] = ((result['반 이상 파손'] / result['전체 빈집수']) * 100).round()
-result['일부_파손_비율'] = ((result['일부 파손'] / result['전체 빈집수']) * 100).round()
-result['전체_파손_비율'] = (((result['반 이상 파손'] + result['일부 파손']) / result['전체 빈집수']) * 100).round()
 
-# 결과를 CSV 파일로 저장
-result.to_csv('행정구역별_빈집_파손_현황.csv', encoding='utf-8-sig')
+# 합계 구분 ('계', '미거주 주택(빈집)사유-계' 등)
+def _is_total(label):
+    return str(label) == '계' or str(label).endswith('-계')
 
-# 결과 출력 (터미널)
-print("\n=== 행정구역별 빈집 파손 비율 분석 ===\n")
-print("행정구역별 | 전체 빈집수 | 반이상 파손(%) | 일부 파손(%) | 전체 파손(%)")
-print("-" * 75)
 
-for idx, row in result.iterrows():
-    if idx != '전국':  # 전국은 마지막에 따로 출력
+# keep에 없는 차원은 합계 행만 남기고 색인에서 제거
+def totals_only(cube, keep):
+    for name in [name for name in cube.index.names if name not in keep]:
+        cube = cube[[_is_total(label) for label in cube.index.get_level_values(name)]].droplevel(name)
+    return cube
+
+
+# 기존 요약표: 한 해의 시도별 파손 현황 (다른 차원은 합계, 비율은 정수로 반올림)
+def summary_table(cube, year=SUMMARY_YEAR):
+    result = totals_only(select(cube, 연도=year), keep=['시도']).copy()
+    result[RATIO_COLUMNS] = result[RATIO_COLUMNS].round()
+    result.index.name = '행정구역별(시도)'
+    return result
+
+
+if __name__ == '__main__':
+    cube = build_damage_cube()
+    cube.to_csv(DAMAGE_CUBE_FILE, encoding='utf-8-sig')
+    print(f"전체 파손 현황 ({len(cube):,}행)이 '{DAMAGE_CUBE_FILE}'로 저장되었습니다.")
+
+    result = summary_table(cube)
+    result.to_csv(SUMMARY_FILE, encoding='utf-8-sig')
+
+    # 결과 출력 (터미널)
+    print(f"\n=== {SUMMARY_YEAR}년 행정구역별 빈집 파손 비율 분석 ===\n")
+    print("행정구역별 | 전체 빈집수 | 반이상 파손(%) | 일부 파손(%) | 전체 파손(%)")
+    print("-" * 75)
+
+    for idx, row in result.drop(index='전국', errors='ignore').iterrows():
         print(f"{idx:<10} | {int(row['전체 빈집수']):>10,} | {int(row['반이상_파손_비율']):>12} | {int(row['일부_파손_비율']):>11} | {int(row['전체_파손_비율']):>11}")
 
-# 전국 데이터 출력
-print("\n=== 전국 현황 ===")
-national = result.loc['전국']
-print(f"전체 빈집 수: {int(national['전체 빈집수']):,}호")
-print(f"반 이상 파손 비율: {int(national['반이상_파손_비율'])}%")
-print(f"일부 파손 비율: {int(national['일부_파손_비율'])}%")
-print(f"전체 파손 비율: {int(national['전체_파손_비율'])}%")
+    # 전국 데이터 출력
+    if '전국' in result.index:
+        print("\n=== 전국 현황 ===")
+        national = result.loc['전국']
+        print(f"전체 빈집 수: {int(national['전체 빈집수']):,}호")
+        print(f"반 이상 파손 비율: {int(national['반이상_파손_비율'])}%")
+        print(f"일부 파손 비율: {int(national['일부_파손_비율'])}%")
+        print(f"전체 파손 비율: {int(national['전체_파손_비율'])}%")
+
+        # 같은 큐브에서 연도별·주택 종류별 비교 (원본 재파싱 없음)
+        national_cube = select(cube, 시도='전국')
+        print("\n=== 전국 연도별 전체 파손 비율 ===")
+        print(totals_only(national_cube, keep=['연도'])['전체_파손_비율'].round(1).to_string())
+        print(f"\n=== 전국 주택 종류별 전체 파손 비율 ({SUMMARY_YEAR}년) ===")
+        by_type = totals_only(select(national_cube, 연도=SUMMARY_YEAR), keep=['주택의종류'])
+        print(by_type['전체_파손_비율'].round(1).to_string())
 
-print("\nCSV 파일이 '행정구역별_빈집_파손_현황.csv'로 저장되었습니다.") 
\ No newline at end of file
+    print(f"\nCSV 파일이 '{SUMMARY_FILE}'로 저장되었습니다.")
@@ -1,10 +1,12 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from correlation_engine import correlate, correlation_dict, interpret_correlation
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
@@ -29,7 +31,8 @@ merged_df = pd.merge(density_long, empty_df[['연도', '구분', '빈집비율(%
 
 # 수도권과 비수도권 각각의 상관관계 분석
 regions = ['수도권', '비수도권']
-correlations = {}
+results = correlate(merged_df, ['평균 인구밀도', '빈집비율(%)'], groupings=['구분'])
+correlations = correlation_dict(results, groups=regions)
 
 # 그래프 생성
 fig, axes = plt.subplots(1, 2, figsize=(15, 6))
@@ -38,10 +41,7 @@ fig.suptitle('인구밀도와 빈집 비율의 상관관계 분석 (2015-2023)',
 for i, region in enumerate(regions):
     region_data = merged_df[merged_df['구분'] == region]
     
-    # 상관계수 계산
-    correlation = stats.pearsonr(region_data['평균 인구밀도'], 
-                               region_data['빈집비율(%)'])
-    correlations[region] = correlation
+    correlation = correlations[region]
     
     # 산점도 그리기
     ax = axes[i]
@@ -81,22 +81,7 @@ for region, (corr, p_value) in correlations.items():
     print(f"P-value: {p_value:.3f}")
     
     # 상관관계 해석
-    print("해석:", end=" ")
-    if abs(corr) < 0.3:
-        strength = "매우 약한"
-    elif abs(corr) < 0.5:
-        strength = "약한"
-    elif abs(corr) < 0.7:
-        strength = "중간 정도의"
-    elif abs(corr) < 0.9:
-        strength = "강한"
-    else:
-        strength = "매우 강한"
-        
-    direction = "양의" if corr > 0 else "음의"
-    significance = "통계적으로 유의미한" if p_value < 0.05 else "통계적으로 유의미하지 않은"
-    
-    print(f"{significance} {strength} {direction} 상관관계가 있습니다.")
+    print("해석:", interpret_correlation(corr, p_value))
 
 # 추가 통계 분석
 print("\n=== 추가 통계 분석 ===")
@@ -1,10 +1,12 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from correlation_engine import correlate, correlation_dict, interpret_correlation
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
@@ -28,7 +30,8 @@ merged_df = pd.merge(density_df[['연도', '전국_평균_인구밀도']],
                     on='연도')
 
 # 상관계수 계산
-correlation = stats.pearsonr(merged_df['전국_평균_인구밀도'], merged_df['전국_빈집수'])
+results = correlate(merged_df, ['전국_평균_인구밀도', '전국_빈집수'])
+correlation = correlation_dict(results)['전체']
 
 # 그래프 생성
 plt.figure(figsize=(10, 6))
@@ -60,22 +63,7 @@ print(f"상관계수: {correlation[0]:.3f}")
 print(f"P-value: {correlation[1]:.3f}")
 
 # 상관관계 해석
-print("해석:", end=" ")
-if abs(correlation[0]) < 0.3:
-    strength = "매우 약한"
-elif abs(correlation[0]) < 0.5:
-    strength = "약한"
-elif abs(correlation[0]) < 0.7:
-    strength = "중간 정도의"
-elif abs(correlation[0]) < 0.9:
-    strength = "강한"
-else:
-    strength = "매우 강한"
-    
-direction = "양의" if correlation[0] > 0 else "음의"
-significance = "통계적으로 유의미한" if correlation[1] < 0.05 else "통계적으로 유의미하지 않은"
-
-print(f"{significance} {strength} {direction} 상관관계가 있습니다.")
+print("해석:", interpret_correlation(*correlation))
 
 # 추가 통계 분석
 print("\n=== 추가 통계 분석 ===")
@@ -1,9 +1,9 @@
 import pandas as pd
 import matplotlib.pyplot as plt
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 로드
 empty_df = pd.read_csv('01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv', encoding='utf-8')
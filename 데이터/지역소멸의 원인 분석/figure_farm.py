@@ -0,0 +1,123 @@
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+import plot_style
+
+# 그래프별 마지막 렌더링 해시 (출력 경로 → 해시)
+MANIFEST_FILE = os.path.join('.cache', 'figures.json')
+
+
+# 데이터 내용 해시 (DataFrame/Series/배열은 값 기준, dict/list는 재귀)
+def _update_digest(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        digest.update(repr((value.name, str(value.dtype))).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.shape, str(value.dtype))).encode('utf-8'))
+        digest.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode('utf-8'))
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            digest.update(repr(key).encode('utf-8'))
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f'{type(value).__name__}{len(value)}'.encode('utf-8'))
+        for item in value:
+            _update_digest(digest, item)
+    else:
+        digest.update(repr(value).encode('utf-8'))
+
+
+# 그림 명세 해시: 그리기 함수 코드 + 데이터 + 인자 + 저장 옵션 + 스타일(폰트, style/rc)
+def figure_digest(spec, style=None, rc=None):
+    draw = spec['draw']
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        source = inspect.getsource(draw)
+    except (OSError, TypeError):
+        source = ''
+    digest.update(f'{draw.__module__}.{draw.__qualname__}\n{source}'.encode('utf-8'))
+    _update_digest(digest, spec.get('data'))
+    _update_digest(digest, spec.get('params', {}))
+    _update_digest(digest, {**plot_style.SAVE_OPTIONS, **spec.get('save', {})})
+    _update_digest(digest, [plot_style.korean_font(), style, rc or {}])
+    return digest.hexdigest()
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+    tmp_file = f'{MANIFEST_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, MANIFEST_FILE)
+
+
+# 작업 프로세스 초기화: 화면 없는 Agg 백엔드, 한글 폰트 검색과 공통 스타일 적용은 프로세스당 한 번
+# (백엔드는 작업 프로세스에서만 바꿈 — 모듈을 import한 노트북 등의 백엔드는 그대로)
+def _init_worker(style, rc):
+    matplotlib.use('Agg')
+    plot_style.apply_style(style, **rc)
+
+
+# 한 장 렌더링: draw(data, **params)가 반환한 Figure를 저장
+def render_figure(spec):
+    fig = spec['draw'](spec.get('data'), **spec.get('params', {}))
+    fig.savefig(spec['output'], **{**plot_style.SAVE_OPTIONS, **spec.get('save', {})})
+    plt.close(fig)
+    return spec['output']
+
+
+# 그림 명세 목록을 프로세스 풀로 렌더링 (데이터·명세가 그대로이고 PNG가 있으면 건너뜀)
+# spec: {'output': 저장 경로, 'draw': 모듈 최상위 그리기 함수, 'data': 데이터, 'params': 추가 인자,
+#        'save': savefig 추가 옵션}
+# style, rc: 작업 프로세스에 적용할 matplotlib 스타일과 rcParams (apply_style 인자)
+# 그리기 함수를 가진 스크립트는 작업 프로세스에서 다시 import될 수 있으므로 실행부를 __main__ 아래에 둘 것
+def render_figures(specs, max_workers=None, force=False, style=None, rc=None):
+    rc = rc or {}
+    manifest = _load_manifest()
+    stale = []
+    for spec in specs:
+        digest = figure_digest(spec, style, rc)
+        if not force and manifest.get(spec['output']) == digest and os.path.exists(spec['output']):
+            print(f"변경 없음, 건너뜀: {spec['output']}")
+        else:
+            stale.append((spec, digest))
+
+    rendered = []
+
+    def finish(output, digest):
+        manifest[output] = digest
+        _save_manifest(manifest)
+        rendered.append(output)
+        print(f"그래프 저장됨: {output}")
+
+    if len(stale) <= 1 or max_workers == 1:
+        # 한 장뿐이면 프로세스를 띄우지 않고 바로 렌더링 (호출한 프로세스의 백엔드는 바꾸지 않음)
+        plot_style.apply_style(style, **rc)
+        for spec, digest in stale:
+            finish(render_figure(spec), digest)
+    else:
+        workers = min(max_workers or os.cpu_count() or 1, len(stale))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(style, rc)) as executor:
+            futures = {executor.submit(render_figure, spec): digest for spec, digest in stale}
+            for future in as_completed(futures):
+                finish(future.result(), futures[future])
+    return rendered
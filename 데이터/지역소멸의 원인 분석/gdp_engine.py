@@ -0,0 +1,168 @@
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+import csv_loader
+from region_names import CAPITAL_REGIONS, canonicalize_regions
+
+# 시도별 지역내총생산 원본 (연도별 '2015_명목' 형태 컬럼)
+GRDP_FILE = '03_일자리, 인프라 데이터/시도별_지역내총생산_2015_2023.csv'
+GRDP_ROW = '지역내총생산(시장가격)'
+MEASURE = '명목'
+
+# 계산 결과 캐시 (시도 × 연도별 지표) 와 원본 해시
+CACHE_FILE = os.path.join('.cache', 'gdp_metrics.parquet')
+STATE_FILE = os.path.join('.cache', 'gdp_metrics.json')
+
+# 파이 차트에서 '기타'로 묶는 비중 기준 (%)
+OTHERS_THRESHOLD = 3
+
+METRIC_COLUMNS = ['연도', '시도', 'GDP', '비율', '순위', '누적비율', '증가율']
+
+
+# 원본을 시도 × 연도 행렬로 읽기 (전국 등 시도가 아닌 행은 제외)
+def read_matrix(path=GRDP_FILE, measure=MEASURE):
+    df = csv_loader.read_csv(path)
+    df = df[df['경제활동별'] == GRDP_ROW]
+    pattern = re.compile(rf'^(\d{{4}})_{re.escape(measure)}$')
+    year_columns = {col: int(match.group(1)) for col in df.columns if (match := pattern.match(str(col)))}
+
+    regions = canonicalize_regions(df['시도별'].astype('string').str.strip())
+    matrix = df[list(year_columns)].apply(pd.to_numeric, errors='coerce')
+    matrix.index = pd.Index(regions.to_numpy(), name='시도')
+    matrix.columns = pd.Index(list(year_columns.values()), name='연도')
+    return matrix[matrix.index.notna()].astype(float).sort_index(axis=1)
+
+
+# 행렬 전체에 대해 한 번에 지표 계산: 비중, 순위, 누적 비중(큰 지역부터), 전년 대비 증가율
+# previous: 첫 열의 증가율 계산에 쓸 직전 연도 GDP (시도별 Series, 없으면 결측)
+def compute_metrics(matrix, previous=None):
+    values = matrix.to_numpy()
+    shares = values / np.nansum(values, axis=0) * 100
+
+    # 연도(열)마다 비중이 큰 순서로 정렬해 누적합을 구한 뒤 원래 위치로 되돌림
+    order = np.argsort(-np.nan_to_num(shares, nan=-np.inf), axis=0, kind='stable')
+    cumulative = np.empty_like(shares)
+    np.put_along_axis(cumulative, order, np.nancumsum(np.take_along_axis(shares, order, axis=0), axis=0), axis=0)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(matrix) + 1)[:, None].repeat(values.shape[1], axis=1), axis=0)
+
+    prior = np.empty_like(values)
+    prior[:, 1:] = values[:, :-1]
+    prior[:, 0] = np.nan if previous is None else previous.reindex(matrix.index).to_numpy()
+    growth = (values / prior - 1) * 100
+
+    n_regions, n_years = values.shape
+    return pd.DataFrame({
+        '연도': np.tile(matrix.columns.to_numpy(), n_regions).astype('int16'),
+        '시도': np.repeat(matrix.index.to_numpy(), n_years),
+        'GDP': values.ravel(),
+        '비율': shares.ravel(),
+        '순위': ranks.ravel().astype('int16'),
+        '누적비율': cumulative.ravel(),
+        '증가율': growth.ravel(),
+    })
+
+
+# 연도별 집중도: 전체 GDP, 수도권 비중, HHI (비중(%)의 제곱합, 0~10000)
+def concentration(metrics):
+    capital = metrics['시도'].isin(CAPITAL_REGIONS)
+    summary = pd.DataFrame({
+        '연도': metrics['연도'],
+        'GDP': metrics['GDP'],
+        '수도권비율': metrics['비율'].where(capital, 0),
+        'HHI': metrics['비율'] ** 2,
+    }).groupby('연도').sum()
+    summary['전체증가율'] = summary['GDP'].pct_change() * 100
+    return summary.rename(columns={'GDP': '전체GDP'})
+
+
+# 파이 차트용: 비중이 threshold 미만인 시도를 연도별 '기타'로 합침 ('기타'는 마지막)
+def pie_table(metrics, threshold=OTHERS_THRESHOLD):
+    label = metrics['시도'].where(metrics['비율'] >= threshold, '기타')
+    table = (metrics.assign(시도=label, 기타=label == '기타')
+             .groupby(['연도', '기타', '시도'], sort=False)[['GDP', '비율']].sum()
+             .reset_index())
+    return table.sort_values(['연도', '기타'], kind='stable').drop(columns='기타').reset_index(drop=True)
+
+
+def _load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save(metrics, state):
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    tmp_file = f'{CACHE_FILE}.{os.getpid()}.tmp'
+    metrics.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, CACHE_FILE)
+
+    tmp_file = f'{STATE_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, STATE_FILE)
+
+
+# 원본이 바뀐 연도만 다시 계산해서 캐시 갱신 (새 연도가 추가되면 그 연도와 직전 연도 값만 사용)
+# 어떤 연도의 값이 바뀌면 다음 연도의 증가율도 다시 계산
+def update(path=GRDP_FILE, force=False):
+    state = _load_state()
+    digest = csv_loader.file_digest(path)
+    if not force and state.get('digest') == digest and os.path.exists(CACHE_FILE):
+        return pd.read_parquet(CACHE_FILE)
+
+    matrix = read_matrix(path)
+    cached = None if force or not os.path.exists(CACHE_FILE) else pd.read_parquet(CACHE_FILE)
+    if cached is None or set(cached['시도']) != set(matrix.index):
+        stale = list(matrix.columns)
+    else:
+        old = cached.pivot(index='시도', columns='연도', values='GDP').reindex(index=matrix.index)
+        stale = [
+            year for year in matrix.columns
+            if year not in old.columns or not np.allclose(old[year], matrix[year], equal_nan=True)
+        ]
+        stale = sorted(set(stale) | {year + 1 for year in stale if year + 1 in matrix.columns})
+
+    if stale:
+        # 바뀐 연도끼리 연속 구간으로 나눠서 구간마다 행렬 한 번에 계산
+        years = list(matrix.columns)
+        parts = []
+        for _, run in pd.Series(stale).groupby(np.cumsum(np.diff([-2] + stale) != 1)):
+            start = years.index(run.iloc[0])
+            previous = matrix[years[start - 1]] if start > 0 else None
+            parts.append(compute_metrics(matrix[run.tolist()], previous))
+        keep = [] if cached is None else [cached[cached['연도'].isin(matrix.columns) & ~cached['연도'].isin(stale)]]
+        metrics = pd.concat(keep + parts, ignore_index=True)[METRIC_COLUMNS]
+        metrics = metrics.sort_values(['연도', '순위'], ignore_index=True)
+        print(f"GDP 지표 계산: {', '.join(str(year) for year in stale)}년")
+    else:
+        metrics = cached
+
+    _save(metrics, {'digest': digest, 'path': path, 'years': [int(year) for year in matrix.columns]})
+    return metrics
+
+
+# 차트·대시보드에서 사용하는 진입점 (캐시가 최신이면 원본을 읽지 않음)
+def load_metrics(path=GRDP_FILE):
+    return update(path)
+
+
+if __name__ == '__main__':
+    import sys
+
+    # 예: python gdp_engine.py --force
+    metrics = update(force='--force' in sys.argv[1:])
+    summary = concentration(metrics)
+    print("\n=== 연도별 GDP 집중도 ===")
+    print(summary.round(2).to_string())
+
+    latest = metrics[metrics['연도'] == metrics['연도'].max()]
+    print(f"\n{latest['연도'].iloc[0]}년 시도별 비중 (상위부터):")
+    for _, row in latest.sort_values('순위').iterrows():
+        print(f"{row['순위']:>2}. {row['시도']}: {row['비율']:.1f}% (누적 {row['누적비율']:.1f}%, 전년 대비 {row['증가율']:+.1f}%)")
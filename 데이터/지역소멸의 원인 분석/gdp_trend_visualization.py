@@ -1,29 +1,14 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+import gdp_engine
+from plot_style import apply_style
+
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
-
-# GDP 데이터 로드 및 전처리
-gdp_df = pd.read_csv('03_일자리, 인프라 데이터/시도별_지역내총생산_2015_2023.csv')
-gdp_df = gdp_df[gdp_df['경제활동별'] == '지역내총생산(시장가격)']
-
-# 필요한 열만 선택 (시도와 연도별 명목 GDP)
-years = range(2015, 2024)
-columns = ['시도별'] + [f'{year}_명목' for year in years]
-gdp_processed = gdp_df[columns].copy()
-gdp_processed.columns = ['시도'] + [str(year) for year in years]
-
-# 데이터 재구성 (긴 형태로)
-gdp_long = pd.melt(gdp_processed, 
-                   id_vars=['시도'],
-                   value_vars=[str(year) for year in years],
-                   var_name='연도',
-                   value_name='GDP')
-gdp_long['연도'] = gdp_long['연도'].astype(int)
-gdp_long['GDP'] = gdp_long['GDP'].astype(float)
+apply_style()
+
+# GDP 지표 로드 (gdp_engine 캐시, 시도 × 연도 긴 형태)
+gdp_long = gdp_engine.load_metrics()[['시도', '연도', 'GDP']]
 
 # 그래프 크기 설정
 plt.figure(figsize=(15, 10))
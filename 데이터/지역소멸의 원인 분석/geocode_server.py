@@ -0,0 +1,153 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# 카카오 주소 검색 API를 흉내 내는 로컬 서버 (오프라인 테스트·성능 측정용)
+# 같은 주소에는 항상 같은 좌표를 돌려주고, 지연·속도 제한·일시 오류·검색 실패를 설정할 수 있음
+ADDRESS_PATH = '/v2/local/search/address.json'
+
+# 대한민국 대략적인 범위 (경도 최소, 위도 최소, 경도 최대, 위도 최대)
+KOREA_BOUNDS = (126.0, 33.1, 129.6, 38.6)
+
+
+# 주소 해시로 정한 가짜 좌표와 결과 유무 (not_found_rate 비율만큼은 결과 없음)
+def fake_document(address, not_found_rate=0.0):
+    digest = hashlib.sha1(address.encode('utf-8')).digest()
+    if int.from_bytes(digest[:2], 'big') / 0xFFFF < not_found_rate:
+        return None
+    fx = int.from_bytes(digest[2:6], 'big') / 0xFFFFFFFF
+    fy = int.from_bytes(digest[6:10], 'big') / 0xFFFFFFFF
+    x = KOREA_BOUNDS[0] + fx * (KOREA_BOUNDS[2] - KOREA_BOUNDS[0])
+    y = KOREA_BOUNDS[1] + fy * (KOREA_BOUNDS[3] - KOREA_BOUNDS[1])
+    return {'address_name': address, 'x': f'{x:.7f}', 'y': f'{y:.7f}'}
+
+
+class GeocodeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        parsed = urlparse(self.path)
+        if parsed.path != ADDRESS_PATH:
+            self._reply(404, {'msg': 'not found'})
+            return
+
+        with server.lock:
+            server.requests += 1
+            count = server.requests
+            now = time.monotonic()
+            # 1초 창 안의 요청 수가 rate_limit을 넘으면 429
+            server.window = [t for t in server.window if now - t < 1.0]
+            limited = server.rate_limit and len(server.window) >= server.rate_limit
+            if not limited:
+                server.window.append(now)
+            else:
+                server.limited += 1
+
+        if server.latency:
+            time.sleep(server.latency)
+        if limited:
+            self._reply(429, {'msg': 'rate limit exceeded'}, {'Retry-After': '1'})
+            return
+        if server.error_every and count % server.error_every == 0:
+            self._reply(503, {'msg': 'temporary error'})
+            return
+
+        query = parse_qs(parsed.query).get('query', [''])[0]
+        document = fake_document(query, server.not_found_rate) if query else None
+        documents = [document] if document else []
+        self._reply(200, {'meta': {'total_count': len(documents)}, 'documents': documents})
+
+    def _reply(self, status, body, headers=None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# 서버 생성 (port=0이면 빈 포트 사용)
+# latency: 요청당 지연(초), rate_limit: 초당 허용 요청 수(0이면 무제한),
+# error_every: n번째 요청마다 503, not_found_rate: 검색 결과가 없는 주소 비율
+def make_server(host='127.0.0.1', port=0, latency=0.0, rate_limit=0, error_every=0, not_found_rate=0.0):
+    server = ThreadingHTTPServer((host, port), GeocodeHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.rate_limit = rate_limit
+    server.error_every = error_every
+    server.not_found_rate = not_found_rate
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.limited = 0
+    server.window = []
+    return server
+
+
+# 백그라운드 스레드에서 서버 실행, (server, 조회 URL) 반환 (끝나면 server.shutdown())
+def serve_in_background(**kwargs):
+    server = make_server(**kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f'http://{host}:{port}{ADDRESS_PATH}'
+
+
+# 가짜 주소 n개(중복 포함)를 대체 서버로 변환하면서 처리량 측정
+def benchmark(n, workers, rate, cache_path, **server_options):
+    import geocoder
+
+    server, url = serve_in_background(**server_options)
+    addresses = [f'서울특별시 중구 을지로 {i % max(1, n * 4 // 5)}' for i in range(n)]
+    try:
+        started = time.monotonic()
+        result = geocoder.geocode(
+            addresses, url=url, max_workers=workers, rate=rate, burst=max(1, int(rate)), cache_path=cache_path
+        )
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+    print(f"{n:,}건 {elapsed:.2f}초 ({n / elapsed:,.0f}건/초), 서버 요청 {server.requests:,}건, "
+          f"429 응답 {server.limited:,}건, 좌표 누락 {result['위도'].isna().sum():,}건")
+    return result
+
+
+if __name__ == '__main__':
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(description='오프라인 테스트용 주소 검색 대체 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.02, help='요청당 지연 (초)')
+    parser.add_argument('--rate-limit', type=int, default=0, help='초당 허용 요청 수 (0이면 무제한)')
+    parser.add_argument('--error-every', type=int, default=0, help='n번째 요청마다 503 응답')
+    parser.add_argument('--not-found-rate', type=float, default=0.0, help='검색 결과가 없는 주소 비율')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='서버를 띄우지 않고 주소 N건으로 처리량 측정')
+    parser.add_argument('--workers', type=int, default=8, help='측정 시 동시 요청 수')
+    parser.add_argument('--rate', type=float, default=100, help='측정 시 초당 요청 수')
+    args = parser.parse_args()
+
+    options = {
+        'latency': args.latency, 'rate_limit': args.rate_limit,
+        'error_every': args.error_every, 'not_found_rate': args.not_found_rate,
+    }
+    if args.benchmark:
+        # 측정용 캐시는 매번 새로 만듦 (실제 캐시를 건드리지 않음)
+        cache_path = os.path.join('.cache', 'geocode_benchmark.jsonl')
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        benchmark(args.benchmark, args.workers, args.rate, cache_path, **options)
+    else:
+        server = make_server(args.host, args.port, **options)
+        print(f"대체 서버 실행 중: http://{args.host}:{args.port}{ADDRESS_PATH}")
+        print(f"geocoder에서 사용: {'set' if os.name == 'nt' else 'export'} GEOCODER_URL=http://{args.host}:{args.port}{ADDRESS_PATH}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
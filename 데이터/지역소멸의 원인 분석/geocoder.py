@@ -0,0 +1,233 @@
+import json
+import os
+import random
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+import requests
+
+from region_names import canonicalize_regions
+
+# 카카오 주소 검색 API (GEOCODER_URL 환경 변수로 geocode_server.py 같은 대체 서버 지정 가능)
+KAKAO_URL = 'https://dapi.kakao.com/v2/local/search/address.json'
+# API 키는 코드에 넣지 않고 환경 변수에서 읽음
+API_KEY_ENV = 'KAKAO_API_KEY'
+URL_ENV = 'GEOCODER_URL'
+
+# 정규화된 주소 → 좌표 캐시 (한 줄에 결과 하나, 중단돼도 이미 받은 결과는 남음)
+CACHE_FILE = os.path.join('.cache', 'geocode.jsonl')
+
+# 초당 요청 수와 순간 최대 요청 수 (토큰 버킷)
+RATE_PER_SECOND = 10
+BURST = 10
+MAX_WORKERS = 8
+
+# 재시도: 429/5xx/연결 오류는 지수 백오프로 다시 요청
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 0.5
+TIMEOUT_SECONDS = 10
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# 진행 상황 출력 간격 (건)
+PROGRESS_EVERY = 500
+
+
+# 주소 정규화: 유니코드 정규화, 괄호 안 참고항목·쉼표 뒤 상세주소 제거, 공백 정리, 시도명 표준화
+# 같은 장소를 가리키는 표기를 하나로 모아서 같은 주소는 한 번만 조회
+def normalize_addresses(addresses):
+    addresses = pd.Series(addresses, dtype='string')
+    normalized = addresses.map(lambda value: unicodedata.normalize('NFC', value), na_action='ignore').astype('string')
+    normalized = (normalized
+                  .str.replace(r'\([^)]*\)', ' ', regex=True)
+                  .str.split(',').str[0]
+                  .str.replace(r'\s+', ' ', regex=True)
+                  .str.strip())
+    parts = normalized.str.split(' ', n=1, expand=True).reindex(columns=[0, 1])
+    sido = canonicalize_regions(parts[0]).astype('string').fillna(parts[0])
+    rest = parts[1].fillna('')
+    normalized = (sido + ' ' + rest).str.strip()
+    return normalized.mask(normalized == '')
+
+
+def normalize_address(address):
+    return normalize_addresses([address]).iloc[0]
+
+
+# 토큰 버킷: 초당 rate개씩 토큰이 차고 최대 burst개까지 쌓임 (여러 스레드가 공유)
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# 캐시 읽기 (같은 주소가 여러 번 있으면 마지막 결과 사용, 깨진 줄은 무시)
+def load_cache(path=CACHE_FILE):
+    cache = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                cache[entry['address']] = (entry['lat'], entry['lng'])
+    except FileNotFoundError:
+        pass
+    return cache
+
+
+# 캐시 파일 정리: 주소별 마지막 결과만 남기고 다시 씀
+def compact_cache(path=CACHE_FILE):
+    cache = load_cache(path)
+    tmp_file = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        for address, (lat, lng) in cache.items():
+            f.write(json.dumps({'address': address, 'lat': lat, 'lng': lng}, ensure_ascii=False) + '\n')
+    os.replace(tmp_file, path)
+    return len(cache)
+
+
+class GeocodeError(Exception):
+    pass
+
+
+# 스레드마다 연결을 재사용하는 세션
+_local = threading.local()
+
+
+def _session(api_key):
+    if getattr(_local, 'session', None) is None:
+        _local.session = requests.Session()
+        if api_key:
+            _local.session.headers['Authorization'] = f'KakaoAK {api_key}'
+    return _local.session
+
+
+# 주소 하나 조회: 찾으면 (위도, 경도), 검색 결과가 없으면 (None, None)
+# 재시도 후에도 실패하면 GeocodeError (캐시에 남기지 않아 다음 실행에서 다시 조회)
+def lookup(address, url, api_key, bucket):
+    for attempt in range(MAX_RETRIES + 1):
+        bucket.acquire()
+        try:
+            response = _session(api_key).get(url, params={'query': address}, timeout=TIMEOUT_SECONDS)
+            if response.status_code not in RETRY_STATUS:
+                response.raise_for_status()
+                documents = response.json().get('documents')
+                if documents:
+                    return float(documents[0]['y']), float(documents[0]['x'])
+                return None, None
+            error = f'HTTP {response.status_code}'
+            retry_after = response.headers.get('Retry-After')
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error, retry_after = str(e), None
+        except (requests.HTTPError, ValueError, KeyError) as e:
+            raise GeocodeError(f'{address}: {e}') from e
+
+        if attempt < MAX_RETRIES:
+            delay = float(retry_after) if retry_after and re.fullmatch(r'\d+(\.\d+)?', retry_after) else \
+                BACKOFF_SECONDS * 2 ** attempt * (1 + random.random())
+            time.sleep(delay)
+    raise GeocodeError(f'{address}: {error}')
+
+
+# 주소 목록을 좌표로 변환 (입력 순서대로 위도, 경도 컬럼을 가진 DataFrame)
+# 정규화·중복 제거 후 캐시에 없는 주소만 동시에 조회하고, 받은 결과는 바로 캐시에 추가
+# retry_missing=True면 이전에 검색 결과가 없었던 주소도 다시 조회
+def geocode(addresses, url=None, api_key=None, max_workers=MAX_WORKERS, rate=RATE_PER_SECOND, burst=BURST,
+            cache_path=CACHE_FILE, retry_missing=False):
+    url = url or os.environ.get(URL_ENV) or KAKAO_URL
+    api_key = api_key or os.environ.get(API_KEY_ENV)
+    if url == KAKAO_URL and not api_key:
+        raise RuntimeError(f"카카오 API 키가 없습니다. 환경 변수 {API_KEY_ENV}를 설정하세요.")
+
+    addresses = pd.Series(addresses)
+    normalized = normalize_addresses(addresses)
+    cache = load_cache(cache_path)
+    unique = normalized.dropna().unique()
+    pending = [
+        address for address in unique
+        if address not in cache or (retry_missing and cache[address][0] is None)
+    ]
+    print(f"주소 {len(addresses):,}건 → 고유 주소 {len(unique):,}건, 조회 필요 {len(pending):,}건")
+
+    failed = []
+    if pending:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        bucket = TokenBucket(rate, burst)
+        started = time.monotonic()
+        with open(cache_path, 'a', encoding='utf-8') as cache_file, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(lookup, address, url, api_key, bucket): address for address in pending}
+            for done, future in enumerate(as_completed(futures), 1):
+                address = futures[future]
+                try:
+                    lat, lng = future.result()
+                except GeocodeError as e:
+                    failed.append(address)
+                    print(f"주소 변환 오류: {e}")
+                else:
+                    cache[address] = (lat, lng)
+                    cache_file.write(json.dumps({'address': address, 'lat': lat, 'lng': lng}, ensure_ascii=False) + '\n')
+                    cache_file.flush()
+                if done % PROGRESS_EVERY == 0 or done == len(pending):
+                    elapsed = time.monotonic() - started
+                    print(f"{done:,}/{len(pending):,} 조회 ({done / elapsed:.1f}건/초, 실패 {len(failed):,}건)")
+
+    coords = normalized.map(lambda address: cache.get(address, (None, None)) if pd.notna(address) else (None, None))
+    result = pd.DataFrame(coords.tolist(), index=addresses.index, columns=['위도', '경도'], dtype='float64')
+    result.insert(0, '정규화주소', normalized)
+    if failed:
+        print(f"조회 실패 {len(failed):,}건은 다음 실행에서 다시 조회합니다.")
+    return result
+
+
+# DataFrame의 주소 컬럼에 위도, 경도 컬럼 추가
+def geocode_frame(df, column='주소', **kwargs):
+    result = geocode(df[column], **kwargs)
+    df = df.copy()
+    df['위도'] = result['위도'].to_numpy()
+    df['경도'] = result['경도'].to_numpy()
+    return df
+
+
+if __name__ == '__main__':
+    import argparse
+
+    import csv_loader
+
+    parser = argparse.ArgumentParser(description='CSV의 주소 컬럼을 좌표로 변환 (캐시에 있는 주소는 다시 조회하지 않음)')
+    parser.add_argument('input', help='입력 CSV')
+    parser.add_argument('output', help='결과 CSV (위도, 경도 컬럼 추가)')
+    parser.add_argument('--column', default='주소', help='주소 컬럼 이름')
+    parser.add_argument('--url', help=f'조회 서버 주소 (기본: {URL_ENV} 환경 변수 또는 카카오 API)')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='동시 요청 수')
+    parser.add_argument('--rate', type=float, default=RATE_PER_SECOND, help='초당 최대 요청 수')
+    parser.add_argument('--retry-missing', action='store_true', help='검색 결과가 없던 주소도 다시 조회')
+    args = parser.parse_args()
+
+    df = geocode_frame(
+        csv_loader.read_csv(args.input), args.column, url=args.url, max_workers=args.workers,
+        rate=args.rate, burst=max(1, int(args.rate)), retry_missing=args.retry_missing
+    )
+    df.to_csv(args.output, index=False, encoding='utf-8-sig')
+    missing = df['위도'].isna() | df['경도'].isna()
+    print(f"좌표 변환 완료: {args.output} (좌표 누락 {missing.sum():,}건)")
@@ -0,0 +1,190 @@
+import functools
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import shapely
+from matplotlib.collections import PathCollection
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.path import Path
+
+import boundary_store
+import plot_style
+
+# 렌더링된 배경 지도(시도 경계) 캐시 위치
+CACHE_DIR = os.path.join('.cache', 'basemap')
+
+# 대한민국 전체 범위 (경도 최소, 위도 최소, 경도 최대, 위도 최대)
+KOREA_BOUNDS = (124.5, 33.0, 131.0, 38.7)
+
+# folium HeatMap과 같은 기본 그라데이션
+DEFAULT_GRADIENT = {0.0: 'blue', 0.4: 'lime', 0.65: 'yellow', 1.0: 'red'}
+
+# 이 값보다 밀도가 낮은 가장자리는 투명도를 점점 높임
+EDGE_FADE = 0.1
+
+LAND_COLOR = '#e8e8e8'
+BORDER_COLOR = '#ffffff'
+SEA_COLOR = '#c9dbe8'
+
+
+# 웹 메르카토르 투영 (x는 경도 그대로, y는 위도를 메르카토르 좌표로 변환한 값을 도 단위로 표시)
+def project(lon, lat):
+    lat = np.radians(np.asarray(lat, dtype=float))
+    return np.asarray(lon, dtype=float), np.degrees(np.log(np.tan(np.pi / 4 + lat / 2)))
+
+
+def _grid_shape(bounds, width_px):
+    x0, y0 = project(bounds[0], bounds[1])
+    x1, y1 = project(bounds[2], bounds[3])
+    height_px = int(round(width_px * (y1 - y0) / (x1 - x0)))
+    return (float(x0), float(y0), float(x1), float(y1)), height_px
+
+
+def _polygon_path(polygon):
+    rings = [np.asarray(polygon.exterior.coords)] + [np.asarray(ring.coords) for ring in polygon.interiors]
+    vertices = []
+    codes = []
+    for ring in rings:
+        x, y = project(ring[:, 0], ring[:, 1])
+        vertices.append(np.column_stack([x, y]))
+        ring_codes = np.full(len(ring), Path.LINETO, dtype=Path.code_type)
+        ring_codes[0] = Path.MOVETO
+        ring_codes[-1] = Path.CLOSEPOLY
+        codes.append(ring_codes)
+    return Path(np.concatenate(vertices), np.concatenate(codes))
+
+
+def _new_figure(extent, width_px, height_px, dpi=100):
+    fig = plt.figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.set_xlim(extent[0], extent[2])
+    ax.set_ylim(extent[1], extent[3])
+    ax.set_axis_off()
+    return fig, ax
+
+
+def _basemap_key(level, tolerance, extent, width_px, height_px):
+    store_file = boundary_store._store_path(level, tolerance)
+    stat = os.stat(store_file)
+    source = f'{os.path.abspath(store_file)}|{stat.st_mtime_ns}|{extent}|{width_px}x{height_px}'
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+
+# 시도 경계 배경 지도 (RGBA 배열) — 같은 크기·범위면 디스크 캐시 재사용
+@functools.lru_cache(maxsize=None)
+def basemap(extent, width_px, height_px, level='sido'):
+    tolerance = boundary_store.pick_tolerance(level, width_px, extent_deg=extent[2] - extent[0])
+    key = _basemap_key(level, tolerance, extent, width_px, height_px)
+    cache_file = os.path.join(CACHE_DIR, f'{level}_{width_px}x{height_px}.{key}.npy')
+    if os.path.exists(cache_file):
+        return np.load(cache_file)
+
+    boundaries = boundary_store.load_boundaries(level, tolerance)
+    polygons = shapely.get_parts(boundaries['geometry'].to_numpy())
+    paths = [_polygon_path(polygon) for polygon in polygons if not polygon.is_empty]
+
+    fig, ax = _new_figure(extent, width_px, height_px)
+    fig.patch.set_facecolor(SEA_COLOR)
+    ax.add_collection(PathCollection(paths, facecolor=LAND_COLOR, edgecolor=BORDER_COLOR, linewidth=0.8))
+    fig.canvas.draw()
+    image = np.asarray(fig.canvas.buffer_rgba()).copy()
+    plt.close(fig)
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp.npy'
+    np.save(tmp_file, image)
+    os.replace(tmp_file, cache_file)
+    return image
+
+
+# 2차원 가우시안 블러 (FFT 합성곱, 가장자리는 0으로 채운 것으로 간주)
+def _gaussian_blur(grid, sigma):
+    radius = int(np.ceil(4 * sigma))
+    offsets = np.arange(-radius, radius + 1)
+    kernel_1d = np.exp(-0.5 * (offsets / sigma) ** 2)
+    kernel = np.outer(kernel_1d, kernel_1d)
+
+    shape = (grid.shape[0] + 2 * radius, grid.shape[1] + 2 * radius)
+    result = np.fft.irfft2(np.fft.rfft2(grid, shape) * np.fft.rfft2(kernel, shape), shape)
+    return result[radius:radius + grid.shape[0], radius:radius + grid.shape[1]]
+
+
+# 가중치가 있는 점들의 밀도 격자 (0~1로 정규화)
+# folium HeatMap처럼 점마다 최소 가중치(min_opacity)를 보장하고, 한 점이 최대값을 넘지 않도록 자름
+def density_grid(lon, lat, weights, extent, width_px, height_px, radius_px=25, max_val=1.0, min_opacity=0.3):
+    x, y = project(lon, lat)
+    weights = np.maximum(np.asarray(weights, dtype=float) / max_val, min_opacity)
+    grid, _, _ = np.histogram2d(
+        y, x, bins=(height_px, width_px),
+        range=((extent[1], extent[3]), (extent[0], extent[2])),
+        weights=weights
+    )
+    density = _gaussian_blur(grid, sigma=radius_px / 2)
+    return np.clip(density, 0, 1)
+
+
+def _gradient_cmap(gradient):
+    stops = sorted(gradient.items())
+    return LinearSegmentedColormap.from_list('heat', stops)
+
+
+# 한 장 렌더링: 배경 지도 + 히트맵 + 지점 표시를 PNG로 저장
+# lon, lat, weights: 지점별 경도·위도·가중치 배열, labels: 지점별 표시 문자열 (선택)
+def render_heatmap(output_file, lon, lat, weights, labels=None, title=None, width_px=1000,
+                   bounds=KOREA_BOUNDS, radius_px=25, max_val=1.0, min_opacity=0.3,
+                   gradient=DEFAULT_GRADIENT, heat_alpha=0.8):
+    extent, height_px = _grid_shape(bounds, width_px)
+    density = density_grid(lon, lat, weights, extent, width_px, height_px, radius_px, max_val, min_opacity)
+
+    heat = _gradient_cmap(gradient)(density)
+    # 밀도가 낮은 가장자리는 점점 투명하게 (배경 지도가 보이도록)
+    heat[..., 3] = heat_alpha * np.clip(density / EDGE_FADE, 0, 1)
+
+    fig, ax = _new_figure(extent, width_px, height_px)
+    try:
+        ax.imshow(basemap(extent, width_px, height_px), extent=(extent[0], extent[2], extent[1], extent[3]),
+                  origin='upper', interpolation='nearest')
+    except FileNotFoundError as e:
+        print(f"배경 지도 없이 렌더링합니다: {e}")
+    ax.imshow(heat, extent=(extent[0], extent[2], extent[1], extent[3]), origin='lower', interpolation='bilinear')
+
+    x, y = project(lon, lat)
+    ax.scatter(x, y, s=50, c='white', edgecolors='black', linewidths=1, alpha=0.7, zorder=3)
+    if labels is not None:
+        for xi, yi, label in zip(x, y, labels):
+            ax.annotate(label, (xi, yi), xytext=(6, 6), textcoords='offset points', fontsize=8, zorder=4)
+    if title:
+        ax.text(0.02, 0.98, title, transform=ax.transAxes, fontsize=14, va='top', fontweight='bold')
+
+    fig.savefig(output_file, dpi=100)
+    plt.close(fig)
+    return output_file
+
+
+def _render_job(job):
+    return render_heatmap(**job)
+
+
+# 작업 프로세스 초기화: 화면 없는 Agg 백엔드와 한글 폰트·공통 스타일 (모듈을 import한 쪽 백엔드는 그대로)
+def _init_worker():
+    matplotlib.use('Agg')
+    plot_style.apply_style()
+
+
+# 여러 장(예: 연도별)을 프로세스 풀로 렌더링 — job은 render_heatmap 인자 dict
+def render_heatmaps(jobs, max_workers=None):
+    # 배경 지도는 작업자들이 동시에 만들지 않도록 먼저 한 번 캐시
+    for width_px, bounds in {(job.get('width_px', 1000), job.get('bounds', KOREA_BOUNDS)) for job in jobs}:
+        extent, height_px = _grid_shape(bounds, width_px)
+        try:
+            basemap(extent, width_px, height_px)
+        except FileNotFoundError:
+            pass
+    # 한글 라벨용 폰트와 공통 스타일은 작업 프로세스마다 한 번 적용
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        for output_file in executor.map(_render_job, jobs):
+            print(f"PNG 파일 저장됨: {output_file}")
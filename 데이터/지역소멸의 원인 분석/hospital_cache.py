@@ -0,0 +1,105 @@
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# 병원정보서비스 월별 엑셀 파일 위치
+HOSPITAL_DIR = os.path.join('병원', '전국 병의원 및 약국 현황')
+
+# 변환된 스냅샷(Parquet) 저장 위치
+CACHE_DIR = os.path.join('.cache', 'hospital')
+
+# 스크립트들이 실제로 사용하는 컬럼만 보관 (좌표 컬럼은 파일마다 대소문자가 달라 둘 다 허용)
+HOSPITAL_COLUMNS = ['시도코드명', '시군구코드명', '종별코드명', '주소', '좌표(X)', '좌표(Y)', '좌표(x)', '좌표(y)']
+CATEGORY_COLUMNS = ['시도코드명', '시군구코드명', '종별코드명']
+COORD_COLUMNS = {'좌표(x)': '좌표(X)', '좌표(y)': '좌표(Y)'}
+
+
+def hospital_excel_path(year, month):
+    return os.path.join(HOSPITAL_DIR, f'병원정보서비스 {year}.{month}.xlsx')
+
+
+# 원본 경로, 크기, 수정시각으로 캐시 키 생성 (내용이 바뀌면 키도 바뀜)
+def _cache_key(excel_file):
+    stat = os.stat(excel_file)
+    source = f'{os.path.abspath(excel_file)}|{stat.st_size}|{stat.st_mtime_ns}'
+    return hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+
+def _cache_path(excel_file):
+    name = os.path.splitext(os.path.basename(excel_file))[0]
+    return os.path.join(CACHE_DIR, f'{name}.{_cache_key(excel_file)}.parquet')
+
+
+# 엑셀을 한 번만 읽어서 타입을 정리한 DataFrame 생성
+def _read_excel_typed(excel_file):
+    df = pd.read_excel(excel_file, usecols=lambda col: col in HOSPITAL_COLUMNS)
+    df = df.rename(columns=COORD_COLUMNS)
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    if '주소' in df.columns:
+        df['주소'] = df['주소'].astype('string')
+    for col in ['좌표(X)', '좌표(Y)']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+    return df
+
+
+# 같은 원본에서 만들어진 이전 버전 스냅샷 정리
+def _remove_stale(excel_file, keep_path):
+    if not os.path.isdir(CACHE_DIR):
+        return
+    prefix = os.path.splitext(os.path.basename(excel_file))[0] + '.'
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        if name.startswith(prefix) and name.endswith('.parquet') and path != keep_path:
+            os.remove(path)
+
+
+def build_snapshot(excel_file):
+    cache_file = _cache_path(excel_file)
+    if os.path.exists(cache_file):
+        return cache_file
+
+    df = _read_excel_typed(excel_file)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    # 다른 프로세스가 동시에 쓰는 경우를 대비해 임시 파일에 쓴 뒤 교체
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+    df.to_parquet(tmp_file, index=False)
+    os.replace(tmp_file, cache_file)
+    _remove_stale(excel_file, cache_file)
+    return cache_file
+
+
+def load_hospital_snapshot(year, month, columns=None):
+    excel_file = hospital_excel_path(year, month)
+    cache_file = build_snapshot(excel_file)
+    return pd.read_parquet(cache_file, columns=columns)
+
+
+def _build_one(year_month):
+    year, month = year_month
+    return year, month, build_snapshot(hospital_excel_path(year, month))
+
+
+# 여러 (연도, 월) 스냅샷을 프로세스 풀로 한 번에 변환
+def build_snapshots(year_months, max_workers=None):
+    year_months = [(str(year), str(month)) for year, month in year_months]
+    results = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for year, month, cache_file in executor.map(_build_one, year_months):
+            results[(year, month)] = cache_file
+            print(f'{year}년 {month}월 스냅샷: {cache_file}')
+    return results
+
+
+if __name__ == '__main__':
+    import sys
+
+    # 예: python hospital_cache.py 2024.12 2025.3
+    targets = [arg.split('.') for arg in sys.argv[1:]]
+    build_snapshots(targets)
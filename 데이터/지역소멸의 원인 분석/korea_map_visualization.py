@@ -1,16 +1,15 @@
 import pandas as pd
 import folium
-from folium import plugins
-import json
-import requests
-import io
-import geopandas as gpd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from boundary_store import load_geojson
+from choropleth import add_choropleth
+from region_names import canonicalize_regions
+from plot_style import apply_style
+
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 읽기
 df = pd.read_csv('연도별_시군구_전입률_전출률_2013_2024 - 완료.csv')
@@ -21,25 +20,21 @@ capital_area = ['서울특별시', '경기도', '인천광역시']
 # 수도권/비수도권 구분
 df['region_type'] = df['시도'].apply(lambda x: '수도권' if x in capital_area else '비수도권')
 
-# 2024년 데이터만 선택
-df_2024 = df[df['연도'] == 2024].copy()
+# 연도·시도별 데이터 집계 (지도에서 연도 전환)
+yearly_data = df.groupby(['연도', '시도'])[['전입', '전출']].sum().reset_index()
+yearly_data['순이동'] = yearly_data['전입'] - yearly_data['전출']
+# 경계 데이터와 같은 현재 시도명으로 통일 (강원도 → 강원특별자치도 등)
+yearly_data['시도'] = canonicalize_regions(yearly_data['시도']).astype(object).fillna(yearly_data['시도'])
 
-# 시도별 데이터 집계
-region_data = df_2024.groupby('시도')[['전입', '전출']].sum().reset_index()
-region_data['순이동'] = region_data['전입'] - region_data['전출']
+# 2024년 데이터만 선택
+region_data = yearly_data[yearly_data['연도'] == 2024].drop(columns='연도').reset_index(drop=True)
 
-# 대한민국 시도 경계 데이터 다운로드
-url = "https://raw.githubusercontent.com/southkorea/southkorea-maps/master/kostat/2013/json/skorea-provinces-2013-geo.json"
-response = requests.get(url)
-korea_geo = json.loads(response.text)
+# 대한민국 시도 경계 (로컬 경계 저장소, 약 1000px 폭 지도에 맞는 해상도)
+korea_geo = load_geojson('sido', width_px=1000)
 
 # 지도 생성
 m = folium.Map(location=[36.5, 127.5], zoom_start=7)
 
-# 색상 스케일 생성
-max_value = region_data['순이동'].abs().max()
-min_value = -max_value
-
 # 시도별 색상 매핑
 def get_color(value):
     if value > 0:
@@ -47,34 +42,14 @@ def get_color(value):
     else:
         return '#99ccff'  # 음수: 파란색 계열
 
-# 시도별 데이터 시각화
-for feature in korea_geo['features']:
-    sido_name = feature['properties']['name']
-    sido_data = region_data[region_data['시도'] == sido_name]
-    
-    if not sido_data.empty:
-        value = sido_data['순이동'].values[0]
-        color = get_color(value)
-        
-        # 팝업 내용 생성
-        popup_text = f"""
-        <b>{sido_name}</b><br>
-        전입: {sido_data['전입'].values[0]:,.0f}명<br>
-        전출: {sido_data['전출'].values[0]:,.0f}명<br>
-        순이동: {value:,.0f}명
-        """
-        
-        # 지도에 시도 경계 추가
-        folium.GeoJson(
-            feature,
-            style_function=lambda x, color=color: {
-                'fillColor': color,
-                'color': 'black',
-                'weight': 1,
-                'fillOpacity': 0.7
-            },
-            popup=folium.Popup(popup_text, max_width=300)
-        ).add_to(m)
+# 시도별 데이터 시각화 (단일 레이어, 연도 선택 가능, 기본 2024년)
+add_choropleth(
+    m, korea_geo, yearly_data, '순이동',
+    on='시도', year_column='연도', initial_year=2024,
+    popup_columns=['전입', '전출'],
+    popup_aliases=['시도', '순이동(명)', '전입(명)', '전출(명)'],
+    colors=get_color,
+)
 
 # 범례 추가
 legend_html = """
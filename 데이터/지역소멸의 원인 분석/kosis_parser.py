@@ -0,0 +1,122 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+import csv_loader
+
+# 시점 헤더에서 연도 추출 ('2015', '2015 년', '2015.03' 등)
+YEAR_PATTERN = re.compile(r'(\d{4})')
+
+# KOSIS 넓은 형태 표 명세
+# header_rows: 데이터 앞의 헤더 행 수
+# dims: 앞쪽 차원 컬럼에 붙일 이름 (시도, 시군구, 주택의 종류 등)
+# year_row: 연도가 적힌 헤더 행 (병합 셀처럼 비어 있으면 왼쪽 값으로 채움), years를 주면 사용 안 함
+# metric_row: 항목명이 적힌 헤더 행, metrics를 주면 사용 안 함
+# metrics: 연도 블록 안의 항목 이름 (위치 순서대로, 모든 블록이 같은 구성일 때)
+
+# 빈집비율_시_군_구.csv: 1행 시점, 2행 항목명, 연도마다 (빈집비율, 빈집수, 전체주택)
+VACANCY_RATE_SPEC = {
+    'header_rows': 2,
+    'dims': ['시군구'],
+    'year_row': 0,
+    'metrics': ['빈집비율', '빈집수', '전체주택'],
+}
+
+# 빈집비율_시도.csv: 1행 시점, 2~3행 항목명·단위, 연도마다 (빈집비율, 빈집수, 전체주택)
+VACANCY_RATE_SIDO_SPEC = {
+    'header_rows': 3,
+    'dims': ['시도'],
+    'year_row': 0,
+    'metrics': ['빈집비율', '빈집수', '전체주택'],
+}
+
+# 건축연도_및_주택의_종류별_미거주_주택_빈집 (시군구 파일의 시도 단위): 1행 시점, 2행 항목명('주택_계' 등)
+VACANT_HOUSES_BY_TYPE_SPEC = {
+    'header_rows': 2,
+    'dims': ['시도', '주택의 종류'],
+    'year_row': 0,
+    'metric_row': 1,
+}
+
+
+# 헤더를 읽어서 값 컬럼별 (파일 내 위치, 연도, 항목) 표 생성
+def parse_header(path, spec, encoding=None):
+    n_dims = len(spec['dims'])
+    header = csv_loader.read_csv(path, header=None, nrows=spec['header_rows'], dtype=str, encoding=encoding)
+    positions = np.arange(n_dims, header.shape[1])
+
+    metrics = spec.get('metrics')
+    if metrics is not None:
+        if len(positions) % len(metrics):
+            raise ValueError(
+                f"{path}: 값 컬럼 {len(positions)}개를 항목 {len(metrics)}개 단위 블록으로 나눌 수 없습니다."
+            )
+        metric_labels = np.tile(metrics, len(positions) // len(metrics))
+    else:
+        metric_labels = header.iloc[spec['metric_row'], n_dims:].fillna('').str.strip().to_numpy()
+
+    years = spec.get('years')
+    if years is not None:
+        years = list(years)
+        if len(positions) != len(years) * (len(metrics) if metrics is not None else 1):
+            raise ValueError(f"{path}: 값 컬럼 {len(positions)}개가 연도 {len(years)}개와 맞지 않습니다.")
+        year_labels = np.repeat(years, len(positions) // len(years))
+    else:
+        raw = header.iloc[spec['year_row'], n_dims:].ffill()
+        year_labels = pd.to_numeric(raw.str.extract(YEAR_PATTERN, expand=False), errors='coerce').to_numpy()
+        if np.isnan(year_labels).any():
+            raise ValueError(f"{path}: 연도를 읽을 수 없는 헤더가 있습니다: {list(raw[np.isnan(year_labels)])}")
+
+    return pd.DataFrame({
+        'position': positions,
+        '연도': np.asarray(year_labels).astype(int),
+        'metric': metric_labels,
+    })
+
+
+# 넓은 형태 표를 청크 단위로 읽어 긴 형태(dims…, 연도, metric, value)로 변환
+# metrics, years를 주면 해당 컬럼만 읽음 (usecols)
+# 숫자 변환은 청크의 값 블록 전체를 한 번에 처리 ('-', 'X' 등 비공개 값은 결측)
+def iter_long(path, spec, metrics=None, years=None, chunksize=100_000, encoding=None):
+    encoding = encoding or csv_loader.detect_encoding(path)
+    columns = parse_header(path, spec, encoding)
+    if metrics is not None:
+        columns = columns[columns['metric'].isin(metrics)]
+    if years is not None:
+        columns = columns[columns['연도'].isin([int(year) for year in years])]
+
+    dims = spec['dims']
+    positions = columns['position'].tolist()
+    value_years = columns['연도'].to_numpy()
+    value_metrics = columns['metric'].to_numpy()
+    reader = csv_loader.read_csv(
+        path, header=None, skiprows=spec['header_rows'], usecols=list(range(len(dims))) + positions,
+        dtype=str, encoding=encoding, chunksize=chunksize
+    )
+    if chunksize is None:
+        reader = [reader]
+
+    for chunk in reader:
+        n_rows = len(chunk)
+        values = pd.Series(chunk[positions].to_numpy().ravel(), dtype='string')
+        values = pd.to_numeric(values.str.replace(',', '', regex=False).str.strip(), errors='coerce')
+        long = {
+            name: np.repeat(chunk[i].astype('string').str.strip().to_numpy(), len(positions))
+            for i, name in enumerate(dims)
+        }
+        long['연도'] = np.tile(value_years, n_rows)
+        long['metric'] = np.tile(value_metrics, n_rows)
+        long['value'] = values.to_numpy(dtype=float, na_value=np.nan)
+        yield pd.DataFrame(long)
+
+
+# 긴 형태로 전부 읽기 (차원·항목 컬럼은 범주형)
+def read_long(path, spec, metrics=None, years=None, chunksize=100_000, encoding=None, dropna=True):
+    chunks = []
+    for chunk in iter_long(path, spec, metrics, years, chunksize, encoding):
+        chunks.append(chunk.dropna(subset=['value']) if dropna else chunk)
+    long = pd.concat(chunks, ignore_index=True)
+    for col in spec['dims'] + ['metric']:
+        long[col] = long[col].astype('category')
+    return long
@@ -0,0 +1,138 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+from matplotlib.font_manager import FontProperties
+
+# 라벨 후보 위치 (점 기준 오프셋, 포인트 단위): 오른쪽 위부터 시계 방향으로 시도
+CANDIDATE_OFFSETS = [(5, 5), (-5, 5), (5, -5), (-5, -5), (7, 0), (-7, 0), (0, 7), (0, -7)]
+
+# 다른 점을 가리지 않도록 점마다 비워 둘 반경 (픽셀)
+POINT_RADIUS_PX = 3
+
+
+# 화면 좌표의 사각형(x0, y0, x1, y1)을 격자 칸에 나눠 담는 공간 색인
+# 칸 크기를 라벨 크기 정도로 잡으면 한 번의 겹침 검사는 주변 몇 칸만 확인
+class _BoxGrid:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list)
+
+    def _cells_of(self, box):
+        x0, y0, x1, y1 = (math.floor(value / self.cell_size) for value in box)
+        return [(ix, iy) for ix in range(x0, x1 + 1) for iy in range(y0, y1 + 1)]
+
+    def overlaps(self, box, ignore=None):
+        for cell in self._cells_of(box):
+            for other, owner in self.cells.get(cell, ()):
+                if (ignore is None or owner != ignore) and box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    return True
+        return False
+
+    def add(self, box, owner=None):
+        for cell in self._cells_of(box):
+            self.cells[cell].append((box, owner))
+
+
+# 회귀선에서 멀리 떨어진 점일수록 중요 (|잔차|)
+def residual_priority(x, y):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if valid.sum() < 2:
+        return np.zeros(len(x))
+    slope, intercept = np.polyfit(x[valid], y[valid], 1)
+    return np.nan_to_num(np.abs(y - (slope * x + intercept)), nan=-np.inf)
+
+
+# 값이 클수록 중요 (|값|)
+def magnitude_priority(values):
+    return np.nan_to_num(np.abs(np.asarray(values, dtype=float)), nan=-np.inf)
+
+
+# 라벨별 화면 크기 (픽셀): 라벨마다 렌더러로 재지 않고 글자별 폭을 한 번씩만 재서 합산
+# (커닝은 무시하므로 padding_px로 여유를 둠)
+def _text_sizes(labels, renderer, prop, padding_px):
+    def measure(text):
+        return renderer.get_text_width_height_descent(text, prop, ismath=False)
+
+    # 앞뒤에 '|'를 붙여 재면 공백을 포함한 글자의 진행 폭을 얻을 수 있음
+    bar_width = measure('||')[0]
+    char_widths = {char: measure(f'|{char}|')[0] - bar_width for char in set(''.join(labels))}
+    _, line_height, _ = measure('Ag가|')
+    return {
+        label: (sum(char_widths[char] for char in label) + 2 * padding_px, line_height + 2 * padding_px)
+        for label in set(labels)
+    }
+
+
+def _alignment(dx, dy):
+    ha = 'left' if dx > 0 else 'right' if dx < 0 else 'center'
+    va = 'bottom' if dy > 0 else 'top' if dy < 0 else 'center'
+    return ha, va
+
+
+def _label_box(px, py, dx, dy, width, height):
+    ha, va = _alignment(dx, dy)
+    x0 = px + dx if ha == 'left' else px + dx - width if ha == 'right' else px + dx - width / 2
+    y0 = py + dy if va == 'bottom' else py + dy - height if va == 'top' else py + dy - height / 2
+    return (x0, y0, x0 + width, y0 + height)
+
+
+# 겹치지 않는 라벨만 골라서 표시 (중요한 점부터 배치, 자리가 없는 라벨은 생략)
+# priority: 점별 중요도 배열 (None이면 회귀 잔차 기준), always: 우선 배치할 라벨 목록
+# 축 범위·위치가 정해진 뒤(plot, tight_layout 이후)에 호출해야 화면 좌표가 맞음
+# 반환값: 표시된 라벨의 Annotation 목록
+def place_labels(ax, x, y, labels, priority=None, always=None, fontsize=8, offsets=CANDIDATE_OFFSETS,
+                 max_labels=None, avoid_points=True, padding_px=1, **text_kwargs):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    labels = [str(label) for label in labels]
+    priority = residual_priority(x, y) if priority is None else np.asarray(priority, dtype=float)
+
+    # 먼저 always 목록, 그다음 중요도가 높은 순
+    always = set(always or [])
+    pinned = np.array([label in always for label in labels])
+    order = np.lexsort((-np.nan_to_num(priority, nan=-np.inf), ~pinned))
+
+    fig = ax.figure
+    ax.autoscale_view()
+    renderer = fig.canvas.get_renderer()
+    px_per_pt = fig.dpi / 72
+    points = ax.transData.transform(np.column_stack([x, y]))
+    axes_box = ax.get_window_extent(renderer)
+    sizes = _text_sizes(labels, renderer, FontProperties(size=fontsize), padding_px)
+
+    cell_size = max(np.median([height for _, height in sizes.values()]) * 2, 8) if sizes else 8
+    label_grid = _BoxGrid(cell_size)
+    point_grid = _BoxGrid(cell_size)
+    visible = np.isfinite(points).all(axis=1)
+    if avoid_points:
+        for i in np.flatnonzero(visible):
+            px, py = points[i]
+            point_grid.add((px - POINT_RADIUS_PX, py - POINT_RADIUS_PX, px + POINT_RADIUS_PX, py + POINT_RADIUS_PX), i)
+
+    placed = []
+    for i in order:
+        if max_labels is not None and len(placed) >= max_labels:
+            break
+        if not visible[i]:
+            continue
+        px, py = points[i]
+        width, height = sizes[labels[i]]
+        for dx, dy in offsets:
+            box = _label_box(px, py, dx * px_per_pt, dy * px_per_pt, width, height)
+            inside = (box[0] >= axes_box.x0 and box[2] <= axes_box.x1 and
+                      box[1] >= axes_box.y0 and box[3] <= axes_box.y1)
+            # 자기 점은 장애물에서 제외, always 라벨은 다른 라벨만 피함
+            if not inside or label_grid.overlaps(box):
+                continue
+            if pinned[i] or not point_grid.overlaps(box, ignore=i):
+                label_grid.add(box)
+                ha, va = _alignment(dx, dy)
+                placed.append(ax.annotate(
+                    labels[i], (x[i], y[i]), xytext=(dx, dy), textcoords='offset points',
+                    ha=ha, va=va, fontsize=fontsize, annotation_clip=True, **text_kwargs
+                ))
+                break
+    return placed
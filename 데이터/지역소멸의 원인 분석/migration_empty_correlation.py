@@ -1,60 +1,57 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
 import numpy as np
 
+import kosis_parser
+import record_linkage
+from panel_stats import expanding_correlations, rolling_correlations, yearly_correlations
+from plot_style import apply_style
+
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
+apply_style()
 
 # 데이터 로드
 migration_df = pd.read_csv('04_인구 이동 데이터 (전입, 전출 및 종사자 수)/인구이동자수 데이터/연도별_시군구_전입률_전출률_2013_2024 - 완료.csv')
 
-# 빈집 데이터 로드 및 전처리
-empty_df = pd.read_csv('01_빈집 데이터/빈집비율_시_군_구.csv', encoding='utf-8', skiprows=[1])
-empty_df.columns = ['시군구'] + [f'{year}_{col}' for year in range(2015, 2024) for col in ['빈집비율', '빈집수', '전체주택']]
-
-# 빈집 데이터 재구성
-empty_data = []
-for year in range(2015, 2024):
-    year_data = empty_df[['시군구', f'{year}_빈집비율']].copy()
-    year_data.columns = ['시군구', '빈집비율']
-    year_data['연도'] = year
-    year_data['빈집비율'] = pd.to_numeric(year_data['빈집비율'], errors='coerce')
-    empty_data.append(year_data)
-
-empty_processed = pd.concat(empty_data, ignore_index=True)
+# 빈집 데이터 로드 (KOSIS 넓은 표에서 빈집비율 컬럼만 긴 형태로 읽기)
+empty_processed = kosis_parser.read_long(
+    '01_빈집 데이터/빈집비율_시_군_구.csv', kosis_parser.VACANCY_RATE_SPEC, metrics=['빈집비율']
+)
+empty_processed = empty_processed[['시군구', '연도', 'value']].rename(columns={'value': '빈집비율'})
+# 시군구 열에 섞인 시도 행으로 소속 시도를 채우고, 시도·전국 합계 행은 제외
+empty_processed['시도'] = record_linkage.infer_sido(empty_processed['시군구']).to_numpy()
+empty_processed = empty_processed.dropna(subset=['시도'])
 
 # 데이터 전처리
-migration_df = migration_df[['시군구', '연도', '순이동']]
+migration_df = migration_df[['시도', '시군구', '연도', '순이동']].copy()
 migration_df['연도'] = migration_df['연도'].astype(int)
 
-# 연도와 시군구별로 데이터 병합
-merged_df = pd.merge(migration_df, empty_processed, on=['시군구', '연도'], how='inner')
+# 연도와 (시도, 시군구)별로 데이터 병합 (중구·동구·고성군처럼 여러 시도에 있는 이름도 구분)
+merged_df, link_table, unmatched = record_linkage.merge(migration_df, empty_processed, on=['연도'])
+if len(unmatched):
+    print("연결되지 않은 시군구:")
+    print(unmatched.to_string(index=False))
 
 # 결측치 제거
 merged_df = merged_df.dropna()
 
-# 전체 기간에 대한 상관관계 분석
-correlation = stats.pearsonr(merged_df['순이동'], merged_df['빈집비율'])
-print(f'전체 기간 상관계수: {correlation[0]:.4f}')
-print(f'p-value: {correlation[1]:.4f}')
-
-# 연도별 상관관계 분석
-yearly_correlations = []
-for year in range(2015, 2024):
-    year_data = merged_df[merged_df['연도'] == year]
-    if len(year_data) > 1:  # 상관관계 계산을 위해 최소 2개 이상의 데이터 필요
-        corr = stats.pearsonr(year_data['순이동'], year_data['빈집비율'])
-        yearly_correlations.append({
-            '연도': year,
-            '상관계수': corr[0],
-            'p-value': corr[1]
-        })
-
-yearly_corr_df = pd.DataFrame(yearly_correlations)
+# 누적 구간 상관관계 (마지막 행이 전체 기간)
+expanding_corr_df = expanding_correlations(merged_df, '순이동', '빈집비율')
+correlation = expanding_corr_df.iloc[-1]
+print(f'전체 기간 상관계수: {correlation["상관계수"]:.4f}')
+print(f'p-value: {correlation["p-value"]:.4f}')
+
+# 연도별 상관관계 분석 (상관관계 계산을 위해 최소 2개 이상의 데이터 필요)
+yearly_corr_df = yearly_correlations(merged_df, '순이동', '빈집비율')
+yearly_corr_df = yearly_corr_df[yearly_corr_df['n'] > 1]
 print('\n연도별 상관관계:')
-print(yearly_corr_df)
+print(yearly_corr_df[['연도', '상관계수', 'p-value']])
+
+# 3년 이동 구간 상관관계
+rolling_corr_df = rolling_correlations(merged_df, '순이동', '빈집비율', window=3)
+print('\n3년 이동 구간 상관관계:')
+print(rolling_corr_df[['시작연도', '연도', 'n', '상관계수', 'p-value']])
 
 # 시각화
 plt.figure(figsize=(15, 12))
@@ -75,7 +72,9 @@ plt.legend()
 
 # 연도별 상관계수 추이
 plt.subplot(2, 1, 2)
-plt.plot(yearly_corr_df['연도'], yearly_corr_df['상관계수'], marker='o', linewidth=2)
+plt.plot(yearly_corr_df['연도'], yearly_corr_df['상관계수'], marker='o', linewidth=2, label='연도별')
+plt.plot(rolling_corr_df['연도'], rolling_corr_df['상관계수'], marker='s', linestyle='--', label='3년 이동 구간')
+plt.legend()
 plt.title('연도별 상관계수 추이 (2015-2023)')
 plt.xlabel('연도')
 plt.ylabel('상관계수')
@@ -93,7 +92,7 @@ plt.close()
 
 # 상관관계 해석을 위한 추가 통계
 print("\n추가 통계:")
-print(f"분석된 지역 수: {len(merged_df['시군구'].unique())}")
+print(f"분석된 지역 수: {len(merged_df[['시도', '시군구']].drop_duplicates())}")
 print("\n상관계수 해석:")
 print("- 상관계수가 -1에 가까울수록: 순이동이 증가할 때 빈집비율이 감소")
 print("- 상관계수가 1에 가까울수록: 순이동이 증가할 때 빈집비율도 증가")
@@ -0,0 +1,194 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+# 시군구 × 연도 패널의 이원 고정효과(지역·연도) 회귀
+# 고정효과는 더미 컬럼 대신 집단 평균을 빼는 within 변환으로 제거 (불균형 패널은 교대 투영으로 반복)
+# 표준오차는 지역 군집 강건 표준오차, 부트스트랩은 wild cluster 방식으로 모든 반복을 행렬 한 번에 계산
+
+# 교대 투영 수렴 기준과 최대 반복 수
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 1000
+
+# 유의수준 (신뢰구간)
+ALPHA = 0.05
+
+# 부트스트랩 반복 수와 난수 시드
+BOOTSTRAP = 999
+SEED = 12345
+
+# 기본 종속변수와 설명변수 (지표 저장소의 지표 이름)
+DEFAULT_OUTCOME = '빈집비율'
+DEFAULT_COVARIATES = ['순이동', '총인구', '지역내총생산_명목']
+
+RESULT_FILE = '패널회귀_고정효과.csv'
+
+
+# 집단 코드 → (행, 집단) 지시 희소 행렬과 집단별 행 수
+def _indicator(codes):
+    n_groups = int(codes.max()) + 1
+    matrix = sparse.csr_matrix((np.ones(len(codes)), (np.arange(len(codes)), codes)), shape=(len(codes), n_groups))
+    return matrix, np.bincount(codes, minlength=n_groups)
+
+
+# within 변환: 각 고정효과 집단 평균을 번갈아 빼서 모든 집단 평균이 0이 될 때까지 반복
+# values: (행, 열) 배열 — 종속변수·설명변수·부트스트랩 반복을 열로 쌓아 한 번에 변환
+def demean(values, groups, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS):
+    values = np.array(values, dtype=float, copy=True)
+    indicators = [(codes, *_indicator(codes)) for codes in groups]
+    scale = np.maximum(np.abs(values).max(axis=0), 1)
+    for _ in range(max_iterations):
+        change = 0.0
+        for codes, matrix, counts in indicators:
+            means = (matrix.T @ values) / counts[:, None]
+            values -= means[codes]
+            change = max(change, float((np.abs(means) / scale).max()))
+        # 균형 패널은 두 번째 반복에서 바로 수렴
+        if change < tolerance:
+            break
+    return values
+
+
+# 관측치가 하나뿐인 지역은 within 변환 후 0이 되어 추정에 기여하지 않으므로 반복해서 제외
+def _drop_singletons(entity, time):
+    keep = np.ones(len(entity), dtype=bool)
+    n_entities, n_times = entity.max() + 1, time.max() + 1
+    while True:
+        singles = np.bincount(entity[keep], minlength=n_entities)[entity] == 1
+        singles |= np.bincount(time[keep], minlength=n_times)[time] == 1
+        singles &= keep
+        if not singles.any():
+            return keep
+        keep &= ~singles
+
+
+# 이원 고정효과 회귀
+# panel: 지역·연도·변수 컬럼을 가진 긴 형태 DataFrame, cluster: 군집 컬럼 (기본은 지역)
+# 결과: (계수표, 요약 dict)
+def fit(panel, outcome, covariates, entity='region_code', time='연도', cluster=None, bootstrap=0, seed=SEED,
+        alpha=ALPHA):
+    covariates = list(covariates)
+    cluster = cluster or entity
+    columns = list(dict.fromkeys([entity, time, cluster, outcome] + covariates))
+    data = panel[columns].dropna()
+
+    entity_codes = pd.factorize(data[entity])[0]
+    time_codes = pd.factorize(data[time])[0]
+    keep = _drop_singletons(entity_codes, time_codes)
+    data = data[keep]
+    entity_codes = pd.factorize(data[entity])[0]
+    time_codes = pd.factorize(data[time])[0]
+    cluster_codes = pd.factorize(data[cluster])[0]
+
+    groups = [entity_codes, time_codes]
+    within = demean(data[[outcome] + covariates].to_numpy(dtype=float), groups)
+    y, x = within[:, 0], within[:, 1:]
+    n, k = x.shape
+    n_clusters = cluster_codes.max() + 1
+
+    xtx_inv = np.linalg.pinv(x.T @ x)
+    beta = xtx_inv @ (x.T @ y)
+    residuals = y - x @ beta
+
+    # 군집 강건 분산: (X'X)⁻¹ (Σ_g X_g'e_g e_g'X_g) (X'X)⁻¹ × 소표본 보정
+    cluster_matrix, _ = _indicator(cluster_codes)
+    scores = cluster_matrix.T @ (x * residuals[:, None])
+    correction = n_clusters / (n_clusters - 1) * (n - 1) / (n - k)
+    covariance = correction * xtx_inv @ (scores.T @ scores) @ xtx_inv
+    se = np.sqrt(np.diag(covariance))
+    t_values = beta / se
+    df = n_clusters - 1
+    critical = stats.t.ppf(1 - alpha / 2, df)
+
+    table = pd.DataFrame({
+        '계수': beta,
+        '표준오차': se,
+        't': t_values,
+        'p-value': 2 * stats.t.sf(np.abs(t_values), df),
+        '하한': beta - critical * se,
+        '상한': beta + critical * se,
+    }, index=pd.Index(covariates, name='변수'))
+
+    if bootstrap:
+        replicates = wild_cluster_bootstrap(x, beta, residuals, cluster_codes, groups, xtx_inv, bootstrap, seed)
+        table['부트스트랩_표준오차'] = replicates.std(axis=0, ddof=1)
+        table['부트스트랩_하한'] = np.quantile(replicates, alpha / 2, axis=0)
+        table['부트스트랩_상한'] = np.quantile(replicates, 1 - alpha / 2, axis=0)
+
+    total = y @ y
+    summary = {
+        'n': n,
+        '지역수': int(entity_codes.max() + 1),
+        '연도수': int(time_codes.max() + 1),
+        '군집수': int(n_clusters),
+        '제외된 관측치': int((~keep).sum()),
+        'within R²': 1 - residuals @ residuals / total if total > 0 else np.nan,
+    }
+    return table, summary
+
+
+# wild cluster 부트스트랩 (Rademacher 가중치): 반복 B개의 y*를 열로 쌓아 within 변환과 최소제곱을 한 번에 계산
+# 결과: (B, 변수 수) 계수 배열
+def wild_cluster_bootstrap(x, beta, residuals, cluster_codes, groups, xtx_inv, replications=BOOTSTRAP, seed=SEED):
+    rng = np.random.default_rng(seed)
+    weights = rng.choice([-1.0, 1.0], size=(cluster_codes.max() + 1, replications))
+    # 가중치를 곱한 잔차는 고정효과와 직교하지 않으므로 다시 within 변환
+    perturbed = demean(residuals[:, None] * weights[cluster_codes], groups)
+    y_star = (x @ beta)[:, None] + perturbed
+    return (xtx_inv @ (x.T @ y_star)).T
+
+
+# 일반구가 있는 시는 시 단위 행만 사용 (수원시와 장안구가 함께 있으면 중복 집계)
+def _drop_districts(panel, code='region_code'):
+    codes = panel[code].astype('Int64')
+    parents = codes // 10 * 10
+    has_parent = parents.isin(set(codes.dropna())) & (codes % 10 != 0)
+    return panel[~has_parent.fillna(False).to_numpy()]
+
+
+# 지표 저장소에서 시군구 × 연도 패널 구성
+# 시도 단위로만 있는 지표(지역내총생산, 면적당 의료기관 수 등)는 소속 시군구에 같은 값으로 채움
+def load_panel(outcome=DEFAULT_OUTCOME, covariates=DEFAULT_COVARIATES, years=None):
+    import warehouse
+
+    indicators = list(dict.fromkeys([outcome] + list(covariates)))
+    wide = warehouse.load_wide(indicators, years, index=('region_code', '연도'))
+    wide = wide.dropna(subset=['region_code'])
+    for name in indicators:
+        if name not in wide:
+            wide[name] = np.nan
+    codes = wide['region_code'].astype('int64')
+    sido_rows = (codes % 1000 == 0).to_numpy()
+    sido = wide[sido_rows].set_index(['region_code', '연도'])
+    panel = wide[~sido_rows].copy()
+
+    parent = pd.MultiIndex.from_arrays([panel['region_code'].astype('int64') // 1000 * 1000, panel['연도']])
+    for name in indicators:
+        if panel[name].isna().all() and sido[name].notna().any():
+            panel[name] = sido[name].reindex(parent).to_numpy()
+    return _drop_districts(panel).reset_index(drop=True)
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='시군구 × 연도 이원 고정효과 패널 회귀')
+    parser.add_argument('outcome', nargs='?', default=DEFAULT_OUTCOME, help='종속변수 (지표 이름)')
+    parser.add_argument('covariates', nargs='*', default=DEFAULT_COVARIATES, help='설명변수 (지표 이름)')
+    parser.add_argument('--log', nargs='*', default=[], help='로그를 취할 변수')
+    parser.add_argument('--bootstrap', type=int, default=BOOTSTRAP, help='wild cluster 부트스트랩 반복 수')
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    panel = load_panel(args.outcome, args.covariates)
+    for name in args.log:
+        panel[name] = np.log(panel[name].where(panel[name] > 0))
+    table, summary = fit(panel, args.outcome, args.covariates, bootstrap=args.bootstrap)
+
+    print(f"\n=== {args.outcome} 이원 고정효과 회귀 (지역·연도 고정효과, 지역 군집 표준오차) ===")
+    print(table.round(4).to_string())
+    for key, value in summary.items():
+        print(f"{key}: {value:.4f}" if isinstance(value, float) else f"{key}: {value:,}")
+    table.to_csv(RESULT_FILE, encoding='utf-8-sig')
+    print(f"\n결과 저장: {RESULT_FILE} ({time.monotonic() - started:.1f}초)")
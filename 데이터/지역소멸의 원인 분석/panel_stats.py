@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+from correlation_engine import pearson_from_sums
+
+SUM_COLUMNS = ['n', 'sx', 'sy', 'sxx', 'syy', 'sxy']
+RESULT_COLUMNS = ['시작연도', '연도', 'n', '상관계수', 'p-value', '기울기', '절편']
+
+
+# 연도별(그룹이 있으면 그룹 × 연도별) 합계, 제곱합, 곱의 합을 한 번의 groupby로 계산
+# 두 값이 모두 있는 관측치만 사용, 빠진 연도는 0으로 채워 연속된 연도 축을 만듦
+def year_sums(panel, x, y, year_column='연도', by=None):
+    keys = [by, year_column] if by else [year_column]
+    data = panel[keys + [x, y]].copy()
+    data[x] = pd.to_numeric(data[x], errors='coerce')
+    data[y] = pd.to_numeric(data[y], errors='coerce')
+    data = data.dropna(subset=[x, y])
+    data[year_column] = data[year_column].astype(int)
+
+    # 전체 평균으로 중심화 (제곱합 계산 시 오차 감소, 절편은 나중에 환원)
+    mean_x = data[x].mean()
+    mean_y = data[y].mean()
+    cx = data[x].to_numpy(dtype=float) - mean_x
+    cy = data[y].to_numpy(dtype=float) - mean_y
+
+    terms = pd.DataFrame({
+        'n': 1.0, 'sx': cx, 'sy': cy, 'sxx': cx * cx, 'syy': cy * cy, 'sxy': cx * cy,
+    }, index=data.index)
+    sums = terms.groupby([data[key] for key in keys]).sum()
+
+    years = range(data[year_column].min(), data[year_column].max() + 1)
+    if by:
+        full_index = pd.MultiIndex.from_product([sums.index.levels[0], years], names=keys)
+    else:
+        full_index = pd.Index(years, name=year_column)
+    sums = sums.reindex(full_index, fill_value=0.0)
+    sums.attrs['means'] = (mean_x, mean_y)
+    return sums
+
+
+def _correlation_table(sums, means, start_years):
+    r, p, slope, intercept = pearson_from_sums(*(sums[col].to_numpy() for col in SUM_COLUMNS))
+    mean_x, mean_y = means
+    result = pd.DataFrame({
+        '시작연도': start_years,
+        '연도': sums.index.get_level_values(-1),
+        'n': sums['n'].to_numpy().astype(int),
+        '상관계수': r,
+        'p-value': p,
+        '기울기': slope,
+        '절편': intercept + mean_y - slope * mean_x,
+    })
+    if sums.index.nlevels > 1:
+        result.insert(0, sums.index.names[0], sums.index.get_level_values(0))
+    return result
+
+
+def _cumulative(sums):
+    if sums.index.nlevels > 1:
+        return sums.groupby(level=0).cumsum()
+    return sums.cumsum()
+
+
+# 연도별 상관계수 (각 연도의 시군구 횡단면)
+def yearly_correlations(panel, x, y, year_column='연도', by=None):
+    sums = year_sums(panel, x, y, year_column, by)
+    years = sums.index.get_level_values(-1)
+    result = _correlation_table(sums, sums.attrs['means'], years)
+    return result[result['n'] > 0].reset_index(drop=True)
+
+
+# 이동 구간(window년) 상관계수: 구간 안의 모든 관측치를 합쳐서 계산 (구간 끝 연도 기준)
+def rolling_correlations(panel, x, y, window=3, year_column='연도', by=None):
+    sums = year_sums(panel, x, y, year_column, by)
+    cumulative = _cumulative(sums)
+    if by:
+        shifted = cumulative.groupby(level=0).shift(window, fill_value=0.0)
+    else:
+        shifted = cumulative.shift(window, fill_value=0.0)
+    rolling = cumulative - shifted
+
+    years = sums.index.get_level_values(-1)
+    result = _correlation_table(rolling, sums.attrs['means'], years - window + 1)
+    complete = (years - window + 1 >= years.min()) & (result['n'].to_numpy() > 0)
+    return result[complete].reset_index(drop=True)
+
+
+# 누적 구간 상관계수: 첫 연도부터 해당 연도까지의 관측치를 합쳐서 계산
+def expanding_correlations(panel, x, y, year_column='연도', by=None):
+    sums = year_sums(panel, x, y, year_column, by)
+    years = sums.index.get_level_values(-1)
+    result = _correlation_table(_cumulative(sums), sums.attrs['means'], np.full(len(years), years.min()))
+    return result[result['n'] > 0].reset_index(drop=True)
@@ -0,0 +1,496 @@
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import admin_codes
+import csv_loader
+import gdp_engine
+import warehouse
+from hospital_cache import hospital_excel_path
+
+# 실행 기록 (단계별 입력·코드 해시)
+STATE_FILE = os.path.join('.cache', 'pipeline_state.json')
+
+# 스크립트가 있는 폴더 (모든 단계는 이 폴더를 작업 디렉토리로 실행)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+EMPTY_HOUSES_FILE = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
+MEDICAL_DENSITY_FILES = [
+    '03_일자리, 인프라 데이터/의료기관 현황/상급병원 포함/면적_대비_의료기관수_2022.csv',
+    '03_일자리, 인프라 데이터/의료기관 현황/상급병원 포함/면적_대비_의료기관수_2023.csv',
+]
+GRDP_FILE = gdp_engine.GRDP_FILE
+CRIME_FILE = '06_5대 범죄 데이터/(완료)2023년 5대 주요범죄통계.csv'
+MIGRATION_FILE = '연도별_시군구_전입률_전출률_2013_2024 - 완료.csv'
+VACANCY_BUILD_YEAR_FILE = '건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv'
+BOUNDARY_FILES = 'boundary_store:sido'
+# calc_고령화비율이 만들고 plot_빈집수_고령화비율_비수도권·analyze_non_capital이 읽는 고령화 비율 정리본
+AGING_SUMMARY_FILE = '인구밀도/(완료)연도별_권역별_고령화비율_v4_정리본.csv'
+
+
+# 단계 이름 → 스크립트, 읽는 파일, 만드는 파일
+# 다른 단계의 outputs에 있는 파일을 inputs로 가지면 그 단계 뒤에 실행됨
+# optional_inputs는 없어도 실행하는 입력 (생기거나 바뀌면 다시 실행)
+STEPS = {
+    # 행정경계 저장소: 없으면 원본 GeoJSON을 내려받아 생성 (직접 만든 저장소가 있으면 그대로 사용)
+    'boundary_store': {
+        'script': 'boundary_store.py',
+        'inputs': [],
+        'outputs': ['boundary_store:sido', 'boundary_store:sigungu'],
+    },
+    'warehouse': {
+        'script': 'warehouse.py',
+        'inputs': [admin_codes.SIGUNGU_CODE_FILE],
+        'optional_inputs': [path for path, _ in warehouse.SOURCES.values()] + ['boundary_store:sigungu'],
+        'outputs': [warehouse.MANIFEST_FILE],
+    },
+    'gdp_engine': {
+        'script': 'gdp_engine.py',
+        'inputs': [GRDP_FILE],
+        'outputs': [gdp_engine.CACHE_FILE],
+    },
+    'convert_hospital_data': {
+        'script': 'convert_hospital_data.py',
+        'inputs': [hospital_excel_path('2025', '3')],
+        'outputs': ['의료기관_현황_2025년_3월_광역시도별.csv', '의료기관_현황_2025년_3월_시군구별.csv'],
+    },
+    'accessibility': {
+        'script': 'accessibility.py',
+        'inputs': [hospital_excel_path('2025', '3'), 'boundary_store:sigungu', warehouse.MANIFEST_FILE],
+        'optional_inputs': ['boundary_store:emd'],
+        'outputs': ['시군구별_의료기관_접근성.csv', '시도별_의료기관_접근성.csv'],
+    },
+    'process_medical_data': {
+        'script': 'process_medical_data.py',
+        'inputs': ['의료기관_현황_2025년_3월_광역시도별.csv'],
+        'outputs': ['의료기관_현황_2025년_3월_광역시도별_정리.csv'],
+    },
+    'process_police_stations': {
+        'script': 'process_police_stations.py',
+        'inputs': ['의료기관_현황_2025년_3월_시군구별.csv', '경찰청_전국 지구대 파출소 주소 현황_20231231.csv'],
+        'optional_inputs': ['addresses_with_coords.csv', BOUNDARY_FILES],
+        'outputs': ['경찰서_지역별_현황.csv'],
+    },
+    'analyze_medical': {
+        'script': 'analyze_medical.py',
+        'inputs': [hospital_excel_path('2024', '12')],
+        'outputs': ['의료기관_현황_2024_수도권비수도권.csv'],
+    },
+    'calc_고령화비율': {
+        'script': 'calc_고령화비율.py',
+        'inputs': ['인구밀도/(완료)연도별_권역별_고령화비율_v4.csv'],
+        'outputs': [AGING_SUMMARY_FILE],
+    },
+    'plot_빈집수_고령화비율_비수도권': {
+        'script': 'plot_빈집수_고령화비율_비수도권.py',
+        'inputs': [f'인구밀도/{VACANCY_BUILD_YEAR_FILE}', AGING_SUMMARY_FILE],
+        'outputs': ['인구밀도/비수도권_빈집수_고령화비율.png'],
+    },
+    'analyze_non_capital': {
+        'script': 'analyze_non_capital.py',
+        'inputs': [VACANCY_BUILD_YEAR_FILE, AGING_SUMMARY_FILE],
+        'outputs': ['비수도권_고령화_빈집_추이_v2.png'],
+    },
+    'police_station_analysis': {
+        'script': 'police_station_analysis.py',
+        'inputs': ['경찰청_전국 경찰서 명칭 및 주소_20230627.csv'],
+        'outputs': ['정제된_경찰서_데이터.csv', '위치별_경찰서_수.csv'],
+    },
+    'crime_police_correlation_analysis': {
+        'script': 'crime_police_correlation_analysis.py',
+        'inputs': [CRIME_FILE, '위치별_경찰서_수.csv'],
+        'outputs': ['경찰서수_범죄발생_상관관계.png'],
+    },
+    'crime_police_correlation': {
+        'script': 'crime_police_correlation.py',
+        'inputs': [
+            '06_5대 범죄 데이터/2023년 5대 주요범죄통계.csv',
+            '05_범죄예방설계(CPTED) 데이터/경찰서 데이터/police_stations_stats.csv',
+        ],
+        'outputs': ['crime_police_correlation.png'],
+    },
+    'crime_statistics_analysis': {
+        'script': 'crime_statistics_analysis.py',
+        'inputs': [CRIME_FILE],
+        'outputs': ['시도별_5대범죄_발생현황.csv'],
+    },
+    'analyze_vacancy_crime': {
+        'script': 'analyze_vacancy_crime.py',
+        'inputs': ['★ 빈집과 범죄율 비교_2023.csv'],
+        'outputs': ['도시농촌_빈집률_범죄율_상관관계.png', '도시농촌_범죄율_분포.png'],
+    },
+    'damage_analysis': {
+        'script': 'damage_analysis.py',
+        'inputs': [
+            '주택종류별_미거주_주택_빈집_사유별_기간별_파손정도별_미거주_주택_빈집_시도_20250603124051.csv'
+        ],
+        'outputs': ['빈집_파손_현황_전체.csv', '행정구역별_빈집_파손_현황.csv'],
+    },
+    'process_population': {
+        'script': 'process_population.py',
+        'inputs': ['인구(나이).xls', '인구이동(연령월별).csv'],
+        'outputs': ['연령대별_인구_분석_결과.csv', '연도별_인구구조_지표.csv', '연령대별_지방이탈율.csv'],
+    },
+    'analysis': {
+        'script': 'analysis.py',
+        'inputs': [VACANCY_BUILD_YEAR_FILE, '인구밀도_연령대별_수도권_비수도권_집중도 복사본.csv'],
+        'outputs': ['analysis_result.png'],
+    },
+    'aging_empty_correlation_line': {
+        'script': 'aging_empty_correlation_line.py',
+        'inputs': [EMPTY_HOUSES_FILE, '02_인구 분포 데이터/인구밀도/(완료)수도권_비수도권 고령화 비율 비교 (2015-2023).csv'],
+        'outputs': ['고령화_빈집수_상관관계.png', '고령화_빈집수_상관관계_선그래프.png'],
+    },
+    'correlation_analysis': {
+        'script': 'correlation_analysis.py',
+        'inputs': [EMPTY_HOUSES_FILE, '02_인구 분포 데이터/인구밀도/연도별_권역별_고령화비율_v4.csv'],
+        'outputs': ['correlation_analysis_count.png', 'trend_analysis_count.png'],
+    },
+    'density_empty_correlation': {
+        'script': 'density_empty_correlation.py',
+        'inputs': [EMPTY_HOUSES_FILE, '02_인구 분포 데이터/인구밀도/연도별_수도권_비수도권_평균_인구밀도차이.csv'],
+        'outputs': ['density_empty_correlation.png'],
+    },
+    'density_empty_national_correlation': {
+        'script': 'density_empty_national_correlation.py',
+        'inputs': [EMPTY_HOUSES_FILE, '02_인구 분포 데이터/인구밀도/연도별_수도권_비수도권_평균_인구밀도차이.csv'],
+        'outputs': ['density_empty_national_correlation.png'],
+    },
+    'empty_houses_analysis': {
+        'script': 'empty_houses_analysis.py',
+        'inputs': [EMPTY_HOUSES_FILE],
+        'outputs': ['연도별_수도권_비수도권_빈집수_그래프.png', '연도별_수도권_비수도권_빈집수.csv'],
+    },
+    'empty_houses_bar': {
+        'script': 'empty_houses_bar.py',
+        'inputs': [EMPTY_HOUSES_FILE],
+        'outputs': ['empty_houses_bar.png'],
+    },
+    'empty_houses_ratio_bar': {
+        'script': 'empty_houses_ratio_bar.py',
+        'inputs': [EMPTY_HOUSES_FILE],
+        'outputs': ['empty_houses_ratio_bar.png'],
+    },
+    'empty_houses_ratio_line': {
+        'script': 'empty_houses_ratio_line.py',
+        'inputs': [EMPTY_HOUSES_FILE],
+        'outputs': ['연도별_수도권_비수도권_빈집비율_선그래프.png'],
+    },
+    'medical_empty_correlation': {
+        'script': 'medical_empty_correlation.py',
+        'inputs': [EMPTY_HOUSES_FILE] + MEDICAL_DENSITY_FILES,
+        'outputs': ['의료기관수_빈집수_상관관계.png', '의료기관수_빈집수_상관관계_선그래프.png'],
+    },
+    'medical_vacancy_analysis': {
+        'script': 'medical_vacancy_analysis.py',
+        'inputs': ['면적_대비_의료기관수_2022.csv', '면적_대비_의료기관수_2023.csv', '빈집비율_시도.csv'],
+        'outputs': ['의료기관_빈집_상관관계_2022.png', '의료기관_빈집_상관관계_2023.png'],
+    },
+    'medical_vacancy_analysis_v2': {
+        'script': 'medical_vacancy_analysis_v2.py',
+        'inputs': ['면적_대비_의료기관수_2022.csv', '면적_대비_의료기관수_2023.csv', '빈집비율_시도.csv'],
+        'optional_inputs': ['시도별_의료기관_접근성.csv'],
+        'outputs': ['의료기관_빈집_상관관계_2022_v2.png', '의료기관_빈집_상관관계_2023_v2.png'],
+    },
+    'population_empty_correlation': {
+        'script': 'population_empty_correlation.py',
+        'inputs': [EMPTY_HOUSES_FILE, '시도별 인구증가율 (2015 - 2023).csv'],
+        'outputs': ['인구증가율_빈집수_상관관계.png', '인구증가율_빈집수_상관관계_선그래프.png'],
+    },
+    'migration_empty_correlation': {
+        'script': 'migration_empty_correlation.py',
+        'inputs': [
+            f'04_인구 이동 데이터 (전입, 전출 및 종사자 수)/인구이동자수 데이터/{MIGRATION_FILE}',
+            '01_빈집 데이터/빈집비율_시_군_구.csv',
+        ],
+        'outputs': ['migration_empty_correlation.png'],
+    },
+    'population_migration_visualization': {
+        'script': 'population_migration_visualization.py',
+        'inputs': [MIGRATION_FILE],
+        'outputs': ['population_migration.png', 'net_migration.png', 'migration_rate.png'],
+    },
+    'korea_map_visualization': {
+        'script': 'korea_map_visualization.py',
+        'inputs': [MIGRATION_FILE, BOUNDARY_FILES],
+        'outputs': ['korea_migration_map.html', 'region_migration_bar.png'],
+    },
+    'population_density_heatmap': {
+        'script': 'population_density_heatmap.py',
+        'inputs': ['(완료)연도v4.csv', BOUNDARY_FILES],
+        'outputs': ['korea_population_density_heatmap.html', 'korea_population_density_heatmap.png'],
+    },
+    'gdp_pie_visualization': {
+        'script': 'gdp_pie_visualization.py',
+        'inputs': [gdp_engine.CACHE_FILE],
+        'outputs': ['gdp_pie_charts.png'],
+    },
+    'gdp_trend_visualization': {
+        'script': 'gdp_trend_visualization.py',
+        'inputs': [gdp_engine.CACHE_FILE],
+        'outputs': ['gdp_trend_nominal.png'],
+    },
+    'population_ratio_analysis': {
+        'script': 'population_ratio_analysis.py',
+        'inputs': [warehouse.MANIFEST_FILE],
+        'outputs': ['population_ratio_analysis.png'],
+    },
+    'correlation_population_empty': {
+        'script': 'correlation_population_empty.py',
+        'inputs': [EMPTY_HOUSES_FILE, warehouse.MANIFEST_FILE],
+        'outputs': ['correlation_population_empty.png'],
+    },
+    'growth_rate_correlation': {
+        'script': 'growth_rate_correlation.py',
+        'inputs': [EMPTY_HOUSES_FILE, warehouse.MANIFEST_FILE],
+        'outputs': ['growth_rate_correlation.png'],
+    },
+    'spatial_autocorr': {
+        'script': 'spatial_autocorr.py',
+        'inputs': ['boundary_store:sigungu', warehouse.MANIFEST_FILE],
+        'outputs': ['시군구별_LISA.csv'],
+    },
+    'panel_regression': {
+        'script': 'panel_regression.py',
+        'inputs': [warehouse.MANIFEST_FILE],
+        'outputs': ['패널회귀_고정효과.csv'],
+    },
+}
+
+
+# 입력 경로 확장: 'boundary_store:<level>'은 그 단위의 경계 저장소 파일 전체, 그 외는 glob 패턴
+# 맞는 파일이 하나도 없으면 원래 경로를 그대로 돌려줘서 없는 입력으로 잡히게 함
+def _expand_input(path):
+    if path.startswith('boundary_store:'):
+        import boundary_store
+        level = path.split(':', 1)[1]
+        matches = sorted(glob.glob(os.path.join(glob.escape(boundary_store.STORE_DIR), f'{level}@*.parquet')))
+    elif glob.has_magic(path):
+        matches = sorted(glob.glob(path))
+    else:
+        return [path]
+    return matches or [path]
+
+
+# 단계 출력 중 아직 없는 것 ('boundary_store:<level>'은 그 단위 경계 파일이 하나도 없으면 없음)
+def _missing_outputs(step):
+    return [path for path in step['outputs'] if not all(os.path.exists(p) for p in _expand_input(path))]
+
+
+# 스크립트가 import하는 같은 폴더의 모듈 (간접 import 포함)
+def local_modules(script, seen=None):
+    seen = set() if seen is None else seen
+    with open(os.path.join(SCRIPT_DIR, script), 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            module_file = f"{name.split('.')[0]}.py"
+            if module_file not in seen and os.path.exists(os.path.join(SCRIPT_DIR, module_file)):
+                seen.add(module_file)
+                local_modules(module_file, seen)
+    return seen
+
+
+# 단계의 현재 해시: 입력 파일 + 스크립트 + 스크립트가 쓰는 모듈 (없는 입력은 None)
+def step_digests(step):
+    digests = {}
+    for path in step['inputs'] + step.get('optional_inputs', []):
+        for expanded in _expand_input(path):
+            digests[expanded] = csv_loader.file_digest(expanded) if os.path.exists(expanded) else None
+    for code_file in [step['script']] + sorted(local_modules(step['script'])):
+        digests[code_file] = csv_loader.file_digest(os.path.join(SCRIPT_DIR, code_file))
+    return digests
+
+
+# 단계 간 의존관계: 다른 단계의 출력을 입력으로 쓰면 그 단계에 의존
+# optional=True면 optional_inputs를 만드는 단계도 포함 (실행 순서만 맞추고 실패해도 막지 않음)
+def build_graph(steps=STEPS, optional=True):
+    producers = {}
+    for name, step in steps.items():
+        for output in step['outputs']:
+            if output in producers:
+                raise ValueError(f"'{output}'을(를) 만드는 단계가 둘 이상입니다: {producers[output]}, {name}")
+            producers[output] = name
+    return {
+        name: sorted({
+            producers[path] for path in step['inputs'] + (step.get('optional_inputs', []) if optional else [])
+            if path in producers
+        } - {name})
+        for name, step in steps.items()
+    }
+
+
+# 위상 정렬 (STEPS 선언 순서를 최대한 유지)
+def topological_order(graph):
+    order = []
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"순환 의존관계: {' → '.join(path + [name])}")
+        state[name] = 'visiting'
+        for dependency in graph[name]:
+            visit(dependency, path + [name])
+        state[name] = 'done'
+        order.append(name)
+
+    for name in graph:
+        visit(name, [])
+    return order
+
+
+# 대상 단계와 그 상위 단계 전체
+def with_dependencies(graph, targets):
+    selected = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in graph:
+            raise KeyError(f"알 수 없는 단계: {name}")
+        if name not in selected:
+            selected.add(name)
+            stack.extend(graph[name])
+    return selected
+
+
+def _load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_state(state):
+    os.makedirs(os.path.dirname(STATE_FILE), exist_ok=True)
+    tmp_file = f'{STATE_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, STATE_FILE)
+
+
+# 한 단계 실행 (별도 파이썬 프로세스, 출력은 단계별 로그 파일에 저장)
+def _run_script(name, script):
+    log_file = os.path.join('.cache', 'pipeline_logs', f'{name}.log')
+    os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    env = dict(os.environ, MPLBACKEND='Agg')
+    with open(log_file, 'w', encoding='utf-8') as log:
+        process = subprocess.run(
+            [sys.executable, script], cwd=SCRIPT_DIR, env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+    return process.returncode, log_file
+
+
+# 변경된 단계만 실행: 입력·코드 해시가 지난 실행과 같고 출력이 모두 있으면 건너뜀
+# 의존관계가 없는 단계끼리는 max_workers개 프로세스로 동시에 실행
+def run(targets=None, force=False, dry_run=False, max_workers=None, steps=STEPS):
+    graph = build_graph(steps)
+    required = build_graph(steps, optional=False)
+    order = topological_order(graph)
+    if targets:
+        selected = with_dependencies(graph, targets)
+        order = [name for name in order if name in selected]
+
+    state = _load_state()
+    status = {}
+    pending = list(order)
+    running = {}
+    max_workers = max_workers or os.cpu_count() or 1
+
+    def start_ready(executor):
+        for name in list(pending):
+            if len(running) >= max_workers:
+                break
+            upstream = [status.get(dependency) for dependency in graph[name] if dependency in order]
+            if None in upstream:
+                continue
+            pending.remove(name)
+            step = steps[name]
+            blocking = [status[dependency] for dependency in required[name] if dependency in order]
+            if any(result == '실패' or result.startswith('건너뜀') for result in blocking):
+                status[name] = '건너뜀(상위 단계)'
+                print(f"[{name}] {status[name]}")
+                continue
+            if '실행 예정' in upstream:
+                # dry-run에서 상위 단계가 실행 예정이면 출력이 바뀔 수 있으므로 함께 실행 예정
+                status[name] = '실행 예정'
+                print(f"[{name}] {status[name]}")
+                continue
+
+            # 상위 단계가 끝난 뒤에 해시를 계산해야 새로 만든 출력이 반영됨
+            digests = step_digests(step)
+            optional = set(step.get('optional_inputs', []))
+            missing = [path for path, digest in digests.items() if digest is None and path not in optional]
+            outputs_exist = not _missing_outputs(step)
+            unchanged = state.get(name, {}).get('digests') == digests
+            if missing:
+                status[name] = '건너뜀(입력 없음)'
+                print(f"[{name}] {status[name]}: {', '.join(missing)}")
+            elif unchanged and outputs_exist and not force:
+                status[name] = '최신'
+            elif dry_run:
+                status[name] = '실행 예정'
+                print(f"[{name}] {status[name]}")
+            else:
+                print(f"[{name}] 실행")
+                running[executor.submit(_run_script, name, step['script'])] = (name, digests)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        start_ready(executor)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, digests = running.pop(future)
+                returncode, log_file = future.result()
+                missing_outputs = _missing_outputs(steps[name])
+                if returncode != 0 or missing_outputs:
+                    status[name] = '실패'
+                    print(f"[{name}] 실패 (종료 코드 {returncode}, 로그: {log_file})")
+                    state.pop(name, None)
+                else:
+                    status[name] = '완료'
+                    print(f"[{name}] 완료")
+                    state[name] = {'digests': digests}
+                if not dry_run:
+                    _save_state(state)
+            start_ready(executor)
+
+    if csv_loader._dirty:
+        csv_loader._save_cache()
+    return status
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='입력이 바뀐 분석 스크립트만 의존 순서대로 다시 실행')
+    parser.add_argument('steps', nargs='*', help='실행할 단계 (상위 단계 포함, 생략하면 전체)')
+    parser.add_argument('--force', action='store_true', help='해시와 관계없이 모두 다시 실행')
+    parser.add_argument('--dry-run', action='store_true', help='실행하지 않고 실행할 단계만 표시')
+    parser.add_argument('--jobs', type=int, default=None, help='동시에 실행할 최대 프로세스 수')
+    parser.add_argument('--list', action='store_true', help='단계와 의존관계 출력')
+    args = parser.parse_args()
+
+    os.chdir(SCRIPT_DIR)
+    if args.list:
+        graph = build_graph()
+        for name in topological_order(graph):
+            print(f"{name} ← {', '.join(graph[name]) or '-'}")
+    else:
+        status = run(args.steps, force=args.force, dry_run=args.dry_run, max_workers=args.jobs)
+        counts = {}
+        for result in status.values():
+            counts[result] = counts.get(result, 0) + 1
+        print(', '.join(f'{result} {count}' for result, count in counts.items()))
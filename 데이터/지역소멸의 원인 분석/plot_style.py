@@ -0,0 +1,40 @@
+import functools
+
+import matplotlib.pyplot as plt
+from matplotlib import font_manager
+
+# 한글 폰트 후보 (설치된 것 중 앞에 있는 것을 사용: macOS, Windows, Linux 순)
+KOREAN_FONTS = [
+    'AppleGothic', 'Apple SD Gothic Neo',
+    'Malgun Gothic',
+    'NanumGothic', 'NanumBarunGothic', 'Noto Sans CJK KR', 'Noto Sans KR', 'UnDotum', 'Baekmuk Gulim',
+]
+
+# 모든 그래프에 공통으로 쓰는 저장 옵션
+SAVE_OPTIONS = {'dpi': 300, 'bbox_inches': 'tight'}
+
+
+# 설치된 한글 폰트 이름 (프로세스당 한 번만 검색, 없으면 None)
+@functools.lru_cache(maxsize=None)
+def korean_font():
+    available = {font.name for font in font_manager.fontManager.ttflist}
+    for name in KOREAN_FONTS:
+        if name in available:
+            return name
+    print(f"한글 폰트를 찾지 못했습니다. 다음 중 하나를 설치하세요: {', '.join(KOREAN_FONTS)}")
+    return None
+
+
+# 공통 스타일 적용: 한글 폰트, 마이너스 기호, 저장 해상도
+# style: 먼저 적용할 matplotlib 스타일 (폰트 설정을 덮어쓰므로 여기서 함께 적용), rc: 스크립트별 추가 설정
+def apply_style(style=None, **rc):
+    if style:
+        plt.style.use(style)
+    font = korean_font()
+    if font:
+        plt.rcParams['font.family'] = font
+    plt.rcParams['axes.unicode_minus'] = False
+    plt.rcParams['savefig.dpi'] = SAVE_OPTIONS['dpi']
+    plt.rcParams['savefig.bbox'] = SAVE_OPTIONS['bbox_inches']
+    plt.rcParams.update(rc)
+    return font
@@ -1,31 +1,26 @@
 import pandas as pd
+import kosis_parser
 import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
 import os
 import matplotlib.ticker as ticker
+from plot_style import apply_style
 
-# 한글 폰트 설정 (예: Apple 기본 폰트 사용)
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+# 한글 폰트 설정
+apply_style()
 
 # 파일 경로
 vacant_path = '인구밀도/건축연도_및_주택의_종류별_미거주_주택_빈집___시군구_20250604144932.csv'
 age_path = '인구밀도/(완료)연도별_권역별_고령화비율_v4_정리본.csv'
 
-# 연도 컬럼명
-years = [str(y) for y in range(2015, 2024)]
-columns = ['시도', '계'] + years
-
-# 빈집수 데이터 읽기 (3번째 줄부터 데이터 시작, 컬럼명 직접 지정)
-vacant_df = pd.read_csv(vacant_path, skiprows=2, encoding='cp949', header=None, names=columns)
+# 빈집수 데이터 읽기 (KOSIS 넓은 표를 시도, 주택의 종류, 연도별 긴 형태로)
+vacant_df = kosis_parser.read_long(vacant_path, kosis_parser.VACANT_HOUSES_BY_TYPE_SPEC)
 
 # 수도권 제외
 exclude = ['서울특별시', '인천광역시', '경기도']
 vacant_df = vacant_df[~vacant_df['시도'].isin(exclude)]
 
 # 연도별 빈집수 합계 계산 (호 단위)
-df_vacant = vacant_df[years].apply(pd.to_numeric, errors='coerce').sum().astype(int)
-df_vacant.index = df_vacant.index.astype(int)
+df_vacant = vacant_df.groupby('연도')['value'].sum().astype(int)
 
 # 고령화비율 데이터 읽기
 age_df = pd.read_csv(age_path)
@@ -1,30 +1,16 @@
-import pandas as pd
+import csv_loader
+import admin_codes
 
 # 한글 폰트 설정
-import matplotlib.pyplot as plt
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+from plot_style import apply_style
+apply_style()
 
 # 데이터 로드
-police_df = pd.read_csv('경찰청_전국 경찰서 명칭 및 주소_20230627.csv', encoding='cp949')
+police_df = csv_loader.read_csv('경찰청_전국 경찰서 명칭 및 주소_20230627.csv')
 
-# 위치 데이터 정제
-location_mapping = {
-    '경기도 수원시': '경기도',
-    '경기도 의정부시': '경기도',
-    '강원특별자치도 춘천시': '강원특별자치도',
-    '충청북도 청주시': '충청북도',
-    '충청북도청주시': '충청북도',
-    '충청남도 예산군': '충청남도',
-    '전라북도 전주시': '전북특별자치도',
-    '전라남도 무안군': '전라남도',
-    '경상북도 안동시': '경상북도',
-    '경상남도 창원시': '경상남도',
-    '제주특별자치도 제주시': '제주특별자치도'
-}
-
-# 위치 데이터 변경
-police_df['위치'] = police_df['위치'].replace(location_mapping)
+# 위치 데이터 정제: 소재지('경기도 수원시', '서울특별시경찰청' 등)를 시도 행정코드로 바꾸고 현행 시도명으로 표기
+police_df['행정코드'] = admin_codes.resolve(police_df['위치'])
+police_df['위치'] = admin_codes.sido_names(police_df['행정코드']).fillna(police_df['위치'].astype('string')).to_numpy()
 
 # 위치별 경찰서 수 계산
 location_counts = police_df.groupby('위치')['경찰서명칭'].count().sort_values(ascending=False)
@@ -1,11 +1,13 @@
 import pandas as pd
+import csv_loader
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from correlation_engine import correlate, correlation_dict
+from plot_style import apply_style
 
 # 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+apply_style()
 
 # 데이터 파일 경로
 empty_houses_file = '01_빈집 데이터/연도별 빈집 수와 비율 (수도권_비수도권, 2015-2023).csv'
@@ -13,7 +15,7 @@ population_file = '시도별 인구증가율 (2015 - 2023).csv'
 
 # 데이터 로드
 empty_houses = pd.read_csv(empty_houses_file, encoding='utf-8')
-population = pd.read_csv(population_file, encoding='euc-kr', skiprows=[1])
+population = csv_loader.read_csv(population_file, skiprows=[1])
 
 # 데이터 전처리
 # 빈집 데이터 처리
@@ -50,12 +52,12 @@ merged_data = pd.merge(empty_houses, population_summary, on=['연도', '구분']
 # 상관관계 분석 그래프
 plt.figure(figsize=(15, 6))
 regions = ['수도권', '비수도권']
-correlations = {}
+results = correlate(merged_data, ['인구증가율', '빈집수(호)'], groupings=['구분'])
+correlations = correlation_dict(results, groups=regions)
 
 for i, region in enumerate(regions):
     region_data = merged_data[merged_data['구분'] == region]
-    correlation = stats.pearsonr(region_data['인구증가율'], region_data['빈집수(호)'])
-    correlations[region] = correlation
+    correlation = correlations[region]
     
     plt.subplot(1, 2, i+1)
     sns.regplot(data=region_data, x='인구증가율', y='빈집수(호)')
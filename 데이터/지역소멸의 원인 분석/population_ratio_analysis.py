@@ -1,14 +1,14 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
+import warehouse
+from plot_style import apply_style
 
-# 데이터 파일 경로
-population_file = '02_인구 분포 데이터/인구수 데이터/연도별_시군구_총인구_2013_2025.csv'
+# 한글 폰트 설정
+apply_style()
 
-# 데이터 로드
-df = pd.read_csv(population_file, encoding='utf-8')
+# 데이터 로드 (지표 저장소에서 시군구별 총인구만 읽음)
+df = warehouse.load_wide(['총인구'])
 
 # 수도권 지역 정의
 capital_regions = ['서울특별시', '인천광역시', '경기도']
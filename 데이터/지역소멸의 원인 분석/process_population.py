@@ -1,84 +1,76 @@
+import re
 import pandas as pd
+import age_structure
+import csv_loader
 import numpy as np
 
+# 연도별 인구 구조 지표 (고령화비율, 부양비, 청년비율 등)
+STRUCTURE_FILE = '연도별_인구구조_지표.csv'
+
 # 엑셀 파일 읽기 (openpyxl 엔진 사용)
 df = pd.read_excel('인구(나이).xls', engine='openpyxl')
 
-# 연령대별 컬럼 리스트 생성
-ages = [f'{i}세' for i in range(0, 100)] + ['100세 이상']
-
-# 연령대 그룹핑
-age_groups = {
-    '유아': [f'{i}세' for i in range(0, 10)],
-    '10대': [f'{i}세' for i in range(10, 20)],
-    '20대': [f'{i}세' for i in range(20, 30)],
-    '30대': [f'{i}세' for i in range(30, 40)],
-    '40대': [f'{i}세' for i in range(40, 50)],
-    '50대': [f'{i}세' for i in range(50, 60)],
-    '60대': [f'{i}세' for i in range(60, 70)],
-    '70대': [f'{i}세' for i in range(70, 80)],
-    '80세 이상': [f'{i}세' for i in range(80, 100)] + ['100세 이상']
-}
-
 # 2014~2023년 데이터만 필터링
 df = df[df['연도'].between(2014, 2023)]
 
-# 연도별로 그룹화하여 연령대별 합계 계산
-results = df[['연도']].copy()
-for group, cols in age_groups.items():
-    # 실제 존재하는 컬럼만 사용
-    valid_cols = [col for col in cols if col in df.columns]
-    results[group] = df[valid_cols].sum(axis=1)
+# 연도별 단일 연령(0세 ~ 100세 이상) 인구 배열을 한 번 만들고, 연령대·지표는 모두 같은 배열에서 계산
+index, ages, values = age_structure.age_array(df, '연도')
 
-# 결과를 연도별로 집계
-results = results.groupby('연도').sum().reset_index()
+# 10세 단위 연령대별 합계 (행렬곱 결과는 실수이므로 기존 출력처럼 정수 인구수로 저장)
+results = age_structure.bands(index, ages, values, '10세단위').round().astype('int64').reset_index()
 
 # 결과 출력 및 저장
 print(results)
 results.to_csv('연령대별_인구_분석_결과.csv', index=False, encoding='utf-8-sig')
 
-# Read the population movement data
-df = pd.read_csv('인구이동(연령월별).csv', encoding='cp949')
+# 고령화비율·부양비 등 인구 구조 지표
+structure = age_structure.indicators(index, ages, values).reset_index()
+structure.to_csv(STRUCTURE_FILE, index=False, encoding='utf-8-sig')
 
-# Extract year from the column names
-years = []
-for col in df.columns:
-    if '년' in col:
-        year = col.split('.')[0]
-        if year not in years:
-            years.append(year)
+# 인구이동 데이터의 '2014년.01월' 형태 컬럼 헤더 → (연도, 월)
+PERIOD_PATTERN = re.compile(r'^\s*(\d{4})\s*년?\s*\.?\s*(?:(\d{1,2})\s*월?)?')
 
-# Calculate out-migration rate by age group for each year
-results = []
-for year in years:
-    # Get columns for the current year
-    year_cols = [col for col in df.columns if year in col]
-    
-    # Calculate total out-migration for each age group
-    for _, row in df.iterrows():
-        age_group = row['연령']
-        if age_group == '전체':
+def parse_period_columns(columns):
+    # 헤더를 한 번만 해석해서 값 컬럼과 (연도, 월) MultiIndex 생성
+    value_cols = []
+    periods = []
+    for col in columns:
+        if '년' not in str(col):
             continue
-            
-        # Sum up out-migration for the year
-        out_migration = row[year_cols].sum()
-        
-        # Calculate rate (per 1000 people)
-        rate = (out_migration / 1000)
-        
-        results.append({
-            'Year': year,
-            'Age Group': age_group,
-            'Out-migration Rate': rate
-        })
+        match = PERIOD_PATTERN.match(str(col))
+        if not match:
+            continue
+        value_cols.append(col)
+        periods.append((f'{match.group(1)}년', int(match.group(2)) if match.group(2) else 0))
+    return value_cols, pd.MultiIndex.from_tuples(periods, names=['Year', 'Month'])
+
+def out_migration_totals(path, by='연령', encoding=None, chunksize=None):
+    # 청크 단위로 읽으면서 (by × 연도/월) 합계만 누적 → 메모리는 청크 크기로 제한
+    reader = csv_loader.read_csv(path, encoding=encoding, chunksize=chunksize)
+    if chunksize is None:
+        reader = [reader]
 
-# Convert results to DataFrame
-result_df = pd.DataFrame(results)
+    totals = None
+    value_cols = periods = None
+    for chunk in reader:
+        if value_cols is None:
+            value_cols, periods = parse_period_columns(chunk.columns)
+        values = chunk[value_cols].apply(pd.to_numeric, errors='coerce')
+        values.columns = periods
+        values.index = pd.Index(chunk[by], name='Age Group')
+        chunk_totals = values.groupby(level=0, sort=False).sum()
+        totals = chunk_totals if totals is None else totals.add(chunk_totals, fill_value=0)
 
-# Pivot the data to get years as columns
-pivot_df = result_df.pivot(index='Age Group', columns='Year', values='Out-migration Rate')
+    # 월 단위 합계를 연도 단위로 한 번에 집계
+    return totals.T.groupby(level='Year').sum().T.sort_index()
+
+# Read the population movement data
+# Calculate out-migration rate by age group for each year (rate per 1000 people)
+yearly_totals = out_migration_totals('인구이동(연령월별).csv', chunksize=100_000)
+pivot_df = yearly_totals.drop(index='전체', errors='ignore') / 1000
+pivot_df.columns.name = 'Year'
 
 # Save results to CSV
 pivot_df.to_csv('연령대별_지방이탈율.csv', encoding='utf-8-sig')
 
-print("Analysis complete. Results saved to '연령대별_지방이탈율.csv'")
\ No newline at end of file
+print("Analysis complete. Results saved to '연령대별_지방이탈율.csv'")
@@ -0,0 +1,230 @@
+import re
+import time
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+import admin_codes
+from region_names import ALIAS_TO_REGION
+
+# 서로 다른 원본의 (시도, 시군구) 표기를 연결
+# 1) 행정코드가 같으면 바로 연결 2) 남은 것끼리 같은 시도 + 이름 앞/뒤 글자가 같은 후보만 비교 (블로킹)
+# 3) 후보 쌍은 편집거리 유사도를 배열 연산으로 한 번에 계산해서 점수가 가장 높은 짝을 고름
+
+# 유사도 기준 (0~1, 이 값 이상만 연결)
+THRESHOLD = 0.8
+
+# 블로킹에 쓰는 이름 앞/뒤 글자 수
+PREFIX_LENGTH = 1
+SUFFIX_LENGTH = 2
+
+# 행정구역 단위 접미사 ('청주' ↔ '청주시'처럼 접미사만 다르면 거의 같은 이름으로 봄)
+SUFFIX_PATTERN = re.compile(r'(특별자치시|특별자치도|특별시|광역시|시|군|구|도)$')
+STEM_SCORE = 0.95
+
+# 연결 방법
+METHOD_CODE = '행정코드'
+METHOD_EXACT = '정확'
+METHOD_FUZZY = '유사'
+
+
+# 비교용 이름: 유니코드 정규화, 괄호 안 내용·공백 제거
+def normalize_names(values):
+    values = pd.Series(values, dtype='string')
+    values = values.map(lambda value: unicodedata.normalize('NFC', value), na_action='ignore').astype('string')
+    return values.str.replace(r'\([^)]*\)', '', regex=True).str.replace(r'\s+', '', regex=True)
+
+
+# 문자열 목록을 (n, 최대 길이) 유니코드 코드포인트 배열과 길이로 변환
+def _encode(values):
+    values = [value if isinstance(value, str) else '' for value in values]
+    width = max([len(value) for value in values] + [1])
+    codes = np.array(values, dtype=f'<U{width}').view(np.int32).reshape(len(values), width)
+    return codes, np.array([len(value) for value in values], dtype=np.int32)
+
+
+# 쌍마다 편집거리(Levenshtein) 기반 유사도: 1 - 거리 / 긴 쪽 길이
+# 동적 계획법 표를 (최대 길이)² 번 갱신하며 각 갱신은 모든 쌍에 대해 한 번에 계산
+def similarity(left, right):
+    a, a_len = _encode(left)
+    b, b_len = _encode(right)
+    n = len(a)
+    rows = np.arange(n)
+    prev = np.tile(np.arange(b.shape[1] + 1, dtype=np.int32), (n, 1))
+    distance = prev[rows, b_len].copy()
+    for i in range(1, a.shape[1] + 1):
+        cost = (a[:, i - 1:i] != b).astype(np.int32)
+        current = np.empty_like(prev)
+        current[:, 0] = i
+        for j in range(1, b.shape[1] + 1):
+            current[:, j] = np.minimum(np.minimum(prev[:, j], current[:, j - 1]) + 1, prev[:, j - 1] + cost[:, j - 1])
+        done = a_len == i
+        distance[done] = current[done, b_len[done]]
+        prev = current
+    longest = np.maximum(np.maximum(a_len, b_len), 1)
+    return 1 - distance / longest
+
+
+# 비교 점수: 편집거리 유사도, 접미사를 뗀 이름이 같으면(두 글자 이상) STEM_SCORE 이상
+def score(left, right):
+    left = pd.Series(left, dtype='string').reset_index(drop=True)
+    right = pd.Series(right, dtype='string').reset_index(drop=True)
+    result = similarity(left, right)
+    left_stem = left.str.replace(SUFFIX_PATTERN, '', regex=True)
+    right_stem = right.str.replace(SUFFIX_PATTERN, '', regex=True)
+    same_stem = ((left_stem == right_stem) & (left_stem.str.len() >= 2)).fillna(False).to_numpy()
+    return np.where(same_stem, np.maximum(result, STEM_SCORE), result)
+
+
+# 시군구 열에 시도 행이 섞인 계층형 표(KOSIS 등)에서 각 행의 시도를 채움
+# 시도 이름 행 다음에 오는 행은 그 시도 소속, 시도 행 자체(합계 행)와 '전국' 등은 결측
+# 하위 행이 없는 시도 행(세종특별자치시 등)은 그 자체가 한 지역이므로 자기 시도로 채움
+def infer_sido(names):
+    names = pd.Series(names).reset_index(drop=True)
+    compact = normalize_names(names)
+    regions = compact.map(ALIAS_TO_REGION).astype('string')
+    # '전국' 같은 상위 합계 행이 나오면 이전 시도를 끊음
+    header = compact.isin(['전국', '합계', '계'])
+    inferred = regions.where(regions.notna() | ~header, '').ffill().replace('', pd.NA)
+    # 같은 이름이 연달아 나오는 구간(긴 형태의 연도별 행) 바로 다음이 시군구 행이면 하위 행이 있는 시도 (합계 행)
+    runs = pd.Series(np.cumsum((compact != compact.shift()).fillna(True).to_numpy(dtype=bool)))
+    child = pd.Series((regions.isna() & ~header).to_numpy(dtype=bool)).groupby(runs).first()
+    has_children = runs.map(child.shift(-1, fill_value=False).astype(bool))
+    return inferred.mask(regions.notna() & has_children).astype('string')
+
+
+# 원본별 표기 예외(admin_codes.SIGUNGU_ALIASES)를 현행 명칭으로 바꿈 (제주특별자치도 '시' → '제주시')
+# 행정코드를 찾지 못한 경우에도 정확 일치 단계에서 연결되도록 양쪽 이름에 모두 적용
+def _apply_aliases(sido_codes, names):
+    aliases = admin_codes.SIGUNGU_ALIASES
+    canonical = normalize_names(admin_codes.sigungu_names(list(aliases.values())))
+    targets = {key: value for key, value in zip(aliases, canonical) if pd.notna(value)}
+    replaced = [targets.get((int(code), value), value) for code, value in zip(sido_codes, names)]
+    return pd.Series(replaced, index=names.index, dtype='string')
+
+
+# 원본별 고유 (시도, 시군구) 키와 행 수 (sido가 None이면 시도 없이 이름만)
+def _keys(df, sido, name):
+    frame = pd.DataFrame({
+        '시도': df[sido].astype('string') if sido else pd.Series(pd.NA, index=df.index, dtype='string'),
+        '시군구': df[name].astype('string'),
+    })
+    keys = frame.value_counts(dropna=False, sort=False).rename('행수').reset_index()
+    keys['시도코드'] = admin_codes.sido_codes(keys['시도'])
+    keys['이름'] = _apply_aliases(keys['시도코드'], normalize_names(keys['시군구']).fillna(''))
+    keys['행정코드'] = admin_codes.resolve(keys['시도'], keys['시군구'])
+    return keys
+
+
+# 블로킹: 같은 시도(모르면 전체) 안에서 이름 앞/뒤 글자가 같은 후보 쌍
+def _candidate_pairs(left, right, prefix, suffix):
+    pairs = []
+    for block in [lambda names: names.str[:prefix], lambda names: names.str[-suffix:]]:
+        lhs = pd.DataFrame({'l': left.index, '시도코드': left['시도코드'], '블록': block(left['이름'])})
+        rhs = pd.DataFrame({'r': right.index, '시도코드': right['시도코드'], '블록': block(right['이름'])})
+        pairs.append(lhs.merge(rhs, on=['시도코드', '블록'])[['l', 'r']])
+        # 한쪽 시도를 모르면 이름 블록만으로 비교
+        for known, unknown in [(lhs, rhs), (rhs, lhs)]:
+            missing = unknown[unknown['시도코드'] < 0]
+            if len(missing):
+                pairs.append(known.merge(missing.drop(columns='시도코드'), on='블록')[['l', 'r']])
+    return pd.concat(pairs, ignore_index=True).drop_duplicates(ignore_index=True)
+
+
+# 두 원본의 (시도, 시군구) 키 연결
+# 결과: (연결표, 미연결 보고서)
+#   연결표: 왼쪽_시도, 왼쪽_시군구, 오른쪽_시도, 오른쪽_시군구, 점수, 방법
+#   미연결 보고서: 원본(왼쪽/오른쪽), 시도, 시군구, 행수, 가장 가까운 후보와 점수
+def link(left, right, sido='시도', name='시군구', right_sido=None, right_name=None,
+         threshold=THRESHOLD, prefix=PREFIX_LENGTH, suffix=SUFFIX_LENGTH):
+    right_sido = sido if right_sido is None else right_sido
+    right_name = right_name or name
+    lkeys = _keys(left, sido, name)
+    rkeys = _keys(right, right_sido, right_name)
+
+    # 1) 행정코드로 연결 (같은 코드가 여러 키에 있으면 이름이 같은 쪽을 먼저 씀)
+    coded = lkeys.dropna(subset=['행정코드']).reset_index().merge(
+        rkeys.dropna(subset=['행정코드']).reset_index(), on='행정코드', suffixes=('_l', '_r')
+    )
+    coded['점수'] = np.where(coded['이름_l'] == coded['이름_r'], 1.0, score(coded['이름_l'], coded['이름_r']))
+    coded = coded.rename(columns={'index_l': 'l', 'index_r': 'r'})[['l', 'r', '점수']]
+    coded['방법'] = METHOD_CODE
+
+    # 2) 같은 시도 안에서 정규화한 이름이 같으면 연결
+    rest_l = lkeys.drop(index=coded['l'])
+    rest_r = rkeys.drop(index=coded['r'])
+    exact = rest_l[rest_l['시도코드'] >= 0].reset_index().merge(
+        rest_r[rest_r['시도코드'] >= 0].reset_index(), on=['시도코드', '이름'], suffixes=('_l', '_r')
+    ).rename(columns={'index_l': 'l', 'index_r': 'r'})[['l', 'r']]
+    exact = exact.drop_duplicates('l').drop_duplicates('r').assign(점수=1.0, 방법=METHOD_EXACT)
+
+    # 3) 남은 키는 블로킹 후 유사도로 연결
+    rest_l = rest_l.drop(index=exact['l'])
+    rest_r = rest_r.drop(index=exact['r'])
+    pairs = _candidate_pairs(rest_l, rest_r, prefix, suffix)
+    pairs['점수'] = score(rest_l.loc[pairs['l'], '이름'].to_numpy(), rest_r.loc[pairs['r'], '이름'].to_numpy())
+    pairs['방법'] = np.where(pairs['점수'] >= 1.0, METHOD_EXACT, METHOD_FUZZY)
+
+    # 점수가 높은 쌍부터 한 키는 한 번만 사용 (일대일)
+    accepted = pairs[pairs['점수'] >= threshold].sort_values('점수', ascending=False, kind='stable')
+    accepted = accepted.drop_duplicates('l').drop_duplicates('r')
+    matches = pd.concat([coded.drop_duplicates('l').drop_duplicates('r'), exact, accepted], ignore_index=True)
+
+    table = pd.DataFrame({
+        '왼쪽_시도': lkeys.loc[matches['l'], '시도'].to_numpy(),
+        '왼쪽_시군구': lkeys.loc[matches['l'], '시군구'].to_numpy(),
+        '오른쪽_시도': rkeys.loc[matches['r'], '시도'].to_numpy(),
+        '오른쪽_시군구': rkeys.loc[matches['r'], '시군구'].to_numpy(),
+        '점수': matches['점수'].to_numpy(),
+        '방법': matches['방법'].to_numpy(),
+    })
+
+    # 연결되지 않은 키마다 가장 가까운 후보 (기준 미달 이유를 보기 위함)
+    best = pairs.sort_values('점수', ascending=False, kind='stable')
+    reports = []
+    for side, keys, used, column, other_keys, other in [
+        ('왼쪽', lkeys, matches['l'], 'l', rkeys, 'r'), ('오른쪽', rkeys, matches['r'], 'r', lkeys, 'l')
+    ]:
+        lost = keys.drop(index=used.unique())
+        nearest = best.drop_duplicates(column).set_index(column).reindex(lost.index)
+        candidate = other_keys['시군구'].reindex(nearest[other])
+        reports.append(pd.DataFrame({
+            '원본': side,
+            '시도': lost['시도'].to_numpy(),
+            '시군구': lost['시군구'].to_numpy(),
+            '행수': lost['행수'].to_numpy(),
+            '후보': candidate.to_numpy(),
+            '후보점수': nearest['점수'].to_numpy(),
+        }))
+    unmatched = pd.concat(reports, ignore_index=True).sort_values(['원본', '행수'], ascending=[True, False])
+    return table, unmatched.reset_index(drop=True)
+
+
+# 연결 결과를 이용해 두 원본의 행을 병합 (on: 연도 등 함께 맞출 추가 키)
+# 병합 결과의 시도·시군구는 왼쪽 원본 표기, 미연결 보고서의 행수로 빠진 행을 확인
+def merge(left, right, sido='시도', name='시군구', right_sido=None, right_name=None, on=None, how='inner',
+          threshold=THRESHOLD, report=True):
+    right_sido = right_sido or sido
+    right_name = right_name or name
+    on = list(on or [])
+    started = time.monotonic()
+    table, unmatched = link(left, right, sido, name, right_sido, right_name, threshold)
+
+    key_map = table.set_index(['오른쪽_시도', '오른쪽_시군구'])[['왼쪽_시도', '왼쪽_시군구']]
+    keys = pd.MultiIndex.from_frame(right[[right_sido, right_name]].astype('string'))
+    mapped = key_map.reindex(keys)
+    right = right.drop(columns=[right_sido, right_name]).assign(
+        **{sido: mapped['왼쪽_시도'].to_numpy(), name: mapped['왼쪽_시군구'].to_numpy()}
+    )
+    right = right[right[name].notna()] if how in ('inner', 'left') else right
+    left = left.assign(**{sido: left[sido].astype('string'), name: left[name].astype('string')})
+    merged = pd.merge(left, right, on=[sido, name] + on, how=how)
+
+    if report:
+        lost = unmatched.groupby('원본')['행수'].sum()
+        fuzzy = (table['방법'] == METHOD_FUZZY).sum()
+        print(f"지역 연결: {len(table):,}쌍 (유사 이름 {fuzzy:,}쌍), "
+              f"미연결 왼쪽 {lost.get('왼쪽', 0):,}행 / 오른쪽 {lost.get('오른쪽', 0):,}행 "
+              f"({time.monotonic() - started:.2f}초)")
+    return merged, table, unmatched
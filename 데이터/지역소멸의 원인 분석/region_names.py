@@ -0,0 +1,178 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# 표준 시도명 (출력 순서 기준)
+STANDARD_REGIONS = [
+    '서울특별시',
+    '부산광역시',
+    '대구광역시',
+    '인천광역시',
+    '광주광역시',
+    '대전광역시',
+    '울산광역시',
+    '세종특별자치시',
+    '경기도',
+    '강원특별자치도',
+    '충청북도',
+    '충청남도',
+    '전북특별자치도',
+    '전라남도',
+    '경상북도',
+    '경상남도',
+    '제주특별자치도'
+]
+
+# 수도권 시도
+CAPITAL_REGIONS = ['서울특별시', '인천광역시', '경기도']
+
+# 표준 시도명별 별칭 (옛 명칭, 약칭, '시'/'도' 축약형 포함)
+REGION_ALIASES = {
+    '서울특별시': ['서울', '서울시', '서울특별시'],
+    '부산광역시': ['부산', '부산시', '부산광역시'],
+    '대구광역시': ['대구', '대구시', '대구광역시'],
+    '인천광역시': ['인천', '인천시', '인천광역시'],
+    '광주광역시': ['광주', '광주광역시'],
+    '대전광역시': ['대전', '대전시', '대전광역시'],
+    '울산광역시': ['울산', '울산시', '울산광역시'],
+    '세종특별자치시': ['세종', '세종시', '세종특별시', '세종특별자치시'],
+    '경기도': ['경기', '경기도'],
+    '강원특별자치도': ['강원', '강원도', '강원특별자치도'],
+    '충청북도': ['충북', '충청북도'],
+    '충청남도': ['충남', '충청남도'],
+    '전북특별자치도': ['전북', '전라북도', '전북도', '전북특별자치도'],
+    '전라남도': ['전남', '전라남도'],
+    '경상북도': ['경북', '경상북도'],
+    '경상남도': ['경남', '경상남도'],
+    '제주특별자치도': ['제주', '제주도', '제주특별자치도']
+}
+
+# 접두어로 매칭하면 다른 지역과 겹치는 별칭 (예: 경기도 광주시)
+AMBIGUOUS_PREFIXES = {'광주'}
+
+# 별칭 → 표준 시도명 조회표 (공백 제거 기준)
+ALIAS_TO_REGION = {
+    alias.replace(' ', ''): region
+    for region, aliases in REGION_ALIASES.items()
+    for alias in aliases
+}
+
+# 접두어 매칭은 긴 별칭부터 시도 ('전라북도경찰청' → '전라북도' → 전북특별자치도)
+_PREFIX_ALIASES = sorted(
+    [alias for alias in ALIAS_TO_REGION if alias not in AMBIGUOUS_PREFIXES],
+    key=len, reverse=True
+)
+
+
+# 고유값 하나를 표준 시도명으로 변환 (없으면 None)
+def _resolve_token(token):
+    if not token:
+        return None
+    region = ALIAS_TO_REGION.get(token)
+    if region is not None:
+        return region
+    for alias in _PREFIX_ALIASES:
+        if token.startswith(alias):
+            return ALIAS_TO_REGION[alias]
+    return None
+
+
+_REGION_CODES = {region: code for code, region in enumerate(STANDARD_REGIONS)}
+
+
+# 고유값 하나를 범주 코드로 변환 (매칭 실패는 -1)
+def _region_code(region):
+    return _REGION_CODES.get(region, -1) if region is not None else -1
+
+
+# 고유값 단위로 조회해서 전체 행에 펼침 (행 수와 무관하게 고유값 수만큼만 계산)
+def _lookup_unique(keys, resolve):
+    codes, uniques = pd.factorize(keys)
+    resolved = np.array([_region_code(resolve(key)) for key in uniques] + [-1], dtype=np.int16)
+    return resolved[codes]
+
+
+# 각 값의 첫 어절을 사전 인코딩된 형태(codes, uniques)로 추출
+# pyarrow가 있으면 Arrow 문자열 커널로 한 번에 처리
+def _first_token_codes(values):
+    if pa is not None:
+        try:
+            arr = pa.array(values, type=pa.string(), from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            arr = pa.array(values.astype('string'), type=pa.string(), from_pandas=True)
+        # Arrow 기반 문자열 Series는 ChunkedArray로 변환됨
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        tokens = pc.struct_field(pc.extract_regex(arr, r'^\s*(?P<token>\S+)'), [0])
+        # 정규식에 맞지 않는 값(빈 문자열, 결측)은 null
+        tokens = pc.if_else(pc.match_substring_regex(arr, r'\S'), tokens, pa.scalar(None, pa.string()))
+        encoded = tokens.dictionary_encode()
+        codes = encoded.indices.to_numpy(zero_copy_only=False)
+        codes = np.where(encoded.indices.is_null().to_numpy(zero_copy_only=False), -1, codes).astype(np.intp)
+        return codes, encoded.dictionary.to_pylist()
+    tokens = values.astype('string').str.strip().str.split(n=1).str[0]
+    codes, uniques = pd.factorize(tokens)
+    return codes, list(uniques)
+
+
+# 시도명/주소/기관명 Series를 STANDARD_REGIONS 순서의 범주형으로 변환
+# sigungu_map: {'수원시': '경기도', ...} 형태의 시군구 → 시도 보조 매핑 (선택)
+def canonicalize_regions(values, sigungu_map=None):
+    values = pd.Series(values)
+
+    # 범주형이면 범주만 변환한 뒤 코드로 펼침
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = canonicalize_regions(pd.Series(values.cat.categories), sigungu_map)
+        category_codes = np.append(categories.cat.codes.to_numpy(), -1)
+        return pd.Series(
+            pd.Categorical.from_codes(category_codes[values.cat.codes.to_numpy()], categories=STANDARD_REGIONS, ordered=True),
+            index=values.index, name=values.name
+        )
+
+    # 첫 어절(주소라면 시도 부분)만 고유값 단위로 조회
+    codes, uniques = _first_token_codes(values)
+    first_tokens = np.array(uniques + [None], dtype=object)
+    resolved = np.array([_region_code(_resolve_token(token)) for token in uniques] + [-1], dtype=np.int16)
+    region_codes = resolved[codes]
+
+    # 나머지(대개 소수)는 공백을 제거한 전체 값으로 다시 조회 (예: '충청북도청주시')
+    missing = (region_codes < 0) & values.notna().to_numpy()
+    if missing.any():
+        compact = values[missing].astype('string').str.replace(r'\s+', '', regex=True)
+        region_codes[missing] = _lookup_unique(compact, _resolve_token)
+
+    # 시군구명만 있는 경우 보조 매핑으로 시도 결정
+    missing = (region_codes < 0) & values.notna().to_numpy()
+    if sigungu_map and missing.any():
+        sigungu_lookup = {key.replace(' ', ''): value for key, value in sigungu_map.items()}
+
+        def resolve_sigungu(key):
+            sido = sigungu_lookup.get(key) if isinstance(key, str) else None
+            return _resolve_token(sido.replace(' ', '')) if isinstance(sido, str) else None
+
+        compact = values[missing].astype('string').str.replace(r'\s+', '', regex=True)
+        found = _lookup_unique(compact, resolve_sigungu)
+        # 주소 형태('수원시 팔달구')라면 첫 어절로 한 번 더 조회
+        retry = found < 0
+        if retry.any():
+            first = pd.Series(first_tokens[codes[missing]][retry])
+            found[retry] = _lookup_unique(first, resolve_sigungu)
+        region_codes[missing] = found
+
+    return pd.Series(
+        pd.Categorical.from_codes(region_codes, categories=STANDARD_REGIONS, ordered=True),
+        index=values.index, name=values.name
+    )
+
+
+# 표준 시도명으로 변환되지 않은 원본 값과 건수
+def unmatched_regions(values, canonical=None):
+    values = pd.Series(values)
+    if canonical is None:
+        canonical = canonicalize_regions(values)
+    return values[canonical.isna()].value_counts(dropna=False)
@@ -0,0 +1,243 @@
+import os
+
+import numpy as np
+import pandas as pd
+import shapely
+from scipy import sparse
+from scipy.spatial import cKDTree
+
+import admin_codes
+import csv_loader
+from boundary_store import STORE_DIR, load_boundaries
+
+# 공간 가중치 행렬 캐시 (경계 파일 해시별로 한 번만 계산)
+WEIGHTS_DIR = os.path.join('.cache', 'spatial_weights')
+
+# 인접 판정 허용 거리 (도, 약 10m): 단순화·반올림으로 경계선이 살짝 떨어져도 이웃으로 봄
+CONTIGUITY_DISTANCE = 1e-4
+
+# k-최근접 가중치의 기본 k
+K_NEIGHBORS = 6
+
+# 순열 검정 횟수와 한 번에 계산할 순열 수 (메모리 사용량 조절)
+PERMUTATIONS = 999
+PERMUTATION_BATCH = 200
+SEED = 12345
+
+# 유의수준
+ALPHA = 0.05
+
+# LISA 군집 이름 (자기 값 / 이웃 평균 기준)
+QUADRANTS = {1: 'HH', 2: 'LH', 3: 'LL', 4: 'HL'}
+NOT_SIGNIFICANT = '유의하지 않음'
+
+RESULT_FILE = '시군구별_LISA.csv'
+
+
+# 경계 대표점 좌표와 행정코드 (지표와 맞출 키)
+def _regions(level, store_dir):
+    boundaries = load_boundaries(level, tolerance=0.0, store_dir=store_dir)
+    points = shapely.point_on_surface(boundaries['geometry'].to_numpy())
+    sido = boundaries['sido'] if 'sido' in boundaries else boundaries['name']
+    sigungu = boundaries['name'] if level != 'sido' else None
+    codes = admin_codes.resolve(sido, sigungu, store_dir=store_dir)
+    return boundaries, np.column_stack([shapely.get_x(points), shapely.get_y(points)]), codes
+
+
+# 퀸 인접(경계선이나 꼭짓점을 공유) 가중치: 경계 STRtree로 가까운 쌍만 검사
+# 섬처럼 이웃이 없는 지역은 가장 가까운 지역 하나를 이웃으로 연결
+def contiguity_weights(geometries, coords, distance=CONTIGUITY_DISTANCE):
+    tree = shapely.STRtree(geometries)
+    left, right = tree.query(geometries, predicate='dwithin', distance=distance)
+    keep = left != right
+    left, right = left[keep], right[keep]
+
+    islands = np.setdiff1d(np.arange(len(geometries)), left)
+    if len(islands):
+        _, nearest = cKDTree(coords).query(coords[islands], k=2)
+        left = np.concatenate([left, islands, nearest[:, 1]])
+        right = np.concatenate([right, nearest[:, 1], islands])
+    matrix = sparse.coo_matrix((np.ones(len(left)), (left, right)), shape=(len(geometries),) * 2).tocsr()
+    matrix.data[:] = 1
+    return matrix
+
+
+# k-최근접 가중치 (대표점 기준, 위도에 따른 경도 간격 보정)
+def knn_weights(coords, k=K_NEIGHBORS):
+    scaled = coords * [np.cos(np.radians(coords[:, 1].mean())), 1]
+    _, neighbors = cKDTree(scaled).query(scaled, k=k + 1)
+    rows = np.repeat(np.arange(len(coords)), k)
+    return sparse.csr_matrix((np.ones(len(rows)), (rows, neighbors[:, 1:].ravel())), shape=(len(coords),) * 2)
+
+
+# 행 표준화 (각 행의 합이 1)
+def row_standardize(matrix):
+    sums = np.asarray(matrix.sum(axis=1)).ravel()
+    return sparse.diags(np.divide(1, sums, out=np.zeros_like(sums), where=sums > 0)) @ matrix
+
+
+# 가중치 행렬과 행정코드 (경계 파일이 바뀌지 않았으면 캐시에서 읽음)
+# kind: 'queen' 또는 'knn'
+def load_weights(level='sigungu', kind='queen', k=K_NEIGHBORS, store_dir=STORE_DIR):
+    source = os.path.join(store_dir, f'{level}@0.parquet')
+    digest = csv_loader.file_digest(source)[:16]
+    name = f'{level}-{kind}' + (f'{k}' if kind == 'knn' else '')
+    cache_file = os.path.join(WEIGHTS_DIR, f'{name}-{digest}.npz')
+    if os.path.exists(cache_file):
+        cached = np.load(cache_file)
+        matrix = sparse.csr_matrix((cached['data'], cached['indices'], cached['indptr']), shape=tuple(cached['shape']))
+        codes = pd.array(cached['codes'], dtype='Int32')
+        codes[cached['codes'] <= 0] = pd.NA
+        return matrix, codes, cached['coords']
+
+    boundaries, coords, codes = _regions(level, store_dir)
+    if kind == 'queen':
+        matrix = contiguity_weights(boundaries['geometry'].to_numpy(), coords)
+    elif kind == 'knn':
+        matrix = knn_weights(coords, k)
+    else:
+        raise ValueError(f"알 수 없는 가중치 종류: {kind}")
+
+    os.makedirs(WEIGHTS_DIR, exist_ok=True)
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp.npz'
+    np.savez(
+        tmp_file, data=matrix.data, indices=matrix.indices, indptr=matrix.indptr, shape=matrix.shape,
+        codes=np.asarray(codes.fillna(-1), dtype=np.int32), coords=coords,
+    )
+    os.replace(tmp_file, cache_file)
+    return matrix, codes, coords
+
+
+# 열(지표)별 평균을 뺀 값
+def _center(values):
+    values = np.asarray(values, dtype=float)
+    return values - values.mean(axis=0)
+
+
+# 열마다 Moran's I = (n / S0) · zᵀWz / zᵀz (여러 지표·순열을 열로 쌓아 희소 행렬 곱 한 번에 계산)
+def _moran(weights, z, s0):
+    return len(z) / s0 * (z * (weights @ z)).sum(axis=0) / (z * z).sum(axis=0)
+
+
+# 순열 검정 p-value (관측값보다 극단적인 쪽의 비율, 양측 중 작은 쪽)
+def _folded_p(larger, permutations):
+    larger = np.minimum(larger, permutations - larger)
+    return (larger + 1) / (permutations + 1)
+
+
+# 전역 Moran's I: values는 지역 × 지표 DataFrame (weights와 같은 순서)
+# 순열마다 지역 값을 섞어서 I를 다시 계산 (순열 묶음 × 지표를 한 행렬로 계산)
+def global_moran(values, weights, permutations=PERMUTATIONS, seed=SEED, batch=PERMUTATION_BATCH):
+    weights = row_standardize(weights)
+    z = _center(values)
+    n, m = z.shape
+    s0 = weights.sum()
+    observed = _moran(weights, z, s0)
+
+    rng = np.random.default_rng(seed)
+    simulated = np.empty((permutations, m))
+    for start in range(0, permutations, batch):
+        size = min(batch, permutations - start)
+        order = rng.permuted(np.tile(np.arange(n), (size, 1)), axis=1)
+        shuffled = z[order].transpose(1, 0, 2).reshape(n, size * m)
+        simulated[start:start + size] = _moran(weights, shuffled, s0).reshape(size, m)
+
+    larger = (simulated >= observed).sum(axis=0)
+    return pd.DataFrame({
+        'I': observed,
+        'E[I]': -1 / (n - 1),
+        'z': (observed - simulated.mean(axis=0)) / simulated.std(axis=0),
+        'p-value': _folded_p(larger, permutations),
+        'n': n,
+    }, index=pd.Index(values.columns, name='지표'))
+
+
+# 국지 Moran's I (LISA): 지역별 Ii = zi · (Wz)i / (Σz² / n)
+# 조건부 순열: 지역 i의 값은 고정하고 나머지 n-1개 값에서 이웃 수만큼 뽑아 공간 시차를 다시 계산
+# 순열마다 뽑은 위치를 모든 지역이 함께 쓰고(i 자신은 건너뜀) 지역 × 순열 × 지표를 한 번에 계산
+def local_moran(values, weights, permutations=PERMUTATIONS, seed=SEED, alpha=ALPHA, memory=5_000_000):
+    weights = row_standardize(weights).tocsr()
+    z = _center(values)
+    n, m = z.shape
+    scale = (z * z).sum(axis=0) / n
+    lag = weights @ z
+    local = z * lag / scale
+
+    # 이웃 가중치를 (지역, 최대 이웃 수) 배열로 정리
+    counts = np.diff(weights.indptr)
+    width = max(int(counts.max()), 1)
+    padded = np.zeros((n, width))
+    slots = np.arange(len(weights.data)) - np.repeat(weights.indptr[:-1], counts)
+    padded[np.repeat(np.arange(n), counts), slots] = weights.data
+
+    rng = np.random.default_rng(seed)
+    batch = max(1, min(permutations, memory // (n * width * m)))
+    larger = np.zeros((n, m), dtype=np.int64)
+    for start in range(0, permutations, batch):
+        size = min(batch, permutations - start)
+        draws = rng.permuted(np.tile(np.arange(n - 1), (size, 1)), axis=1)[:, :width]
+        picked = draws[None, :, :] + (draws[None, :, :] >= np.arange(n)[:, None, None])
+        simulated_lag = np.einsum('ik,ibkm->ibm', padded, z[picked])
+        simulated = z[:, None, :] * simulated_lag / scale
+        larger += (simulated >= local[:, None, :]).sum(axis=1)
+
+    p = _folded_p(larger, permutations)
+    quadrant = np.select(
+        [(z > 0) & (lag > 0), (z < 0) & (lag > 0), (z < 0) & (lag < 0), (z > 0) & (lag < 0)], [1, 2, 3, 4], 0
+    )
+    labels = np.array([NOT_SIGNIFICANT] + list(QUADRANTS.values()), dtype=object)
+    return pd.DataFrame({
+        '지표': np.tile(np.asarray(values.columns, dtype=object), n),
+        'position': np.repeat(np.arange(n), m),
+        'Ii': local.ravel(),
+        'p-value': p.ravel(),
+        '사분면': labels[quadrant.ravel()],
+        '군집': np.where(p.ravel() < alpha, labels[quadrant.ravel()], NOT_SIGNIFICANT),
+    })
+
+
+# 지표 저장소의 한 연도 값을 경계 순서에 맞춰 전역·국지 Moran's I 계산
+# 모든 지표 값이 있는 지역만 사용하고 가중치는 그 지역들로 다시 표준화
+def analyze(indicators, year, level='sigungu', kind='queen', k=K_NEIGHBORS, permutations=PERMUTATIONS,
+            store_dir=STORE_DIR):
+    import warehouse
+
+    weights, codes, _ = load_weights(level, kind, k, store_dir)
+    wide = warehouse.load_wide(indicators, years=[year], index=('region_code', '연도'))
+    wide = wide.dropna(subset=['region_code']).drop_duplicates('region_code').set_index('region_code')
+    values = wide.reindex(pd.Index(codes)).reindex(columns=list(indicators))
+    complete = (values.notna().all(axis=1) & pd.Series(codes).notna().to_numpy()).to_numpy()
+    if (~complete).any():
+        print(f"값이 없는 지역 {(~complete).sum()}곳 제외 ({complete.sum()}곳 사용)")
+    weights = weights[complete][:, complete]
+    values = values[complete].reset_index(drop=True)
+    codes = codes[complete]
+
+    global_result = global_moran(values, weights, permutations)
+    local_result = local_moran(values, weights, permutations)
+    region_codes = codes[local_result['position'].to_numpy()]
+    local_result.insert(0, '행정코드', region_codes)
+    local_result.insert(1, '시도', admin_codes.sido_names(region_codes).to_numpy())
+    local_result.insert(2, '시군구', admin_codes.sigungu_names(region_codes, store_dir).to_numpy())
+    return global_result, local_result.drop(columns='position')
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='시군구 지표의 공간 자기상관 (전역·국지 Moran\'s I)')
+    parser.add_argument('indicators', nargs='*', default=['빈집비율'], help='지표 저장소의 지표 이름')
+    parser.add_argument('--year', type=int, default=2023)
+    parser.add_argument('--weights', choices=['queen', 'knn'], default='queen')
+    parser.add_argument('--k', type=int, default=K_NEIGHBORS)
+    parser.add_argument('--permutations', type=int, default=PERMUTATIONS)
+    args = parser.parse_args()
+
+    global_result, local_result = analyze(args.indicators, args.year, kind=args.weights, k=args.k,
+                                          permutations=args.permutations)
+    print(f"\n=== {args.year}년 전역 Moran's I ({args.weights}) ===")
+    print(global_result.round(4).to_string())
+    print("\n=== 지표별 LISA 군집 수 ===")
+    print(local_result.groupby(['지표', '군집']).size().unstack(fill_value=0).to_string())
+    local_result.to_csv(RESULT_FILE, index=False, encoding='utf-8-sig')
+    print(f"\n국지 Moran's I 저장: {RESULT_FILE}")
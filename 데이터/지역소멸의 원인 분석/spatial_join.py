@@ -0,0 +1,85 @@
+import functools
+
+import numpy as np
+import pandas as pd
+import shapely
+
+from boundary_store import STORE_DIR, load_boundaries
+
+# 경계 단계별 결과 컬럼 (경계 저장소 컬럼 → 결과 컬럼)
+LEVEL_COLUMNS = {
+    'sido': {'name': '시도'},
+    'sigungu': {'sido': '시도', 'name': '시군구'},
+    'emd': {'sido': '시도', 'sigungu': '시군구', 'name': '읍면동'},
+}
+
+
+# 경계는 (단계, 허용오차)별로 한 번만 읽고 prepare해 둠 (포함 검사가 빨라짐)
+# 경계 STRtree는 가까운 경계를 찾을 때만 사용
+@functools.lru_cache(maxsize=None)
+def _boundary_index(level, tolerance, store_dir):
+    boundaries = load_boundaries(level, tolerance, store_dir=store_dir)
+    geometries = boundaries['geometry'].to_numpy()
+    shapely.prepare(geometries)
+    return boundaries, shapely.STRtree(geometries)
+
+
+# 점(경도, 위도)마다 포함하는 경계의 위치 (없으면 -1)
+# 점들로 STRtree를 만들고 prepare된 경계마다 bbox 안의 점만 검사 (점 수 × 경계 수 비교 없음)
+# 경계선 위의 점처럼 여러 경계에 걸리면 앞쪽 경계 하나만 사용
+# nearest_within: 어느 경계에도 들지 않은 점(해안선 단순화로 바다에 놓인 점 등)을 이 거리(도) 안의 가까운 경계에 배정
+def locate(lon, lat, level='sigungu', tolerance=0.0, nearest_within=None, store_dir=STORE_DIR):
+    lon = np.asarray(lon, dtype=float)
+    lat = np.asarray(lat, dtype=float)
+    boundaries, boundary_tree = _boundary_index(level, tolerance, store_dir)
+
+    positions = np.full(len(lon), -1, dtype=np.int64)
+    valid = np.flatnonzero(np.isfinite(lon) & np.isfinite(lat))
+    points = shapely.points(lon[valid], lat[valid])
+    boundary_idx, point_idx = shapely.STRtree(points).query(boundaries['geometry'].to_numpy(), predicate='intersects')
+    order = np.lexsort((boundary_idx, point_idx))
+    point_idx, boundary_idx = point_idx[order], boundary_idx[order]
+    first, keep = np.unique(point_idx, return_index=True)
+    positions[valid[first]] = boundary_idx[keep]
+
+    if nearest_within is not None:
+        missing = np.flatnonzero(positions[valid] < 0)
+        if len(missing):
+            point_idx, boundary_idx = boundary_tree.query_nearest(
+                points[missing], max_distance=nearest_within, all_matches=False
+            )
+            positions[valid[missing[point_idx]]] = boundary_idx
+    return positions
+
+
+# 점 집합을 시도/시군구/읍면동 경계에 배정 (입력 순서대로, 배정되지 않은 점은 결측, 이름은 범주형)
+# points: 경도·위도 컬럼을 가진 DataFrame, 결과 컬럼: 행정코드 + 단계별 이름
+def spatial_join(points, level='sigungu', lon='경도', lat='위도', tolerance=0.0, nearest_within=None,
+                 store_dir=STORE_DIR):
+    boundaries, _ = _boundary_index(level, tolerance, store_dir)
+    positions = locate(points[lon], points[lat], level, tolerance, nearest_within, store_dir)
+    found = positions >= 0
+
+    columns = {'code': '행정코드', **LEVEL_COLUMNS[level]}
+    result = pd.DataFrame(index=points.index)
+    for source, target in columns.items():
+        if source not in boundaries:
+            continue
+        # 경계별 이름을 범주형 코드로 옮겨서 점마다 문자열을 만들지 않음
+        categories = pd.Categorical(boundaries[source])
+        codes = np.where(found, categories.codes[np.where(found, positions, 0)], -1)
+        result[target] = pd.Categorical.from_codes(codes, categories.categories)
+    return result
+
+
+# 경계별 점 개수 (점이 없는 경계도 0으로 포함), 시설 수를 세는 스크립트에서 공통으로 사용
+def count_points(points, level='sigungu', lon='경도', lat='위도', tolerance=0.0, nearest_within=None,
+                 store_dir=STORE_DIR, name='개수'):
+    boundaries, _ = _boundary_index(level, tolerance, store_dir)
+    positions = locate(points[lon], points[lat], level, tolerance, nearest_within, store_dir)
+    counts = np.bincount(positions[positions >= 0], minlength=len(boundaries))
+
+    columns = {'code': '행정코드', **LEVEL_COLUMNS[level]}
+    result = boundaries[[source for source in columns if source in boundaries]].rename(columns=columns)
+    result[name] = counts
+    return result.reset_index(drop=True)
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+import panel_regression
+
+
+# 균형 패널 + 한 번만 관측된 지역 (가장 큰 지역 코드가 제외 대상)
+def _panel_with_singleton(n_regions=30, n_years=5, seed=0):
+    rng = np.random.default_rng(seed)
+    regions, years = np.meshgrid(np.arange(n_regions), np.arange(2015, 2015 + n_years), indexing='ij')
+    panel = pd.DataFrame({'region_code': regions.ravel(), '연도': years.ravel()})
+    panel = pd.concat([panel, pd.DataFrame({'region_code': [n_regions], '연도': [2015]})], ignore_index=True)
+    panel['x'] = rng.normal(size=len(panel))
+    effects = rng.normal(size=n_regions + 1)[panel['region_code']] + (panel['연도'] - 2015) * 0.1
+    panel['y'] = 2.0 * panel['x'] + effects + rng.normal(scale=0.01, size=len(panel))
+    return panel
+
+
+def test_drop_singletons_highest_code():
+    entity = np.array([0, 0, 1, 1, 2])
+    time = np.array([0, 1, 0, 1, 0])
+    assert panel_regression._drop_singletons(entity, time).tolist() == [True, True, True, True, False]
+
+
+def test_drop_singletons_highest_time_code():
+    entity = np.array([0, 0, 1, 1, 0])
+    time = np.array([0, 1, 0, 1, 2])
+    assert panel_regression._drop_singletons(entity, time).tolist() == [True, True, True, True, False]
+
+
+def test_fit_with_singleton_region():
+    table, summary = panel_regression.fit(_panel_with_singleton(), 'y', ['x'])
+    assert summary['제외된 관측치'] == 1
+    assert summary['지역수'] == 30
+    assert abs(table.loc['x', '계수'] - 2.0) < 0.01
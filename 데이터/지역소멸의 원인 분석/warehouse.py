@@ -0,0 +1,278 @@
+import json
+import os
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+import admin_codes
+import csv_loader
+import kosis_parser
+import record_linkage
+from region_names import canonicalize_regions
+
+# 지표 저장소 위치 (indicator=.../연도=.../<source>-0.parquet 형태의 Hive 파티션)
+WAREHOUSE_DIR = os.path.join('.cache', 'warehouse')
+MANIFEST_FILE = os.path.join(WAREHOUSE_DIR, '_manifest.json')
+
+KEY_COLUMNS = ['시도', '시군구', '연도', '월']
+
+# 정리 방식이 바뀌면 올려서 원본 해시가 같아도 다시 적재
+# (2: region_code 채움, 3: 빈집 시군구의 시도 채움, 4: 행정표준코드 표로 시군구 region_code 채움)
+NORMALIZE_VERSION = 4
+
+# 파일에 저장되는 컬럼 (indicator, 연도는 파티션 경로에 저장)
+NAME_TYPE = pa.dictionary(pa.int32(), pa.string())
+FILE_SCHEMA = pa.schema([
+    ('region_code', pa.int32()),
+    ('시도', NAME_TYPE),
+    ('시군구', NAME_TYPE),
+    ('월', pa.int8()),
+    ('value', pa.float64()),
+])
+PARTITION_SCHEMA = pa.schema([
+    ('indicator', pa.string()),
+    ('연도', pa.int16()),
+])
+
+# 'GRDP_2015_명목' 처럼 연도가 들어간 넓은 형태 컬럼
+YEAR_COLUMN_PATTERN = re.compile(r'^(\d{4})_(.+)$')
+
+
+# 시도/시군구/연도/월 외의 숫자 컬럼을 지표로 보고 긴 형태로 변환
+# 같은 키에 여러 행이 있으면(범죄 유형별 행 등) 합계
+def _melt_table(df, rename=None, year=None):
+    df = df.rename(columns=rename or {})
+    if year is not None:
+        df['연도'] = year
+    keys = [col for col in KEY_COLUMNS if col in df.columns]
+    numeric = df.drop(columns=keys).apply(pd.to_numeric, errors='coerce')
+    numeric = numeric.loc[:, numeric.notna().any()]
+
+    long = pd.concat([df[keys], numeric], axis=1).melt(id_vars=keys, var_name='indicator', value_name='value')
+    return long.groupby(keys + ['indicator'], dropna=False, sort=False)['value'].sum(min_count=1).reset_index()
+
+
+# '{연도}_{항목}' 형태의 연도별 컬럼을 (연도, 지표) 긴 형태로 변환
+def _melt_year_columns(df, id_column, id_name, indicator_prefix=''):
+    year_columns = [col for col in df.columns if YEAR_COLUMN_PATTERN.match(str(col))]
+    long = df[[id_column] + year_columns].melt(id_vars=id_column, var_name='컬럼', value_name='value')
+    parts = long['컬럼'].str.extract(YEAR_COLUMN_PATTERN)
+    return pd.DataFrame({
+        id_name: long[id_column],
+        '연도': parts[0].astype(int),
+        'indicator': indicator_prefix + parts[1],
+        'value': pd.to_numeric(long['value'], errors='coerce'),
+    })
+
+
+# 시군구 열에 시도 행이 섞인 계층형 표: 소속 시도를 채움 (시도 행은 시도 이름 그대로)
+def _read_vacancy_sigungu(path):
+    long = kosis_parser.read_long(path, kosis_parser.VACANCY_RATE_SPEC)
+    names = long['시군구'].astype('string')
+    long['시도'] = record_linkage.infer_sido(names).fillna(names).to_numpy()
+    return long.rename(columns={'metric': 'indicator'})
+
+
+def _read_population_sigungu(path):
+    return _melt_table(csv_loader.read_csv(path))
+
+
+def _read_medical_density(path, year):
+    return _melt_table(csv_loader.read_csv(path), rename={'시도코드명': '시도'}, year=year)
+
+
+def _read_crime(path, year):
+    return _melt_table(csv_loader.read_csv(path), year=year)
+
+
+def _read_grdp(path):
+    df = csv_loader.read_csv(path)
+    df = df[df['경제활동별'] == '지역내총생산(시장가격)']
+    return _melt_year_columns(df, '시도별', '시도', indicator_prefix='지역내총생산_')
+
+
+# 적재 대상 원본 목록: 원본 id → (경로, 읽기 함수)
+SOURCES = {
+    'vacancy_sigungu': ('01_빈집 데이터/빈집비율_시_군_구.csv', _read_vacancy_sigungu),
+    'population_sigungu': (
+        '02_인구 분포 데이터/인구수 데이터/연도별_시군구_총인구_2013_2025.csv', _read_population_sigungu
+    ),
+    'migration_sigungu': (
+        '04_인구 이동 데이터 (전입, 전출 및 종사자 수)/인구이동자수 데이터/연도별_시군구_전입률_전출률_2013_2024 - 완료.csv',
+        _read_population_sigungu
+    ),
+    'medical_density_2022': (
+        '03_일자리, 인프라 데이터/의료기관 현황/상급병원 포함/면적_대비_의료기관수_2022.csv',
+        lambda path: _read_medical_density(path, 2022)
+    ),
+    'medical_density_2023': (
+        '03_일자리, 인프라 데이터/의료기관 현황/상급병원 포함/면적_대비_의료기관수_2023.csv',
+        lambda path: _read_medical_density(path, 2023)
+    ),
+    'crime_2023': ('06_5대 범죄 데이터/(완료)2023년 5대 주요범죄통계.csv', lambda path: _read_crime(path, 2023)),
+    'grdp_sido': ('03_일자리, 인프라 데이터/시도별_지역내총생산_2015_2023.csv', _read_grdp),
+}
+
+
+# 공통 스키마로 정리: 시도는 표준 시도명(매칭되지 않는 '전국' 등은 원래 값 유지)
+# region_code는 연도별 명칭 변경을 반영한 현행 행정코드 (지표끼리 병합할 때 키로 사용)
+def _normalize(long):
+    long = long.dropna(subset=['value'])
+    result = pd.DataFrame(index=long.index)
+    result['region_code'] = admin_codes.resolve(
+        long['시도'] if '시도' in long else None,
+        long['시군구'] if '시군구' in long else None,
+        long['연도'].to_numpy(),
+    )
+    if '시도' in long:
+        sido = long['시도'].astype('string').str.strip()
+        result['시도'] = canonicalize_regions(sido).astype('string').fillna(sido)
+    else:
+        result['시도'] = pd.array([pd.NA] * len(long), dtype='string')
+    result['시군구'] = long['시군구'].astype('string').str.strip() if '시군구' in long else pd.NA
+    result['월'] = pd.to_numeric(long['월'], errors='coerce').astype('Int8') if '월' in long else pd.NA
+    result['value'] = long['value'].astype('float64')
+    # 경로에 쓸 수 없는 문자는 바꿈
+    result['indicator'] = long['indicator'].astype(str).str.strip().str.replace(r'[/\\]', '_', regex=True)
+    result['연도'] = long['연도'].astype('int16')
+    return result.reset_index(drop=True)
+
+
+def _load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(WAREHOUSE_DIR, exist_ok=True)
+    tmp_file = f'{MANIFEST_FILE}.{os.getpid()}.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_file, MANIFEST_FILE)
+
+
+def _remove_files(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+        # 비어 있는 파티션 폴더 정리
+        directory = os.path.dirname(path)
+        while directory != WAREHOUSE_DIR and os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+
+
+def _write_source(source_id, long):
+    table = pa.Table.from_pandas(long, preserve_index=False)
+    table = table.cast(pa.schema(list(FILE_SCHEMA) + list(PARTITION_SCHEMA)))
+    written = []
+    ds.write_dataset(
+        table, WAREHOUSE_DIR, format='parquet',
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'),
+        basename_template=f'{source_id}-{{i}}.parquet',
+        existing_data_behavior='overwrite_or_ignore',
+        file_visitor=lambda written_file: written.append(written_file.path),
+    )
+    return written
+
+
+# 적재된 원본이 지금 원본·정리 방식·행정표준코드 표와 같은지
+def _is_current(entry, digest, codes_digest):
+    return (entry is not None and entry['digest'] == digest and entry.get('version') == NORMALIZE_VERSION
+            and entry.get('codes') == codes_digest)
+
+
+# 다시 적재해야 하는 원본이 있는지 (목록 파일이 없거나 원본 해시·NORMALIZE_VERSION·코드 표가 다름)
+# 해시는 csv_loader의 (크기, 수정 시각) 캐시를 쓰므로 바뀌지 않은 원본은 다시 읽지 않음
+def is_stale(sources=None):
+    sources = SOURCES if sources is None else sources
+    if not os.path.exists(MANIFEST_FILE):
+        return True
+    manifest = _load_manifest()
+    codes_digest = csv_loader.file_digest(admin_codes.SIGUNGU_CODE_FILE)
+    return any(
+        not _is_current(manifest.get(source_id), csv_loader.file_digest(path), codes_digest)
+        for source_id, (path, _) in sources.items() if os.path.exists(path)
+    )
+
+
+# 원본 내용 해시가 바뀐 원본만 다시 적재 (force=True면 전부)
+# 행정표준코드 표가 바뀌어도 region_code가 달라지므로 다시 적재
+def ingest(sources=None, force=False):
+    sources = SOURCES if sources is None else sources
+    manifest = _load_manifest()
+    codes_digest = csv_loader.file_digest(admin_codes.SIGUNGU_CODE_FILE)
+    changed = []
+    for source_id, (path, reader) in sources.items():
+        if not os.path.exists(path):
+            print(f"원본 없음, 건너뜀: {path}")
+            continue
+        digest = csv_loader.file_digest(path)
+        entry = manifest.get(source_id)
+        if _is_current(entry, digest, codes_digest) and not force:
+            continue
+
+        long = _normalize(reader(path))
+        if entry:
+            _remove_files(entry['files'])
+        files = _write_source(source_id, long)
+        manifest[source_id] = {
+            'path': path, 'digest': digest, 'version': NORMALIZE_VERSION, 'codes': codes_digest,
+            'rows': len(long), 'files': files,
+        }
+        _save_manifest(manifest)
+        changed.append(source_id)
+        print(f"적재 완료: {source_id} ({len(long):,}행)")
+    return changed
+
+
+# 필요한 지표·연도 파티션과 컬럼만 읽음
+# indicators/years가 None이면 전체, columns는 KEY_COLUMNS + indicator/value/region_code 중 선택
+# refresh=None이면 저장소가 없거나 원본이 바뀐 경우에만 적재 (pipeline에서는 warehouse 단계가 먼저 적재하므로 읽기만 함)
+# refresh=True면 항상 ingest 확인, False면 적재하지 않음
+def load(indicators=None, years=None, columns=None, refresh=None):
+    if refresh or (refresh is None and is_stale()):
+        ingest()
+    if not os.path.isdir(WAREHOUSE_DIR):
+        raise FileNotFoundError(f"'{WAREHOUSE_DIR}'에 적재된 데이터가 없습니다. 원본 파일 경로를 확인하세요.")
+
+    dataset = ds.dataset(WAREHOUSE_DIR, format='parquet', partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'))
+    condition = None
+    if indicators is not None:
+        condition = ds.field('indicator').isin(list(indicators))
+    if years is not None:
+        year_condition = ds.field('연도').isin([int(year) for year in years])
+        condition = year_condition if condition is None else condition & year_condition
+
+    table = dataset.to_table(columns=columns, filter=condition)
+    df = table.to_pandas()
+    for col, dtype in [('region_code', 'Int32'), ('월', 'Int8')]:
+        if col in df:
+            df[col] = df[col].astype(dtype)
+    for col in ['시도', '시군구', 'indicator']:
+        if col in df and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+# 지표별 컬럼을 가진 넓은 형태로 읽기 (예: 연도 × 시도 × 총인구)
+# index에 region_code를 넣으면 명칭이 바뀐 연도도 같은 행으로 모임
+def load_wide(indicators, years=None, index=('시도', '시군구', '연도')):
+    index = list(index)
+    df = load(indicators, years, columns=index + ['indicator', 'value'])
+    wide = df.groupby(index + ['indicator'], dropna=False, observed=True)['value'].sum().unstack('indicator')
+    wide.columns = wide.columns.astype(str)
+    wide.columns.name = None
+    return wide.reset_index()
+
+
+if __name__ == '__main__':
+    import sys
+
+    # 예: python warehouse.py --force
+    ingest(force='--force' in sys.argv[1:])